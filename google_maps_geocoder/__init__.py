@@ -9,70 +9,34 @@
 # (at your option) any later version.
 # ---------------------------------------------------------------------
 
+import threading
 from functools import partial
 
-from qgis.PyQt import uic
 from qgis.PyQt.QtCore import (
     QCoreApplication,
     QThread
 )
-from qgis.PyQt.QtWidgets import (
-    QPushButton
-)
+from qgis.PyQt.QtWidgets import QPushButton
 
 from qgis.core import (
-    QgsGoogleMapsGeocoder,
     QgsSettings,
     Qgis,
     QgsApplication
 )
-from qgis.gui import (
-    QgsOptionsPageWidget,
-    QgsGeocoderLocatorFilter,
-    QgsOptionsWidgetFactory
-)
+from qgis.gui import QgsOptionsWidgetFactory
 
+from google_maps_geocoder.core.config import GoogleMapsConfig
 from google_maps_geocoder.gui_utils import GuiUtils
-from google_maps_geocoder.processing.provider import GoogleMapsProvider
+
+# pylint: disable=import-outside-toplevel
+# the options page, locator filter, processing provider, geocoder and its
+# cache, gazetteer, history and rate limiter are only imported where they are
+# first used, so that they don't slow down QGIS startup
 
 def classFactory(iface):
     return GoogleMapsGeocoderPlugin(iface)
 
 
-OPTIONS_WIDGET, OPTIONS_BASE = uic.loadUiType(
-    GuiUtils.get_ui_path('settings.ui'))
-
-
-class GoogleMapsOptionsPage(OPTIONS_WIDGET, QgsOptionsPageWidget):
-    """
-    Google Maps options widget
-    """
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setupUi(self)
-        self.setObjectName('GoogleMapsOptions')
-
-        self.plugin = None
-
-    def set_plugin(self, plugin):
-        self.plugin = plugin
-        self.api_key_line_edit.setText(plugin.api_key)
-
-        self.region_combo.addItem('', '')
-        for code, name in plugin.region_codes.items():
-            self.region_combo.addItem(name, code)
-
-        self.region_combo.setCurrentIndex(self.region_combo.findData(plugin.region))
-
-    def apply(self):
-        """
-        Applies the new settings
-        """
-        self.plugin.set_api_key(self.api_key_line_edit.text())
-        self.plugin.set_region(self.region_combo.currentData())
-
-
 class GoogleMapsOptionsFactory(QgsOptionsWidgetFactory):
     """
     Factory class for Google Maps options widget
@@ -86,6 +50,7 @@ class GoogleMapsOptionsFactory(QgsOptionsWidgetFactory):
         return GuiUtils.get_icon('icon.svg')
 
     def createWidget(self, parent):  # pylint: disable=missing-function-docstring
+        from google_maps_geocoder.gui.options_page import GoogleMapsOptionsPage
         page = GoogleMapsOptionsPage(parent)
         page.set_plugin(self.plugin)
         return page
@@ -94,270 +59,21 @@ class GoogleMapsOptionsFactory(QgsOptionsWidgetFactory):
 class GoogleMapsGeocoderPlugin:
     def __init__(self, iface):
         self.iface = iface
+        # startup is traced from plugin construction until the GUI is initialized
+        from google_maps_geocoder.core.profiler import Profiler
+        self.trace = Profiler.session('startup')
 
-        settings = QgsSettings()
         self.geocoder = None
         self.filter = None
-        self.api_key = settings.value('/plugins/google_maps/api_key', '', str)
-        self.region = settings.value('/plugins/google_maps/region', '', str)
+        self.config = GoogleMapsConfig.instance()
 
         self.options_factory = None
 
-        self.region_codes = {
-            "ac": self.tr("Ascension Island"),
-            "ad": self.tr("Andorra"),
-            "ae": self.tr("United Arab Emirates"),
-            "af": self.tr("Afghanistan"),
-            "ag": self.tr("Antigua and Barbuda"),
-            "ai": self.tr("Anguilla"),
-            "al": self.tr("Albania"),
-            "am": self.tr("Armenia"),
-            "an": self.tr("Netherlands Antilles"),
-            "ao": self.tr("Angola"),
-            "aq": self.tr("Antarctica"),
-            "ar": self.tr("Argentina"),
-            "as": self.tr("American Samoa"),
-            "at": self.tr("Austria"),
-            "au": self.tr("Australia"),
-            "aw": self.tr("Aruba"),
-            "ax": self.tr("Aland Islands"),
-            "az": self.tr("Azerbaijan"),
-            "ba": self.tr("Bosnia and Herzegovina"),
-            "bb": self.tr("Barbados"),
-            "bd": self.tr("Bangladesh"),
-            "be": self.tr("Belgium"),
-            "bf": self.tr("Burkina Faso"),
-            "bg": self.tr("Bulgaria"),
-            "bh": self.tr("Bahrain"),
-            "bi": self.tr("Burundi"),
-            "bj": self.tr("Benin"),
-            "bm": self.tr("Bermuda"),
-            "bn": self.tr("Brunei Darussalam"),
-            "bo": self.tr("Bolivia"),
-            "br": self.tr("Brazil"),
-            "bs": self.tr("Bahamas"),
-            "bt": self.tr("Bhutan"),
-            "bv": self.tr("Bouvet Island"),
-            "bw": self.tr("Botswana"),
-            "by": self.tr("Belarus"),
-            "bz": self.tr("Belize"),
-            "ca": self.tr("Canada"),
-            "cc": self.tr("Cocos (Keeling) Islands"),
-            "cd": self.tr("Congo, The Democratic Republic of the"),
-            "cf": self.tr("Central African Republic"),
-            "cg": self.tr("Congo, Republic of"),
-            "ch": self.tr("Switzerland"),
-            "ci": self.tr("Cote d'Ivoire"),
-            "ck": self.tr("Cook Islands"),
-            "cl": self.tr("Chile"),
-            "cm": self.tr("Cameroon"),
-            "cn": self.tr("China"),
-            "co": self.tr("Colombia"),
-            "cr": self.tr("Costa Rica"),
-            "cu": self.tr("Cuba"),
-            "cv": self.tr("Cape Verde"),
-            "cx": self.tr("Christmas Island"),
-            "cy": self.tr("Cyprus"),
-            "cz": self.tr("Czech Republic"),
-            "de": self.tr("Germany"),
-            "dj": self.tr("Djibouti"),
-            "dk": self.tr("Denmark"),
-            "dm": self.tr("Dominica"),
-            "do": self.tr("Dominican Republic"),
-            "dz": self.tr("Algeria"),
-            "ec": self.tr("Ecuador"),
-            "ee": self.tr("Estonia"),
-            "eg": self.tr("Egypt"),
-            "eh": self.tr("Western Sahara"),
-            "er": self.tr("Eritrea"),
-            "es": self.tr("Spain"),
-            "et": self.tr("Ethiopia"),
-            "eu": self.tr("European Union"),
-            "fi": self.tr("Finland"),
-            "fj": self.tr("Fiji"),
-            "fk": self.tr("Falkland Islands (Malvinas)"),
-            "fm": self.tr("Micronesia, Federated States of"),
-            "fo": self.tr("Faroe Islands"),
-            "fr": self.tr("France"),
-            "ga": self.tr("Gabon"),
-            "gb": self.tr("United Kingdom"),
-            "gd": self.tr("Grenada"),
-            "ge": self.tr("Georgia"),
-            "gf": self.tr("French Guiana"),
-            "gg": self.tr("Guernsey"),
-            "gh": self.tr("Ghana"),
-            "gi": self.tr("Gibraltar"),
-            "gl": self.tr("Greenland"),
-            "gm": self.tr("Gambia"),
-            "gn": self.tr("Guinea"),
-            "gp": self.tr("Guadeloupe"),
-            "gq": self.tr("Equatorial Guinea"),
-            "gr": self.tr("Greece"),
-            "gs": self.tr("South Georgia and the South Sandwich Islands"),
-            "gt": self.tr("Guatemala"),
-            "gu": self.tr("Guam"),
-            "gw": self.tr("Guinea-Bissau"),
-            "gy": self.tr("Guyana"),
-            "hk": self.tr("Hong Kong"),
-            "hm": self.tr("Heard and McDonald Islands"),
-            "hn": self.tr("Honduras"),
-            "hr": self.tr("Croatia/Hrvatska"),
-            "ht": self.tr("Haiti"),
-            "hu": self.tr("Hungary"),
-            "id": self.tr("Indonesia"),
-            "ie": self.tr("Ireland"),
-            "il": self.tr("Israel"),
-            "im": self.tr("Isle of Man"),
-            "in": self.tr("India"),
-            "io": self.tr("British Indian Ocean Territory"),
-            "iq": self.tr("Iraq"),
-            "ir": self.tr("Iran, Islamic Republic of"),
-            "is": self.tr("Iceland"),
-            "it": self.tr("Italy"),
-            "je": self.tr("Jersey"),
-            "jm": self.tr("Jamaica"),
-            "jo": self.tr("Jordan"),
-            "jp": self.tr("Japan"),
-            "ke": self.tr("Kenya"),
-            "kg": self.tr("Kyrgyzstan"),
-            "kh": self.tr("Cambodia"),
-            "ki": self.tr("Kiribati"),
-            "km": self.tr("Comoros"),
-            "kn": self.tr("Saint Kitts and Nevis"),
-            "kp": self.tr("Korea, Democratic People's Republic"),
-            "kr": self.tr("Korea, Republic of"),
-            "kw": self.tr("Kuwait"),
-            "ky": self.tr("Cayman Islands"),
-            "kz": self.tr("Kazakhstan"),
-            "la": self.tr("Lao People's Democratic Republic"),
-            "lb": self.tr("Lebanon"),
-            "lc": self.tr("Saint Lucia"),
-            "li": self.tr("Liechtenstein"),
-            "lk": self.tr("Sri Lanka"),
-            "lr": self.tr("Liberia"),
-            "ls": self.tr("Lesotho"),
-            "lt": self.tr("Lithuania"),
-            "lu": self.tr("Luxembourg"),
-            "lv": self.tr("Latvia"),
-            "ly": self.tr("Libyan Arab Jamahiriya"),
-            "ma": self.tr("Morocco"),
-            "mc": self.tr("Monaco"),
-            "md": self.tr("Moldova, Republic of"),
-            "me": self.tr("Montenegro"),
-            "mg": self.tr("Madagascar"),
-            "mh": self.tr("Marshall Islands"),
-            "mk": self.tr("Macedonia, The Former Yugoslav Republic of"),
-            "ml": self.tr("Mali"),
-            "mm": self.tr("Myanmar"),
-            "mn": self.tr("Mongolia"),
-            "mo": self.tr("Macao"),
-            "mp": self.tr("Northern Mariana Islands"),
-            "mq": self.tr("Martinique"),
-            "mr": self.tr("Mauritania"),
-            "ms": self.tr("Montserrat"),
-            "mt": self.tr("Malta"),
-            "mu": self.tr("Mauritius"),
-            "mv": self.tr("Maldives"),
-            "mw": self.tr("Malawi"),
-            "mx": self.tr("Mexico"),
-            "my": self.tr("Malaysia"),
-            "mz": self.tr("Mozambique"),
-            "na": self.tr("Namibia"),
-            "nc": self.tr("New Caledonia"),
-            "ne": self.tr("Niger"),
-            "nf": self.tr("Norfolk Island"),
-            "ng": self.tr("Nigeria"),
-            "ni": self.tr("Nicaragua"),
-            "nl": self.tr("Netherlands"),
-            "no": self.tr("Norway"),
-            "np": self.tr("Nepal"),
-            "nr": self.tr("Nauru"),
-            "nu": self.tr("Niue"),
-            "nz": self.tr("New Zealand"),
-            "om": self.tr("Oman"),
-            "pa": self.tr("Panama"),
-            "pe": self.tr("Peru"),
-            "pf": self.tr("French Polynesia"),
-            "pg": self.tr("Papua New Guinea"),
-            "ph": self.tr("Philippines"),
-            "pk": self.tr("Pakistan"),
-            "pl": self.tr("Poland"),
-            "pm": self.tr("Saint Pierre and Miquelon"),
-            "pn": self.tr("Pitcairn Island"),
-            "pr": self.tr("Puerto Rico"),
-            "ps": self.tr("Palestinian Territory, Occupied"),
-            "pt": self.tr("Portugal"),
-            "pw": self.tr("Palau"),
-            "py": self.tr("Paraguay"),
-            "qa": self.tr("Qatar"),
-            "re": self.tr("Reunion Island"),
-            "ro": self.tr("Romania"),
-            "rs": self.tr("Serbia"),
-            "ru": self.tr("Russian Federation"),
-            "rw": self.tr("Rwanda"),
-            "sa": self.tr("Saudi Arabia"),
-            "sb": self.tr("Solomon Islands"),
-            "sc": self.tr("Seychelles"),
-            "sd": self.tr("Sudan"),
-            "se": self.tr("Sweden"),
-            "sg": self.tr("Singapore"),
-            "sh": self.tr("Saint Helena"),
-            "si": self.tr("Slovenia"),
-            "sj": self.tr("Svalbard and Jan Mayen Islands"),
-            "sk": self.tr("Slovak Republic"),
-            "sl": self.tr("Sierra Leone"),
-            "sm": self.tr("San Marino"),
-            "sn": self.tr("Senegal"),
-            "so": self.tr("Somalia"),
-            "sr": self.tr("Suriname"),
-            "st": self.tr("Sao Tome and Principe"),
-            "su": self.tr("Soviet Union (being phased out)"),
-            "sv": self.tr("El Salvador"),
-            "sy": self.tr("Syrian Arab Republic"),
-            "sz": self.tr("Swaziland"),
-            "tc": self.tr("Turks and Caicos Islands"),
-            "td": self.tr("Chad"),
-            "tf": self.tr("French Southern Territories"),
-            "tg": self.tr("Togo"),
-            "th": self.tr("Thailand"),
-            "tj": self.tr("Tajikistan"),
-            "tk": self.tr("Tokelau"),
-            "tl": self.tr("Timor-Leste"),
-            "tm": self.tr("Turkmenistan"),
-            "tn": self.tr("Tunisia"),
-            "to": self.tr("Tonga"),
-            "tp": self.tr("East Timor"),
-            "tr": self.tr("Turkey"),
-            "tt": self.tr("Trinidad and Tobago"),
-            "tv": self.tr("Tuvalu"),
-            "tw": self.tr("Taiwan"),
-            "tz": self.tr("Tanzania"),
-            "ua": self.tr("Ukraine"),
-            "ug": self.tr("Uganda"),
-            "uk": self.tr("United Kingdom"),
-            "um": self.tr("United States Minor Outlying Islands"),
-            "us": self.tr("United States"),
-            "uy": self.tr("Uruguay"),
-            "uz": self.tr("Uzbekistan"),
-            "va": self.tr("Holy See (Vatican City State)"),
-            "vc": self.tr("Saint Vincent and the Grenadines"),
-            "ve": self.tr("Venezuela"),
-            "vg": self.tr("Virgin Islands, British"),
-            "vi": self.tr("Virgin Islands, U.S."),
-            "vn": self.tr("Vietnam"),
-            "vu": self.tr("Vanuatu"),
-            "wf": self.tr("Wallis and Futuna Islands"),
-            "ws": self.tr("Samoa"),
-            "ye": self.tr("Yemen"),
-            "yt": self.tr("Mayotte"),
-            "yu": self.tr("Yugoslavia"),
-            "za": self.tr("South Africa"),
-            "zm": self.tr("Zambia"),
-            "zw": self.tr("Zimbabwe"),
-        }
-
-        # processing framework
-        self.provider = GoogleMapsProvider()
+        self._geocoder_lock = threading.Lock()
+        self._region_codes = None
+
+        # processing framework, created in initProcessing
+        self.provider = None
 
     @staticmethod
     def tr(message):
@@ -374,18 +90,68 @@ class GoogleMapsGeocoderPlugin:
         # noinspection PyTypeChecker,PyArgumentList,PyCallByClass
         return QCoreApplication.translate('GoogleMapsGeocoder', message)
 
+    @property
+    def api_key(self) -> str:
+        """
+        Returns the Google Maps API key
+        """
+        return self.config.api_key
+
+    @property
+    def region(self) -> str:
+        """
+        Returns the region bias
+        """
+        return self.config.region
+
+    @property
+    def region_codes(self) -> dict:
+        """
+        Returns a dictionary of region codes to translated region names
+        """
+        if self._region_codes is None:
+            from google_maps_geocoder.gui.regions import REGION_CODES
+            self._region_codes = {code: self.tr(name) for code, name in REGION_CODES.items()}
+        return self._region_codes
+
+    def get_geocoder(self):
+        """
+        Returns the geocoder used for locator searches, creating it on first use.
+
+        The geocoder follows the shared configuration, so it is kept when the
+        API key or region change.
+        """
+        with self._geocoder_lock:
+            if self.geocoder is None:
+                from google_maps_geocoder.core.geocoder import GoogleMapsGeocoder
+                from google_maps_geocoder.core.rate_limiter import RateLimiter
+                self.geocoder = GoogleMapsGeocoder(priority=RateLimiter.PRIORITY_INTERACTIVE)
+            return self.geocoder
+
     def initProcessing(self):
         """Create the Processing provider"""
+        from google_maps_geocoder.processing.provider import GoogleMapsProvider
+        self.provider = GoogleMapsProvider()
         QgsApplication.processingRegistry().addProvider(self.provider)
 
     def initGui(self):
-        self.initProcessing()
-        self.register()
+        from google_maps_geocoder.core.profiler import trace_span
+        with trace_span(self.trace, 'initProcessing', 'startup'):
+            self.initProcessing()
+        with trace_span(self.trace, 'register locator filter', 'startup'):
+            self.register()
 
-        self.options_factory = GoogleMapsOptionsFactory(self)
-        self.options_factory.setTitle(self.tr('Google Maps'))
-        self.iface.registerOptionsWidgetFactory(self.options_factory)
-        self.check_api_key()
+        with trace_span(self.trace, 'register options page', 'startup'):
+            self.options_factory = GoogleMapsOptionsFactory(self)
+            self.options_factory.setTitle(self.tr('Google Maps'))
+            self.iface.registerOptionsWidgetFactory(self.options_factory)
+
+        with trace_span(self.trace, 'check API key', 'startup'):
+            self.check_api_key()
+
+        if self.trace is not None:
+            self.trace.finish()
+            self.trace = None
 
     def unload(self):
         self.unregister()
@@ -396,30 +162,131 @@ class GoogleMapsGeocoderPlugin:
         if self.filter is not None:
             self.iface.deregisterLocatorFilter(self.filter)
             self.filter = None
-            self.geocoder = None
+            with self._geocoder_lock:
+                self.geocoder = None
 
     def register(self):
-        if self.api_key:
-            self.geocoder = QgsGoogleMapsGeocoder(self.api_key, self.region)
-            self.filter = QgsGeocoderLocatorFilter('Google', 'Google', 'addr', self.geocoder, self.iface.mapCanvas())
+        if self.api_key and self.filter is None:
+            from google_maps_geocoder.gui.locator_filter import GoogleMapsLocatorFilter
+            self.filter = GoogleMapsLocatorFilter(self.get_geocoder, self.iface.mapCanvas())
             self.iface.registerLocatorFilter(self.filter)
-            self.provider.set_config(self.api_key, self.region)
 
     def set_api_key(self, api_key):
-        settings = QgsSettings()
-        settings.setValue('/plugins/google_maps/api_key', api_key)
-        self.api_key = api_key
-        self.unregister()
+        """
+        Sets the API key. The change applies in place to the existing geocoder,
+        locator filter and processing algorithms.
+        """
+        if not self.config.update(api_key, self.region):
+            return
+
+        # the locator filter is only available while an API key is set
+        if not self.api_key:
+            self.unregister()
         self.register()
         self.check_api_key()
 
     def set_region(self, region):
+        """
+        Sets the region bias. The change applies in place to the existing
+        geocoder, locator filter and processing algorithms.
+        """
+        self.config.update(self.api_key, region)
+
+    @staticmethod
+    def set_locator_settings(debounce_ms: int, min_length: int, extent_bias: bool):
+        """
+        Sets the locator search debounce delay, minimum query length and
+        whether searches are biased towards the visible map extent
+        """
+        from google_maps_geocoder.gui.locator_filter import GoogleMapsLocatorFilter
         settings = QgsSettings()
-        settings.setValue('/plugins/google_maps/region', region)
+        settings.setValue(GoogleMapsLocatorFilter.SETTINGS_DEBOUNCE_MS, debounce_ms)
+        settings.setValue(GoogleMapsLocatorFilter.SETTINGS_MIN_LENGTH, min_length)
+        settings.setValue(GoogleMapsLocatorFilter.SETTINGS_EXTENT_BIAS, extent_bias)
 
-        self.region = region
-        self.unregister()
-        self.register()
+    @staticmethod
+    def set_history_settings(enabled: bool, max_entries: int):
+        """
+        Sets whether previously selected locator results are suggested, and
+        the maximum size of the search history
+        """
+        from google_maps_geocoder.core.history import SearchHistory
+        settings = QgsSettings()
+        enabled_changed = enabled != settings.value(SearchHistory.SETTINGS_ENABLED, True, bool)
+        settings.setValue(SearchHistory.SETTINGS_ENABLED, enabled)
+        settings.setValue(SearchHistory.SETTINGS_MAX_ENTRIES, max_entries)
+        if enabled_changed:
+            SearchHistory.reset_instance()
+        elif enabled:
+            SearchHistory.instance().max_entries = max_entries
+
+    @staticmethod
+    def set_request_limits(max_requests_per_second: float, max_retries: int, interactive_share: float):
+        """
+        Sets the shared request rate limit, retry count and the share of
+        the rate reserved for locator searches
+        """
+        from google_maps_geocoder.core.rate_limiter import RateLimiter
+        settings = QgsSettings()
+        settings.setValue(RateLimiter.SETTINGS_MAX_QPS, max_requests_per_second)
+        settings.setValue(RateLimiter.SETTINGS_MAX_RETRIES, max_retries)
+        settings.setValue(RateLimiter.SETTINGS_INTERACTIVE_SHARE, interactive_share)
+
+        limiter = RateLimiter.instance()
+        limiter.set_max_rate(max_requests_per_second)
+        limiter.set_interactive_share(interactive_share)
+        limiter.max_retries = max_retries
+
+    @staticmethod
+    def set_cache_settings(enabled: bool, ttl_days: int, max_entries: int):
+        """
+        Sets the result cache settings
+        """
+        from google_maps_geocoder.core.cache import GeocodeCache
+        settings = QgsSettings()
+        enabled_changed = enabled != settings.value(GeocodeCache.SETTINGS_ENABLED, True, bool)
+        settings.setValue(GeocodeCache.SETTINGS_ENABLED, enabled)
+        settings.setValue(GeocodeCache.SETTINGS_TTL_DAYS, ttl_days)
+        settings.setValue(GeocodeCache.SETTINGS_MAX_ENTRIES, max_entries)
+        if enabled_changed:
+            GeocodeCache.reset_instance()
+        elif enabled:
+            # the open cache is kept, so that running jobs and warm entries are unaffected
+            GeocodeCache.instance().set_limits(ttl_days, max_entries)
+
+    @staticmethod
+    def set_gazetteer_settings(path: str, min_confidence: float):
+        """
+        Sets the offline gazetteer database and minimum match confidence
+        """
+        from google_maps_geocoder.core.gazetteer import Gazetteer
+        from google_maps_geocoder.gui.locator_filter import GoogleMapsLocatorFilter
+        settings = QgsSettings()
+        path_changed = path != settings.value(Gazetteer.SETTINGS_PATH, '', str)
+        confidence_changed = min_confidence != settings.value(Gazetteer.SETTINGS_MIN_CONFIDENCE,
+                                                              Gazetteer.DEFAULT_MIN_CONFIDENCE, float)
+        settings.setValue(Gazetteer.SETTINGS_PATH, path)
+        settings.setValue(Gazetteer.SETTINGS_MIN_CONFIDENCE, min_confidence)
+        if path_changed:
+            Gazetteer.reset_instance()
+        elif confidence_changed:
+            gazetteer = Gazetteer.instance()
+            if gazetteer is not None:
+                gazetteer.min_confidence = min_confidence
+
+        if path_changed or confidence_changed:
+            GoogleMapsLocatorFilter.clear_recent_responses()
+
+    @staticmethod
+    def set_profiling_settings(enabled: bool, cprofile: bool):
+        """
+        Sets whether runs are profiled, and whether cProfile statistics are
+        collected alongside the timing spans
+        """
+        from google_maps_geocoder.core.profiler import Profiler
+        settings = QgsSettings()
+        settings.setValue(Profiler.SETTINGS_ENABLED, enabled)
+        settings.setValue(Profiler.SETTINGS_CPROFILE, cprofile)
 
     def check_api_key(self):
         """
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    address.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import re
+
+# common address abbreviations, mapped to their expanded form
+ABBREVIATIONS = {
+    'apt': 'apartment',
+    'ave': 'avenue',
+    'av': 'avenue',
+    'blvd': 'boulevard',
+    'cct': 'circuit',
+    'cl': 'close',
+    'cres': 'crescent',
+    'crt': 'court',
+    'ct': 'court',
+    'dr': 'drive',
+    'e': 'east',
+    'esp': 'esplanade',
+    'fwy': 'freeway',
+    'gr': 'grove',
+    'hwy': 'highway',
+    'ln': 'lane',
+    'mt': 'mount',
+    'n': 'north',
+    'ne': 'northeast',
+    'nw': 'northwest',
+    'pde': 'parade',
+    'pkwy': 'parkway',
+    'pl': 'place',
+    'rd': 'road',
+    's': 'south',
+    'se': 'southeast',
+    'sq': 'square',
+    'st': 'street',
+    'ste': 'suite',
+    'sw': 'southwest',
+    'tce': 'terrace',
+    'w': 'west',
+}
+
+_PUNCTUATION_RE = re.compile(r'[^\w\s]', re.UNICODE)
+
+
+def canonical_address(address: str) -> str:
+    """
+    Returns a canonical form of an address, for matching addresses which
+    differ only by whitespace, case, punctuation or common abbreviations
+    """
+    tokens = _PUNCTUATION_RE.sub(' ', address.casefold()).split()
+    return ' '.join(ABBREVIATIONS.get(token, token) for token in tokens)
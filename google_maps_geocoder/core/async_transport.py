@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    async_transport.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Optional
+
+from qgis.PyQt.QtCore import (
+    QEventLoop,
+    QObject,
+    QTimer
+)
+from qgis.PyQt.QtNetwork import (
+    QNetworkReply,
+    QNetworkRequest
+)
+from qgis.core import (
+    QgsFeedback,
+    QgsNetworkAccessManager,
+    QgsRectangle
+)
+
+from google_maps_geocoder.core.geocoder import (
+    GeocodeResponse,
+    GoogleMapsGeocoder
+)
+from google_maps_geocoder.core.profiler import trace_span
+from google_maps_geocoder.core.rate_limiter import RateLimiter
+
+
+class AsyncGeocodeRequest(Future):
+    """
+    A pending geocoding request made through an AsyncGeocodeTransport.
+
+    Waiting for the result runs the transport's event loop on the calling
+    thread, so results must be retrieved from the thread which made the
+    request.
+    """
+
+    def __init__(self, transport: 'AsyncGeocodeTransport', address: str, bounds: QgsRectangle):
+        super().__init__()
+        self.transport = transport
+        self.address = address
+        self.bounds = bounds
+        self.attempt = 0
+
+    def result(self, timeout=None):  # pylint: disable=missing-function-docstring
+        self.transport.wait(self)
+        return super().result(timeout)
+
+
+class AsyncGeocodeTransport(QObject):
+    """
+    Issues geocoding requests asynchronously through QgsNetworkAccessManager.
+
+    Many requests are kept in flight from a single thread, up to a maximum
+    in-flight window, with further requests queued until a slot is free.
+    Requests share the network access manager's keep-alive connections to
+    the API endpoint rather than each opening their own connection, and are
+    subject to the shared rate limiter, with throttled and transient failures
+    retried after a backoff delay.
+
+    Gazetteer and cache hits are resolved immediately, without a request.
+    """
+
+    def __init__(self, geocoder: GoogleMapsGeocoder, max_in_flight: int,
+                 feedback: Optional[QgsFeedback] = None):
+        super().__init__()
+        self.geocoder = geocoder
+        self.max_in_flight = max_in_flight
+        self.feedback = feedback
+        self.limiter = RateLimiter.instance()
+        self.network_manager = QgsNetworkAccessManager.instance()
+
+        self._queue = deque()
+        # reply -> (request, start time)
+        self._in_flight = {}
+        self._dispatch_scheduled = False
+        self._loop = QEventLoop()
+
+        if feedback is not None:
+            feedback.canceled.connect(self.cancel_all)
+
+    def geocode(self, address: str, bounds: QgsRectangle = QgsRectangle()) -> Future:
+        """
+        Queues an address for geocoding, returning a future for the response
+        """
+        request = AsyncGeocodeRequest(self, address, bounds)
+        with trace_span(self.geocoder.trace, 'local lookup', 'geocoder'):
+            response = self.geocoder.local_response(address, bounds)
+        if response is not None:
+            request.set_result(response)
+            return request
+
+        self._queue.append(request)
+        self.dispatch()
+        return request
+
+    def dispatch(self):
+        """
+        Sends queued requests, while the in-flight window and rate limit allow
+        """
+        self._dispatch_scheduled = False
+        while self._queue and len(self._in_flight) < self.max_in_flight:
+            if self.feedback is not None and self.feedback.isCanceled():
+                self.cancel_all()
+                return
+
+            wait = self.limiter.try_acquire(self.geocoder.priority)
+            if wait:
+                self.schedule_dispatch(wait)
+                return
+
+            request = self._queue.popleft()
+            if request.cancelled():
+                continue
+
+            network_request = QNetworkRequest(self.geocoder.request_url(request.address, request.bounds))
+            if hasattr(QNetworkRequest, 'Http2AllowedAttribute'):
+                network_request.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
+
+            reply = self.network_manager.get(network_request)
+            self._in_flight[reply] = (request, time.perf_counter())
+            reply.finished.connect(lambda reply=reply: self.reply_finished(reply))
+
+    def schedule_dispatch(self, delay: float):
+        """
+        Schedules queued requests to be sent after a delay, in seconds
+        """
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            QTimer.singleShot(max(1, int(delay * 1000)), self.dispatch)
+
+    def reply_finished(self, reply: QNetworkReply):
+        """
+        Handles a completed network reply
+        """
+        request, start = self._in_flight.pop(reply, (None, None))
+        reply.deleteLater()
+        if request is None:
+            return
+
+        trace = self.geocoder.trace
+        if trace is not None:
+            # requests overlap on this thread, so are traced as async spans
+            trace.add_async_span('network', start, time.perf_counter(), 'geocoder')
+
+        if reply.error() == QNetworkReply.OperationCanceledError:
+            response = GeocodeResponse(GeocodeResponse.CANCELED, error=self.geocoder.tr('Request canceled'))
+        elif reply.error() != QNetworkReply.NoError:
+            response = GeocodeResponse(GeocodeResponse.NETWORK_ERROR, error=reply.errorString())
+        else:
+            with trace_span(trace, 'parse response', 'geocoder'):
+                response = self.geocoder.parse_reply(bytes(reply.readAll()))
+        self.geocoder.record_request(time.perf_counter() - start, response.status)
+
+        canceled = self.feedback is not None and self.feedback.isCanceled()
+        if response.is_transient() and not canceled and request.attempt < self.limiter.max_retries:
+            if response.status == GeocodeResponse.OVER_QUERY_LIMIT:
+                # the limiter pauses all requests until the backoff delay has elapsed
+                delay = self.limiter.throttled(request.attempt)
+            else:
+                delay = self.limiter.backoff_delay(request.attempt)
+            request.attempt += 1
+            QTimer.singleShot(int(delay * 1000), lambda: self.retry(request))
+        else:
+            if response.is_valid():
+                self.limiter.succeeded()
+            response.attempts = request.attempt + 1
+            self.geocoder.store_response(request.address, self.geocoder.bounds_key(request.bounds), response)
+            self.resolve(request, response)
+
+        self.dispatch()
+        self._loop.quit()
+
+    def retry(self, request: AsyncGeocodeRequest):
+        """
+        Queues a failed request to be sent again
+        """
+        self._queue.appendleft(request)
+        self.dispatch()
+        self._loop.quit()
+
+    @staticmethod
+    def resolve(request: AsyncGeocodeRequest, response: GeocodeResponse):
+        """
+        Sets the response for a request, unless it has been canceled
+        """
+        if not request.done():
+            request.set_result(response)
+
+    def process_events(self):
+        """
+        Processes completed replies without blocking
+        """
+        self._loop.processEvents()
+
+    def wait(self, request: AsyncGeocodeRequest):
+        """
+        Runs the event loop until a request has completed
+        """
+        while not request.done():
+            self._loop.exec_()
+
+    def cancel_all(self):
+        """
+        Cancels all queued and in-flight requests
+        """
+        canceled = GeocodeResponse(GeocodeResponse.CANCELED, error=self.geocoder.tr('Request canceled'))
+        while self._queue:
+            self.resolve(self._queue.popleft(), canceled)
+        for reply, (request, _) in list(self._in_flight.items()):
+            self.resolve(request, canceled)
+            reply.abort()
+        self._loop.quit()
+
+    def shutdown(self):
+        """
+        Cancels any outstanding requests and releases the transport
+        """
+        if self.feedback is not None:
+            self.feedback.canceled.disconnect(self.cancel_all)
+        self.cancel_all()
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    cache.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from itertools import islice
+from typing import (
+    Iterable,
+    Optional,
+    Tuple
+)
+
+from qgis.core import (
+    QgsApplication,
+    QgsSettings
+)
+
+
+class GeocodeCache:
+    """
+    Persistent SQLite backed cache of Google Maps geocoding results.
+
+    Entries are keyed by the normalized address and region. Entries older
+    than the time to live are ignored, and once the cache grows beyond its
+    maximum size the least recently used entries are evicted.
+    """
+
+    SETTINGS_ENABLED = '/plugins/google_maps/cache_enabled'
+    SETTINGS_PATH = '/plugins/google_maps/cache_path'
+    SETTINGS_TTL_DAYS = '/plugins/google_maps/cache_ttl_days'
+    SETTINGS_MAX_ENTRIES = '/plugins/google_maps/cache_max_entries'
+
+    DEFAULT_TTL_DAYS = 30
+    DEFAULT_MAX_ENTRIES = 500000
+
+    # number of inserts between checks for expired and excess entries
+    PRUNE_INTERVAL = 1000
+    # number of entries inserted per statement for bulk loads
+    BULK_BATCH_SIZE = 10000
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, path: str,
+                 ttl_days: float = DEFAULT_TTL_DAYS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl_days * 86400
+        self.max_entries = max_entries
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path,
+                                           timeout=30,
+                                           isolation_level=None,
+                                           check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS results ('
+                                 'key TEXT PRIMARY KEY, '
+                                 'results TEXT NOT NULL, '
+                                 'created REAL NOT NULL, '
+                                 'accessed REAL NOT NULL)')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS results_accessed ON results(accessed)')
+        self._inserts_since_prune = 0
+        self.prune()
+
+    @staticmethod
+    def default_path() -> str:
+        """
+        Returns the default location of the cache database
+        """
+        return os.path.join(QgsApplication.qgisSettingsDirPath(), 'google_maps_geocoder', 'cache.sqlite')
+
+    @classmethod
+    def instance(cls) -> Optional['GeocodeCache']:
+        """
+        Returns the shared cache instance, created from the plugin settings.
+
+        Returns None if caching has been disabled.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                settings = QgsSettings()
+                if not settings.value(cls.SETTINGS_ENABLED, True, bool):
+                    return None
+
+                path = settings.value(cls.SETTINGS_PATH, '', str) or cls.default_path()
+                ttl_days = settings.value(cls.SETTINGS_TTL_DAYS, cls.DEFAULT_TTL_DAYS, int)
+                max_entries = settings.value(cls.SETTINGS_MAX_ENTRIES, cls.DEFAULT_MAX_ENTRIES, int)
+                cls._instance = GeocodeCache(path, ttl_days, max_entries)
+
+            return cls._instance
+
+    @classmethod
+    def reset_instance(cls):
+        """
+        Discards the shared cache instance, so that it will be recreated
+        using the current settings on next use.
+
+        The instance is not closed, as running jobs and locator searches may
+        still be using it -- its connection is closed once it is no longer
+        referenced.
+        """
+        with cls._instance_lock:
+            cls._instance = None
+
+    @staticmethod
+    def normalize_address(address: str) -> str:
+        """
+        Normalizes an address string for use in a cache key
+        """
+        return ' '.join(address.split()).casefold()
+
+    @staticmethod
+    def key(address: str, region: str, extra: str = '') -> str:
+        """
+        Returns the cache key for an address and region, with optional
+        extra qualifiers (such as a bounds bias)
+        """
+        parts = [GeocodeCache.normalize_address(address), (region or '').lower()]
+        if extra:
+            parts.append(extra)
+        return '\x1f'.join(parts)
+
+    def lookup(self, key: str) -> Optional[list]:
+        """
+        Returns the cached JSON results for a key, or None if the key
+        is not present in the cache or has expired
+        """
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute('SELECT results, created FROM results WHERE key=?',
+                                           (key,)).fetchone()
+            if row is None:
+                return None
+
+            if self.ttl and row[1] < now - self.ttl:
+                self._connection.execute('DELETE FROM results WHERE key=?', (key,))
+                return None
+
+            self._connection.execute('UPDATE results SET accessed=? WHERE key=?', (now, key))
+
+        return json.loads(row[0])
+
+    def store(self, key: str, results: list):
+        """
+        Stores the JSON results for a key
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute('INSERT OR REPLACE INTO results (key, results, created, accessed) '
+                                     'VALUES (?, ?, ?, ?)',
+                                     (key, json.dumps(results, separators=(',', ':')), now, now))
+            self._inserts_since_prune += 1
+            prune = self._inserts_since_prune >= self.PRUNE_INTERVAL
+
+        if prune:
+            self.prune()
+
+    def store_many(self, entries: Iterable[Tuple[str, list]]) -> int:
+        """
+        Stores (key, results) pairs in bulk, in a single transaction.
+
+        Returns the number of entries stored.
+        """
+        now = time.time()
+        rows = ((key, json.dumps(results, separators=(',', ':')), now, now) for key, results in entries)
+        count = 0
+        with self._lock:
+            self._connection.execute('BEGIN')
+            try:
+                while True:
+                    batch = list(islice(rows, self.BULK_BATCH_SIZE))
+                    if not batch:
+                        break
+                    self._connection.executemany('INSERT OR REPLACE INTO results (key, results, created, accessed) '
+                                                 'VALUES (?, ?, ?, ?)', batch)
+                    count += len(batch)
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+
+        self.prune()
+        return count
+
+    def export(self, path: str) -> int:
+        """
+        Exports all unexpired entries to a standalone cache database file.
+
+        Returns the number of entries exported.
+        """
+        if os.path.exists(path):
+            os.remove(path)
+
+        min_created = time.time() - self.ttl if self.ttl else 0
+        with self._lock:
+            self._connection.execute('ATTACH DATABASE ? AS export', (path,))
+            try:
+                self._connection.execute('CREATE TABLE export.results ('
+                                         'key TEXT PRIMARY KEY, '
+                                         'results TEXT NOT NULL, '
+                                         'created REAL NOT NULL, '
+                                         'accessed REAL NOT NULL)')
+                count = self._connection.execute('INSERT INTO export.results '
+                                                 'SELECT key, results, created, accessed FROM main.results '
+                                                 'WHERE created >= ?', (min_created,)).rowcount
+            finally:
+                self._connection.execute('DETACH DATABASE export')
+        return count
+
+    def import_file(self, path: str) -> int:
+        """
+        Imports the entries from an exported cache database file, keeping
+        existing entries where they are newer than the imported entry.
+
+        Returns the number of entries imported.
+        """
+        with self._lock:
+            self._connection.execute('ATTACH DATABASE ? AS import', (path,))
+            try:
+                count = self._connection.execute('INSERT OR REPLACE INTO main.results '
+                                                 'SELECT i.key, i.results, i.created, i.accessed '
+                                                 'FROM import.results i LEFT JOIN main.results r ON r.key = i.key '
+                                                 'WHERE r.key IS NULL OR i.created > r.created').rowcount
+            finally:
+                self._connection.execute('DETACH DATABASE import')
+
+        self.prune()
+        return count
+
+    def set_limits(self, ttl_days: float, max_entries: int):
+        """
+        Sets the time to live and maximum size of the cache, removing any
+        entries beyond the new limits
+        """
+        with self._lock:
+            ttl = ttl_days * 86400
+            if ttl == self.ttl and max_entries == self.max_entries:
+                return
+            self.ttl = ttl
+            self.max_entries = max_entries
+        self.prune()
+
+    def prune(self):
+        """
+        Removes expired entries, and evicts the least recently used entries
+        if the cache exceeds its maximum size
+        """
+        with self._lock:
+            self._inserts_since_prune = 0
+            if self.ttl:
+                self._connection.execute('DELETE FROM results WHERE created < ?', (time.time() - self.ttl,))
+
+            if self.max_entries:
+                excess = self._connection.execute('SELECT COUNT(*) FROM results').fetchone()[0] - self.max_entries
+                if excess > 0:
+                    self._connection.execute('DELETE FROM results WHERE key IN '
+                                             '(SELECT key FROM results ORDER BY accessed ASC LIMIT ?)',
+                                             (excess,))
+
+    def entry_count(self) -> int:
+        """
+        Returns the number of entries in the cache
+        """
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def clear(self):
+        """
+        Removes all entries from the cache
+        """
+        with self._lock:
+            self._connection.execute('DELETE FROM results')
+            self._connection.execute('VACUUM')
+
+    def close(self):
+        """
+        Closes the cache database
+        """
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    config.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import threading
+from typing import Tuple
+
+from qgis.core import QgsSettings
+
+
+class GoogleMapsConfig:
+    """
+    Shared Google Maps API configuration.
+
+    Geocoders, the locator filter and processing algorithms read the API key
+    and region from here on demand, so that configuration changes apply in
+    place without recreating them. Each change increments the revision, which
+    lets readers cheaply detect when derived state must be rebuilt.
+    """
+
+    SETTINGS_API_KEY = '/plugins/google_maps/api_key'
+    SETTINGS_REGION = '/plugins/google_maps/region'
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, api_key: str = '', region: str = ''):
+        self._lock = threading.Lock()
+        self._values = (api_key or '', region or '')
+        self.revision = 0
+
+    @classmethod
+    def instance(cls) -> 'GoogleMapsConfig':
+        """
+        Returns the shared configuration instance, created from the plugin settings
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                settings = QgsSettings()
+                cls._instance = GoogleMapsConfig(settings.value(cls.SETTINGS_API_KEY, '', str),
+                                                 settings.value(cls.SETTINGS_REGION, '', str))
+            return cls._instance
+
+    @property
+    def api_key(self) -> str:
+        """
+        Returns the Google Maps API key
+        """
+        return self._values[0]
+
+    @property
+    def region(self) -> str:
+        """
+        Returns the region bias, as a country code
+        """
+        return self._values[1]
+
+    def values(self) -> Tuple[str, str]:
+        """
+        Returns a consistent (api key, region) pair
+        """
+        return self._values
+
+    def update(self, api_key: str, region: str) -> bool:
+        """
+        Sets the API key and region, storing them in the plugin settings.
+
+        Returns True if the configuration was changed.
+        """
+        values = (api_key or '', region or '')
+        with self._lock:
+            if values == self._values:
+                return False
+
+            self._values = values
+            self.revision += 1
+
+        settings = QgsSettings()
+        settings.setValue(self.SETTINGS_API_KEY, values[0])
+        settings.setValue(self.SETTINGS_REGION, values[1])
+        return True
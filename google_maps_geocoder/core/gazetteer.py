@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    gazetteer.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import os
+import sqlite3
+import threading
+from itertools import islice
+from typing import (
+    Iterable,
+    Optional,
+    Tuple
+)
+
+from qgis.core import (
+    QgsFeedback,
+    QgsSettings
+)
+
+from google_maps_geocoder.core.address import canonical_address
+
+
+class GazetteerMatch:
+    """
+    An address matched from the offline gazetteer
+    """
+
+    __slots__ = ('address', 'x', 'y', 'confidence')
+
+    LOCATION_TYPE = 'GAZETTEER'
+
+    def __init__(self, address: str, x: float, y: float, confidence: float):
+        self.address = address
+        self.x = x
+        self.y = y
+        self.confidence = confidence
+
+    def to_json(self) -> dict:
+        """
+        Returns the match as a result in the Google Maps API format
+        """
+        return {
+            'address_components': [],
+            'formatted_address': self.address,
+            'geometry': {
+                'location': {'lat': self.y, 'lng': self.x},
+                'location_type': self.LOCATION_TYPE
+            },
+            'place_id': '',
+            'types': []
+        }
+
+
+class Gazetteer:
+    """
+    Offline gazetteer of known addresses, stored as a SQLite database.
+
+    Addresses are stored in their canonical form (see canonical_address) with
+    a WGS84 location. Exact canonical matches are found through an index, and
+    otherwise an FTS5 full-text index finds candidates containing every token
+    of the query. The confidence of a candidate is the proportion of tokens
+    shared between the query and the candidate, and only matches meeting the
+    minimum confidence are returned.
+    """
+
+    SETTINGS_PATH = '/plugins/google_maps/gazetteer_path'
+    SETTINGS_MIN_CONFIDENCE = '/plugins/google_maps/gazetteer_min_confidence'
+
+    DEFAULT_MIN_CONFIDENCE = 0.9
+
+    # maximum full-text candidates considered for each lookup
+    MAX_CANDIDATES = 10
+    # number of addresses inserted per transaction when importing
+    IMPORT_BATCH_SIZE = 10000
+
+    _instance = None
+    _instance_lock = threading.Lock()
+    # True once no gazetteer was found to be configured, until the instance is reset
+    _disabled = False
+
+    def __init__(self, path: str, min_confidence: float = DEFAULT_MIN_CONFIDENCE):
+        self.path = path
+        self.min_confidence = min_confidence
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        # readers keep a consistent snapshot while the gazetteer is rebuilt from another connection
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS places ('
+                                 'id INTEGER PRIMARY KEY, '
+                                 'canonical TEXT NOT NULL, '
+                                 'address TEXT NOT NULL, '
+                                 'x REAL NOT NULL, '
+                                 'y REAL NOT NULL)')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS places_canonical ON places(canonical)')
+        try:
+            # contentless, with no token positions stored, to keep the index compact
+            self._connection.execute("CREATE VIRTUAL TABLE IF NOT EXISTS places_fts "
+                                     "USING fts5(canonical, content='', detail=none)")
+            self.full_text = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5, only exact matches are possible
+            self.full_text = False
+        self._connection.commit()
+
+    @classmethod
+    def instance(cls) -> Optional['Gazetteer']:
+        """
+        Returns the shared gazetteer instance, created from the plugin settings.
+
+        Returns None if no gazetteer has been configured. This is remembered
+        until the instance is reset, so that the check is cheap on every lookup.
+        """
+        if cls._disabled:
+            return None
+
+        with cls._instance_lock:
+            if cls._instance is None:
+                settings = QgsSettings()
+                path = settings.value(cls.SETTINGS_PATH, '', str)
+                if not path or not os.path.exists(path):
+                    cls._disabled = True
+                    return None
+
+                min_confidence = settings.value(cls.SETTINGS_MIN_CONFIDENCE, cls.DEFAULT_MIN_CONFIDENCE, float)
+                cls._instance = Gazetteer(path, min_confidence)
+
+            return cls._instance
+
+    @classmethod
+    def reset_instance(cls):
+        """
+        Discards the shared gazetteer instance, so that it will be recreated
+        using the current settings on next use.
+
+        The instance is not closed, as running jobs and locator searches may
+        still be using it -- its connection is closed once it is no longer
+        referenced.
+        """
+        with cls._instance_lock:
+            cls._instance = None
+            cls._disabled = False
+
+    @staticmethod
+    def confidence(query_tokens: set, candidate: str) -> float:
+        """
+        Returns the match confidence between a set of query tokens and a
+        canonical candidate address
+        """
+        candidate_tokens = set(candidate.split())
+        union = query_tokens | candidate_tokens
+        return len(query_tokens & candidate_tokens) / len(union) if union else 0
+
+    def lookup(self, address: str) -> Optional[GazetteerMatch]:
+        """
+        Returns the best match for an address, or None if no match meets
+        the minimum confidence
+        """
+        canonical = canonical_address(address)
+        if not canonical:
+            return None
+
+        with self._lock:
+            row = self._connection.execute('SELECT address, x, y FROM places WHERE canonical=? LIMIT 1',
+                                           (canonical,)).fetchone()
+            if row is not None:
+                return GazetteerMatch(row[0], row[1], row[2], 1.0)
+
+            if not self.full_text or self.min_confidence >= 1:
+                return None
+
+            tokens = set(canonical.split())
+            query = ' AND '.join('"{}"'.format(token.replace('"', '""')) for token in tokens)
+            candidates = self._connection.execute('SELECT p.canonical, p.address, p.x, p.y '
+                                                  'FROM places_fts JOIN places p ON p.id = places_fts.rowid '
+                                                  'WHERE places_fts MATCH ? ORDER BY rank LIMIT ?',
+                                                  (query, self.MAX_CANDIDATES)).fetchall()
+
+        best = None
+        for candidate, candidate_address, x, y in candidates:
+            confidence = self.confidence(tokens, candidate)
+            if confidence >= self.min_confidence and (best is None or confidence > best.confidence):
+                best = GazetteerMatch(candidate_address, x, y, confidence)
+        return best
+
+    def import_addresses(self, addresses: Iterable[Tuple[str, float, float]],
+                         feedback: Optional[QgsFeedback] = None) -> Optional[int]:
+        """
+        Replaces the gazetteer contents with (address, x, y) tuples, where
+        x and y are WGS84 coordinates.
+
+        The import is made in a single transaction, so if the feedback is
+        canceled or the import fails the previous contents are kept.
+
+        Returns the number of addresses imported, or None if the import was canceled.
+        """
+        rows = ((canonical_address(address), address, x, y) for address, x, y in addresses if address)
+        count = 0
+        with self._lock:
+            try:
+                self._connection.execute('DELETE FROM places')
+                if self.full_text:
+                    self._connection.execute("INSERT INTO places_fts(places_fts) VALUES('delete-all')")
+
+                while feedback is None or not feedback.isCanceled():
+                    batch = list(islice(rows, self.IMPORT_BATCH_SIZE))
+                    if not batch:
+                        break
+                    self._connection.executemany('INSERT INTO places (canonical, address, x, y) '
+                                                 'VALUES (?, ?, ?, ?)', batch)
+                    count += len(batch)
+
+                if self.full_text and (feedback is None or not feedback.isCanceled()):
+                    self._connection.execute('INSERT INTO places_fts(rowid, canonical) '
+                                             'SELECT id, canonical FROM places')
+                    self._connection.execute("INSERT INTO places_fts(places_fts) VALUES('optimize')")
+
+                if feedback is not None and feedback.isCanceled():
+                    self._connection.rollback()
+                    return None
+                self._connection.commit()
+            except Exception:
+                self._connection.rollback()
+                raise
+
+            self._connection.execute('VACUUM')
+        return count
+
+    def entry_count(self) -> int:
+        """
+        Returns the number of addresses in the gazetteer
+        """
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM places').fetchone()[0]
+
+    def close(self):
+        """
+        Closes the gazetteer database
+        """
+        with self._lock:
+            self._connection.close()
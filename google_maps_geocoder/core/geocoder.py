@@ -0,0 +1,507 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    geocoder.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import json
+import math
+import os
+import time
+from typing import List, Optional
+
+from qgis.PyQt.QtCore import (
+    QCoreApplication,
+    QUrl,
+    QUrlQuery
+)
+from qgis.PyQt.QtNetwork import QNetworkRequest
+from qgis.core import (
+    QgsBlockingNetworkRequest,
+    QgsCoordinateReferenceSystem,
+    QgsCoordinateTransform,
+    QgsCsException,
+    QgsFeedback,
+    QgsFields,
+    QgsGeocoderContext,
+    QgsGeocoderInterface,
+    QgsGeocoderResult,
+    QgsGeometry,
+    QgsGoogleMapsGeocoder,
+    QgsPointXY,
+    QgsRectangle
+)
+
+from google_maps_geocoder.core.cache import GeocodeCache
+from google_maps_geocoder.core.config import GoogleMapsConfig
+from google_maps_geocoder.core.gazetteer import Gazetteer
+from google_maps_geocoder.core.profiler import trace_span
+from google_maps_geocoder.core.rate_limiter import RateLimiter
+from google_maps_geocoder.core.statistics import GeocodeStatistics
+
+
+class GeocodeResponse:
+    """
+    Outcome of a single Google Maps geocoding request
+    """
+
+    OK = 'OK'
+    ZERO_RESULTS = 'ZERO_RESULTS'
+    OVER_QUERY_LIMIT = 'OVER_QUERY_LIMIT'
+    REQUEST_DENIED = 'REQUEST_DENIED'
+    UNKNOWN_ERROR = 'UNKNOWN_ERROR'
+    NETWORK_ERROR = 'NETWORK_ERROR'
+    INVALID_RESPONSE = 'INVALID_RESPONSE'
+    CANCELED = 'CANCELED'
+
+    def __init__(self, status: str, results: Optional[list] = None, error: str = '', from_cache: bool = False):
+        self.status = status
+        self.results = results or []
+        self.error = error
+        self.from_cache = from_cache
+        self.attempts = 0 if from_cache else 1
+
+    def is_valid(self) -> bool:
+        """
+        Returns True if the request completed successfully, regardless
+        of whether any matches were found
+        """
+        return self.status in (GeocodeResponse.OK, GeocodeResponse.ZERO_RESULTS)
+
+    def is_transient(self) -> bool:
+        """
+        Returns True if the request failed for a reason which may succeed
+        if the request is retried
+        """
+        return self.status in (GeocodeResponse.OVER_QUERY_LIMIT,
+                               GeocodeResponse.UNKNOWN_ERROR,
+                               GeocodeResponse.NETWORK_ERROR)
+
+
+class ResultRecord:
+    """
+    Compact record of a geocoded result, holding only the values of the
+    selected result fields and the result geometry
+    """
+
+    __slots__ = ('attributes', 'geometry')
+
+    def __init__(self, attributes: list, geometry):
+        self.attributes = attributes
+        self.geometry = geometry
+
+
+class GoogleMapsGeocoder(QgsGeocoderInterface):
+    """
+    Google Maps geocoder, backed by the offline gazetteer, the persistent
+    result cache and the shared request rate limiter.
+
+    Unless an API key and region are given explicitly, the current values
+    from the shared GoogleMapsConfig are used for every request.
+
+    All requests are recorded both in the session-wide statistics and in
+    statistics specific to this geocoder instance.
+
+    Request URLs and result parsing are delegated to the native
+    QgsGoogleMapsGeocoder, while the network request itself is made here so
+    that raw responses can be cached and shared between the locator filter
+    and the processing algorithms.
+    """
+
+    # environment variable used to redirect requests to an alternative
+    # endpoint, such as a local mock server for testing and benchmarking
+    ENDPOINT_ENVIRONMENT_VARIABLE = 'GOOGLE_MAPS_GEOCODER_ENDPOINT'
+
+    DEFAULT_ENDPOINT = 'https://maps.googleapis.com/maps/api/geocode/json'
+
+    # fields appended by the native geocoder, which are the same for every
+    # API key and region
+    _appended_fields = None
+
+    def __init__(self, api_key: Optional[str] = None, region: Optional[str] = None,
+                 priority: int = RateLimiter.PRIORITY_BATCH):
+        super().__init__()
+        # an explicit API key and region take precedence over the shared configuration
+        self._api_key = api_key
+        self._region = region
+        # request priority class used with the shared rate limiter
+        self.priority = priority
+        self._coder = None
+        self._coder_revision = -1
+        self.endpoint = os.environ.get(self.ENDPOINT_ENVIRONMENT_VARIABLE)
+        self.statistics = GeocodeStatistics()
+        # optional trace session timing the requests made by this geocoder
+        self.trace = None
+
+    @staticmethod
+    def tr(message):
+        """
+        Translates a string
+        """
+        return QCoreApplication.translate('GoogleMapsGeocoder', message)
+
+    @property
+    def api_key(self) -> str:
+        """
+        Returns the Google Maps API key
+        """
+        return self._api_key if self._api_key is not None else GoogleMapsConfig.instance().api_key
+
+    @property
+    def region(self) -> str:
+        """
+        Returns the region bias
+        """
+        return self._region if self._region is not None else GoogleMapsConfig.instance().region
+
+    @property
+    def coder(self) -> QgsGoogleMapsGeocoder:
+        """
+        Returns the native geocoder used for request URLs and result parsing,
+        which is rebuilt whenever the shared configuration changes
+        """
+        revision = GoogleMapsConfig.instance().revision
+        if self._coder is None or revision != self._coder_revision:
+            self._coder = QgsGoogleMapsGeocoder(self.api_key, self.region)
+            self._coder_revision = revision
+        return self._coder
+
+    def flags(self):  # pylint: disable=missing-function-docstring
+        return QgsGeocoderInterface.GeocodesStrings
+
+    def appendedFields(self):  # pylint: disable=missing-function-docstring
+        return self.result_fields()
+
+    @classmethod
+    def result_fields(cls) -> QgsFields:
+        """
+        Returns the fields appended to geocoded features.
+
+        These don't depend on the configuration, so they are only retrieved
+        from a native geocoder once, rather than each time a geocoder or
+        processing algorithm is created.
+        """
+        if cls._appended_fields is None:
+            cls._appended_fields = QgsGoogleMapsGeocoder('', '').appendedFields()
+        return QgsFields(cls._appended_fields)
+
+    def wkbType(self):  # pylint: disable=missing-function-docstring
+        return self.coder.wkbType()
+
+    def geocodeString(self, string: str, context: QgsGeocoderContext,
+                      feedback: Optional[QgsFeedback] = None) -> List[QgsGeocoderResult]:  # pylint: disable=missing-function-docstring
+        response = self.geocode(string, self.bounds_for_context(context), feedback)
+        return self.to_results(response)
+
+    @staticmethod
+    def bounds_for_context(context: QgsGeocoderContext) -> QgsRectangle:
+        """
+        Returns the WGS84 bounds bias to use for a geocoder context
+        """
+        if context.areaOfInterest().isEmpty():
+            return QgsRectangle()
+
+        geometry = QgsGeometry(context.areaOfInterest())
+        transform = QgsCoordinateTransform(context.areaOfInterestCrs(),
+                                           QgsCoordinateReferenceSystem('EPSG:4326'),
+                                           context.transformContext())
+        try:
+            geometry.transform(transform)
+        except QgsCsException:
+            return QgsRectangle()
+
+        return geometry.boundingBox()
+
+    def geocode(self, address: str, bounds: QgsRectangle = QgsRectangle(),
+                feedback: Optional[QgsFeedback] = None) -> GeocodeResponse:
+        """
+        Geocodes an address, using a confident offline gazetteer match or
+        cached results where available
+        """
+        with trace_span(self.trace, 'local lookup', 'geocoder'):
+            response = self.local_response(address, bounds)
+        if response is not None:
+            return response
+
+        response = self.fetch_with_retries(self.request_url(address, bounds), feedback)
+        self.store_response(address, self.bounds_key(bounds), response)
+        return response
+
+    def local_response(self, address: str, bounds: QgsRectangle = QgsRectangle()) -> Optional[GeocodeResponse]:
+        """
+        Returns the response for an address from the offline gazetteer or the
+        cache, or None if a network request is required
+        """
+        gazetteer = Gazetteer.instance()
+        if gazetteer is not None:
+            match = gazetteer.lookup(address)
+            self.record_gazetteer_lookup(match is not None)
+            if match is not None:
+                return GeocodeResponse(GeocodeResponse.OK, [match.to_json()], from_cache=True)
+
+        return self.cached_response(address, self.bounds_key(bounds))
+
+    @staticmethod
+    def bounds_key(bounds: QgsRectangle) -> str:
+        """
+        Returns the cache key qualifier for a bounds bias
+        """
+        if bounds.isEmpty():
+            return ''
+        return '{:.4f},{:.4f},{:.4f},{:.4f}'.format(bounds.xMinimum(), bounds.yMinimum(),
+                                                    bounds.xMaximum(), bounds.yMaximum())
+
+    @staticmethod
+    def tile_bounds(bounds: QgsRectangle) -> QgsRectangle:
+        """
+        Snaps a WGS84 bounds bias to a coarse tile grid.
+
+        The tile size is the smallest power of two (in degrees) covering the
+        bounds, and the returned bias covers the tile containing the bounds
+        centre plus half a tile on each side. The result always contains the
+        original bounds, and is unchanged when the bounds move by a short
+        distance, so that biased lookups can be shared from the cache.
+        """
+        if bounds.isEmpty():
+            return QgsRectangle()
+
+        tile = 2 ** math.ceil(math.log2(max(bounds.width(), bounds.height(), 1e-4)))
+        center = bounds.center()
+        column = math.floor(center.x() / tile)
+        row = math.floor(center.y() / tile)
+        return QgsRectangle(max(-180.0, (column - 0.5) * tile), max(-90.0, (row - 0.5) * tile),
+                            min(180.0, (column + 1.5) * tile), min(90.0, (row + 1.5) * tile))
+
+    def reverse_geocode(self, point: QgsPointXY, feedback: Optional[QgsFeedback] = None) -> GeocodeResponse:
+        """
+        Reverse geocodes a point in WGS84, using cached results where available
+        """
+        latlng = self.latlng(point)
+        return self.cached_fetch(latlng, 'latlng', self.reverse_request_url(latlng), feedback)
+
+    @staticmethod
+    def latlng(point: QgsPointXY) -> str:
+        """
+        Returns the Google Maps API latlng string for a WGS84 point
+        """
+        return '{:.6f},{:.6f}'.format(point.y(), point.x())
+
+    def cached_fetch(self, cache_address: str, cache_extra: str, url: QUrl,
+                     feedback: Optional[QgsFeedback] = None) -> GeocodeResponse:
+        """
+        Returns the cached response for a request, or performs the request
+        and caches the response if it completes successfully
+        """
+        response = self.cached_response(cache_address, cache_extra)
+        if response is not None:
+            return response
+
+        response = self.fetch_with_retries(url, feedback)
+        self.store_response(cache_address, cache_extra, response)
+        return response
+
+    def cached_response(self, cache_address: str, cache_extra: str) -> Optional[GeocodeResponse]:
+        """
+        Returns the cached response for a request, or None if the request
+        is not cached
+        """
+        cache = GeocodeCache.instance()
+        if cache is None:
+            return None
+
+        results = cache.lookup(GeocodeCache.key(cache_address, self.region, cache_extra))
+        self.record_cache_lookup(results is not None)
+        if results is None:
+            return None
+
+        return GeocodeResponse(GeocodeResponse.OK if results else GeocodeResponse.ZERO_RESULTS,
+                               results, from_cache=True)
+
+    def store_response(self, cache_address: str, cache_extra: str, response: GeocodeResponse):
+        """
+        Stores the response for a request in the cache, if it completed successfully
+        """
+        cache = GeocodeCache.instance()
+        if cache is not None and response.is_valid():
+            cache.store(GeocodeCache.key(cache_address, self.region, cache_extra), response.results)
+
+    def request_url(self, address: str, bounds: QgsRectangle = QgsRectangle()) -> QUrl:
+        """
+        Returns the request URL for an address
+        """
+        return self.apply_endpoint(self.coder.requestUrl(address, bounds))
+
+    def reverse_request_url(self, latlng: str) -> QUrl:
+        """
+        Returns the reverse geocoding request URL for a latlng string
+        """
+        url = QUrl(self.DEFAULT_ENDPOINT)
+        query = QUrlQuery()
+        query.addQueryItem('latlng', latlng)
+        query.addQueryItem('key', self.api_key)
+        if self.region:
+            query.addQueryItem('region', self.region)
+        url.setQuery(query)
+        return self.apply_endpoint(url)
+
+    def apply_endpoint(self, url: QUrl) -> QUrl:
+        """
+        Redirects a request URL to the configured alternative endpoint, if set
+        """
+        if self.endpoint:
+            endpoint = QUrl(self.endpoint)
+            url.setScheme(endpoint.scheme())
+            url.setHost(endpoint.host())
+            url.setPort(endpoint.port())
+            url.setPath(endpoint.path())
+        return url
+
+    def fetch_with_retries(self, url: QUrl, feedback: Optional[QgsFeedback] = None) -> GeocodeResponse:
+        """
+        Performs a request against the Google Maps API, subject to the shared
+        rate limit and retrying throttled or transient failures with
+        exponential backoff
+        """
+        limiter = RateLimiter.instance()
+        attempt = 0
+        while True:
+            with trace_span(self.trace, 'rate limit', 'geocoder'):
+                acquired = limiter.acquire(feedback, self.priority)
+            if not acquired:
+                response = GeocodeResponse(GeocodeResponse.CANCELED, error=self.tr('Request canceled'))
+                break
+
+            response = self.fetch(url, feedback)
+            if not response.is_transient() or (feedback is not None and feedback.isCanceled()):
+                if response.is_valid():
+                    limiter.succeeded()
+                break
+
+            if attempt >= limiter.max_retries:
+                break
+
+            if response.status == GeocodeResponse.OVER_QUERY_LIMIT:
+                # all requests are paused until the backoff delay has elapsed
+                limiter.throttled(attempt)
+            elif not RateLimiter.sleep(limiter.backoff_delay(attempt), feedback):
+                break
+
+            attempt += 1
+
+        response.attempts = attempt + 1
+        return response
+
+    def fetch(self, url: QUrl, feedback: Optional[QgsFeedback] = None) -> GeocodeResponse:
+        """
+        Performs a blocking request against the Google Maps API
+        """
+        start = time.perf_counter()
+        request = QNetworkRequest(url)
+        blocking_request = QgsBlockingNetworkRequest()
+        with trace_span(self.trace, 'network', 'geocoder'):
+            error = blocking_request.get(request, False, feedback)
+        if error != QgsBlockingNetworkRequest.NoError:
+            response = GeocodeResponse(GeocodeResponse.NETWORK_ERROR, error=blocking_request.errorMessage())
+        else:
+            with trace_span(self.trace, 'parse response', 'geocoder'):
+                response = self.parse_reply(bytes(blocking_request.reply().content()))
+
+        self.record_request(time.perf_counter() - start, response.status)
+        return response
+
+    def record_request(self, latency: float, status: str):
+        """
+        Records a completed network request in the statistics
+        """
+        self.statistics.record_request(latency, status)
+        GeocodeStatistics.instance().record_request(latency, status)
+
+    def record_cache_lookup(self, hit: bool):
+        """
+        Records a cache lookup in the statistics
+        """
+        self.statistics.record_cache_lookup(hit)
+        GeocodeStatistics.instance().record_cache_lookup(hit)
+
+    def record_gazetteer_lookup(self, hit: bool):
+        """
+        Records an offline gazetteer lookup in the statistics
+        """
+        self.statistics.record_gazetteer_lookup(hit)
+        GeocodeStatistics.instance().record_gazetteer_lookup(hit)
+
+    def parse_reply(self, content: bytes) -> GeocodeResponse:
+        """
+        Parses the raw content of a Google Maps API reply
+        """
+        try:
+            res = json.loads(content.decode('utf-8'))
+        except ValueError as e:
+            return GeocodeResponse(GeocodeResponse.INVALID_RESPONSE, error=str(e))
+
+        status = res.get('status', '')
+        if not status or 'results' not in res:
+            return GeocodeResponse(GeocodeResponse.INVALID_RESPONSE,
+                                   error=self.tr('Invalid response from Google Maps API'))
+
+        if status in (GeocodeResponse.OK, GeocodeResponse.ZERO_RESULTS):
+            return GeocodeResponse(status, res['results'])
+
+        if res.get('error_message'):
+            error = res['error_message']
+        elif status == GeocodeResponse.REQUEST_DENIED:
+            error = self.tr('Request denied -- the API key was rejected')
+        elif status == GeocodeResponse.OVER_QUERY_LIMIT:
+            error = self.tr('Request denied -- the query limit was exceeded')
+        else:
+            error = status
+
+        return GeocodeResponse(status, error=error)
+
+    @staticmethod
+    def json_from_attributes(attributes: dict, point: QgsPointXY) -> dict:
+        """
+        Reconstructs a result in the Google Maps API format from the appended
+        attributes of a previously geocoded feature and its WGS84 location.
+
+        This is the inverse of the attribute mapping performed by
+        QgsGoogleMapsGeocoder.jsonToResult.
+        """
+        components = []
+        for name, value in attributes.items():
+            if name in ('location_type', 'formatted_address', 'place_id') or name.endswith('_short') or not value:
+                continue
+            short_name = attributes.get('{}_short'.format(name)) or value
+            components.append({'long_name': value, 'short_name': short_name, 'types': [name]})
+
+        return {
+            'address_components': components,
+            'formatted_address': attributes.get('formatted_address') or '',
+            'geometry': {
+                'location': {'lat': point.y(), 'lng': point.x()},
+                'location_type': attributes.get('location_type') or ''
+            },
+            'place_id': attributes.get('place_id') or '',
+            'types': []
+        }
+
+    def to_results(self, response: GeocodeResponse) -> List[QgsGeocoderResult]:
+        """
+        Converts a geocode response to a list of geocoder results
+        """
+        if not response.is_valid():
+            return [QgsGeocoderResult.errorResult(response.error)]
+
+        return [self.coder.jsonToResult(result) for result in response.results]
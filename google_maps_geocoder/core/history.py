@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    history.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import (
+    List,
+    Optional
+)
+
+from qgis.core import (
+    QgsApplication,
+    QgsSettings
+)
+
+from google_maps_geocoder.core.cache import GeocodeCache
+
+
+class HistoryEntry:
+    """
+    A previously selected locator result
+    """
+
+    __slots__ = ('display', 'description', 'group', 'user_data')
+
+    def __init__(self, display: str, description: str, group: str, user_data: dict):
+        self.display = display
+        self.description = description
+        self.group = group
+        self.user_data = user_data
+
+
+class SearchHistory:
+    """
+    Persistent SQLite backed history of selected locator results.
+
+    Each result is indexed by the words of its display string, using an
+    FTS5 prefix index so that matches are found from the first keystrokes
+    of a query without any network request. Matches are ranked by how
+    often and how recently each result was selected, and once the history
+    grows beyond its maximum size the lowest ranked entries are evicted.
+    """
+
+    SETTINGS_ENABLED = '/plugins/google_maps/history_enabled'
+    SETTINGS_MAX_ENTRIES = '/plugins/google_maps/history_max_entries'
+
+    DEFAULT_MAX_ENTRIES = 1000
+
+    # maximum matches returned for each search
+    MAX_MATCHES = 5
+    # age in days at which an entry's selection count carries half its weight
+    HALF_WEIGHT_DAYS = 7
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path,
+                                           timeout=30,
+                                           isolation_level=None,
+                                           check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS history ('
+                                 'id INTEGER PRIMARY KEY, '
+                                 'identifier TEXT NOT NULL UNIQUE, '
+                                 'display TEXT NOT NULL, '
+                                 'description TEXT NOT NULL, '
+                                 'result_group TEXT NOT NULL, '
+                                 'user_data TEXT NOT NULL, '
+                                 'hits INTEGER NOT NULL, '
+                                 'last_used REAL NOT NULL)')
+        try:
+            # prefix indexes for the first three characters of each word, so
+            # that short prefix queries don't scan the full term list
+            self._connection.execute("CREATE VIRTUAL TABLE IF NOT EXISTS history_fts "
+                                     "USING fts5(identifier, prefix='1 2 3')")
+            self.full_text = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5, fall back to scanning the (small) history table
+            self.full_text = False
+
+    @staticmethod
+    def default_path() -> str:
+        """
+        Returns the default location of the history database
+        """
+        return os.path.join(QgsApplication.qgisSettingsDirPath(), 'google_maps_geocoder', 'history.sqlite')
+
+    @classmethod
+    def instance(cls) -> Optional['SearchHistory']:
+        """
+        Returns the shared history instance, created from the plugin settings.
+
+        Returns None if the search history has been disabled.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                settings = QgsSettings()
+                if not settings.value(cls.SETTINGS_ENABLED, True, bool):
+                    return None
+
+                max_entries = settings.value(cls.SETTINGS_MAX_ENTRIES, cls.DEFAULT_MAX_ENTRIES, int)
+                cls._instance = SearchHistory(cls.default_path(), max_entries)
+
+            return cls._instance
+
+    @classmethod
+    def reset_instance(cls):
+        """
+        Discards the shared history instance, so that it will be recreated
+        using the current settings on next use.
+
+        The instance is not closed, as running jobs and locator searches may
+        still be using it -- its connection is closed once it is no longer
+        referenced.
+        """
+        with cls._instance_lock:
+            cls._instance = None
+
+    @staticmethod
+    def tokens(string: str) -> List[str]:
+        """
+        Returns the normalized words of a string
+        """
+        return re.findall(r'\w+', GeocodeCache.normalize_address(string))
+
+    def rank_expression(self) -> str:
+        """
+        Returns the SQL expression used to rank entries, given the current
+        time as its only parameter
+        """
+        return 'hits / (1.0 + (? - last_used) / {})'.format(self.HALF_WEIGHT_DAYS * 86400.0)
+
+    def record(self, display: str, description: str, group: str, user_data: dict):
+        """
+        Records the selection of a locator result, evicting the lowest ranked
+        entries if the history has grown beyond its maximum size
+        """
+        identifier = GeocodeCache.normalize_address(display)
+        if not identifier:
+            return
+
+        now = time.time()
+        encoded = json.dumps(user_data)
+        with self._lock:
+            row = self._connection.execute('SELECT id FROM history WHERE identifier=?', (identifier,)).fetchone()
+            if row is not None:
+                self._connection.execute('UPDATE history SET display=?, description=?, result_group=?, '
+                                         'user_data=?, hits=hits+1, last_used=? WHERE id=?',
+                                         (display, description or '', group or '', encoded, now, row[0]))
+                return
+
+            self._connection.execute('BEGIN')
+            try:
+                cursor = self._connection.execute('INSERT INTO history (identifier, display, description, '
+                                                  'result_group, user_data, hits, last_used) '
+                                                  'VALUES (?, ?, ?, ?, ?, 1, ?)',
+                                                  (identifier, display, description or '', group or '',
+                                                   encoded, now))
+                if self.full_text:
+                    self._connection.execute('INSERT INTO history_fts (rowid, identifier) VALUES (?, ?)',
+                                             (cursor.lastrowid, identifier))
+
+                excess = self._connection.execute('SELECT COUNT(*) FROM history').fetchone()[0] - self.max_entries
+                if excess > 0:
+                    evicted = self._connection.execute('SELECT id FROM history ORDER BY {} ASC LIMIT ?'.format(
+                        self.rank_expression()), (now, excess)).fetchall()
+                    self._connection.executemany('DELETE FROM history WHERE id=?', evicted)
+                    if self.full_text:
+                        self._connection.executemany('DELETE FROM history_fts WHERE rowid=?', evicted)
+                self._connection.execute('COMMIT')
+            except sqlite3.Error:
+                self._connection.execute('ROLLBACK')
+                raise
+
+    def search(self, query: str, limit: int = MAX_MATCHES) -> List[HistoryEntry]:
+        """
+        Returns the highest ranked entries containing a word starting with
+        each word of the query
+        """
+        tokens = self.tokens(query)
+        if not tokens:
+            return []
+
+        rank = self.rank_expression()
+        now = time.time()
+        with self._lock:
+            if self.full_text:
+                match = ' AND '.join('"{}"*'.format(token) for token in tokens)
+                rows = self._connection.execute('SELECT display, description, result_group, user_data '
+                                                'FROM history WHERE id IN '
+                                                '(SELECT rowid FROM history_fts WHERE history_fts MATCH ?) '
+                                                'ORDER BY {} DESC LIMIT ?'.format(rank),
+                                                (match, now, limit)).fetchall()
+            else:
+                candidates = self._connection.execute('SELECT identifier, display, description, result_group, '
+                                                      'user_data FROM history ORDER BY {} DESC'.format(rank),
+                                                      (now,)).fetchall()
+                rows = []
+                for candidate in candidates:
+                    words = self.tokens(candidate[0])
+                    if all(any(word.startswith(token) for word in words) for token in tokens):
+                        rows.append(candidate[1:])
+                        if len(rows) >= limit:
+                            break
+
+        return [HistoryEntry(display, description, group, json.loads(user_data))
+                for display, description, group, user_data in rows]
+
+    def entry_count(self) -> int:
+        """
+        Returns the number of entries in the history
+        """
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM history').fetchone()[0]
+
+    def clear(self):
+        """
+        Removes all entries from the history
+        """
+        with self._lock:
+            self._connection.execute('DELETE FROM history')
+            if self.full_text:
+                self._connection.execute('DELETE FROM history_fts')
+            self._connection.execute('VACUUM')
+
+    def close(self):
+        """
+        Closes the history database
+        """
+        with self._lock:
+            self._connection.close()
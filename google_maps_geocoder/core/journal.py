@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    journal.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Union
+
+from qgis.core import (
+    QgsApplication,
+    QgsGeometry
+)
+
+from google_maps_geocoder.core.geocoder import (
+    GeocodeResponse,
+    ResultRecord
+)
+
+
+class GeocodeJournal:
+    """
+    Checkpoint journal of completed batch geocoding results.
+
+    Results are recorded against their input feature ID as they complete,
+    so that an interrupted run can be resumed without repeating requests
+    for features which were already geocoded. Either the raw response or,
+    where only a compact result record is held, that record is stored.
+    """
+
+    # status stored for compact result records
+    RECORD_STATUS = 'RECORD'
+
+    # maximum number of results, and time in seconds, between commits
+    COMMIT_INTERVAL = 500
+    COMMIT_SECONDS = 2
+
+    def __init__(self, path: str):
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(path, timeout=30)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS results ('
+                                 'fid INTEGER PRIMARY KEY, '
+                                 'status TEXT NOT NULL, '
+                                 'results TEXT NOT NULL)')
+        self._connection.commit()
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+
+    @staticmethod
+    def path_for_run(*identifiers: str) -> str:
+        """
+        Returns the journal path for a run, identified by the input layer
+        source and any other settings which affect the results
+        """
+        digest = hashlib.sha1('\x1f'.join(identifiers).encode('utf-8')).hexdigest()
+        return os.path.join(QgsApplication.qgisSettingsDirPath(), 'google_maps_geocoder', 'journals',
+                            '{}.sqlite'.format(digest))
+
+    def count(self) -> int:
+        """
+        Returns the number of results recorded in the journal
+        """
+        return self._connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def lookup(self, fid: int) -> Union[GeocodeResponse, ResultRecord, None]:
+        """
+        Returns the recorded response or result record for a feature, or None
+        if the feature has not been completed
+        """
+        row = self._connection.execute('SELECT status, results FROM results WHERE fid=?', (fid,)).fetchone()
+        if row is None:
+            return None
+
+        if row[0] == self.RECORD_STATUS:
+            record = json.loads(row[1])
+            return ResultRecord(record['attributes'], QgsGeometry.fromWkt(record['geometry']))
+
+        response = GeocodeResponse(row[0], json.loads(row[1]))
+        response.attempts = 0
+        return response
+
+    def record(self, fid: int, response: Union[GeocodeResponse, ResultRecord]):
+        """
+        Records the completed response, or result record, for a feature
+        """
+        if isinstance(response, ResultRecord):
+            # values which can't be stored as JSON, such as NULL variants, are stored as null
+            status = self.RECORD_STATUS
+            results = json.dumps({'attributes': response.attributes, 'geometry': response.geometry.asWkt()},
+                                 separators=(',', ':'), default=lambda value: None)
+        else:
+            status = response.status
+            results = json.dumps(response.results, separators=(',', ':'))
+        self._connection.execute('INSERT OR REPLACE INTO results (fid, status, results) VALUES (?, ?, ?)',
+                                 (fid, status, results))
+        self._uncommitted += 1
+        if self._uncommitted >= self.COMMIT_INTERVAL or time.monotonic() - self._last_commit > self.COMMIT_SECONDS:
+            self.flush()
+
+    def flush(self):
+        """
+        Commits recorded results to disk
+        """
+        self._connection.commit()
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+
+    def clear(self):
+        """
+        Removes all recorded results
+        """
+        self._connection.execute('DELETE FROM results')
+        self.flush()
+
+    def close(self):
+        """
+        Commits recorded results and closes the journal
+        """
+        self.flush()
+        self._connection.close()
+
+    def remove(self):
+        """
+        Closes and deletes the journal
+        """
+        self._connection.close()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    profiler.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import cProfile
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import (
+    contextmanager,
+    nullcontext
+)
+from typing import (
+    Optional,
+    Tuple
+)
+
+from qgis.core import (
+    QgsApplication,
+    QgsSettings
+)
+
+
+class TraceSession:
+    """
+    Collects named timing spans for a single run, and writes them as a
+    Chrome trace-event JSON file which can be opened in chrome://tracing,
+    Perfetto or speedscope.
+
+    Spans are recorded as complete events on the thread which ran them.
+    Requests overlapping on a single thread, such as those made by the
+    asynchronous transport, are recorded as async events instead. Once the
+    maximum number of events is reached further events are dropped, but the
+    total time for each span name continues to be accumulated.
+
+    Optionally, the thread which started the session is also profiled with
+    cProfile, and the statistics dumped alongside the trace.
+    """
+
+    # maximum number of events kept for the trace file
+    MAX_EVENTS = 500000
+
+    _counter = itertools.count(1)
+
+    def __init__(self, name: str, directory: str, profile: bool = False):
+        self.name = name
+        self.directory = directory
+        self.pid = os.getpid()
+        self.start = time.perf_counter()
+        self.dropped = 0
+
+        self._lock = threading.Lock()
+        self._events = []
+        self._thread_names = {}
+        self._async_ids = itertools.count(1)
+        # span name -> [count, total duration in seconds]
+        self._totals = {}
+
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        self.base_path = os.path.join(directory, '{}-{}-{}-{}'.format(name, stamp, self.pid,
+                                                                      next(self._counter)))
+
+        self.profile = None
+        if profile:
+            self.profile = cProfile.Profile()
+            try:
+                self.profile.enable()
+            except ValueError:
+                # another profiler is already active (Python 3.12+ allows only one)
+                self.profile = None
+
+    @contextmanager
+    def span(self, name: str, category: str = '', **args):
+        """
+        Times the enclosed block as a named span on the current thread
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(name, start, time.perf_counter(), category, **args)
+
+    def add_span(self, name: str, start: float, end: float, category: str = '', **args):
+        """
+        Adds a span on the current thread, with perf_counter start and end times
+        """
+        thread = threading.current_thread()
+        event = {'name': name, 'cat': category, 'ph': 'X', 'pid': self.pid, 'tid': thread.ident,
+                 'ts': self.timestamp(start), 'dur': (end - start) * 1e6}
+        if args:
+            event['args'] = args
+        with self._lock:
+            if thread.ident not in self._thread_names:
+                self._thread_names[thread.ident] = thread.name
+            self.accumulate(name, end - start)
+            self.append(event)
+
+    def add_async_span(self, name: str, start: float, end: float, category: str = '', **args):
+        """
+        Adds a span which may overlap others on the current thread, with
+        perf_counter start and end times
+        """
+        tid = threading.get_ident()
+        with self._lock:
+            event_id = next(self._async_ids)
+            self.accumulate(name, end - start)
+            begin = {'name': name, 'cat': category or 'async', 'ph': 'b', 'id': event_id, 'pid': self.pid,
+                     'tid': tid, 'ts': self.timestamp(start)}
+            if args:
+                begin['args'] = args
+            self.append(begin)
+            self.append({'name': name, 'cat': category or 'async', 'ph': 'e', 'id': event_id, 'pid': self.pid,
+                         'tid': tid, 'ts': self.timestamp(end)})
+
+    def timestamp(self, value: float) -> float:
+        """
+        Converts a perf_counter time to a trace timestamp, in microseconds
+        """
+        return (value - self.start) * 1e6
+
+    def accumulate(self, name: str, duration: float):
+        """
+        Adds a span duration to the totals. The lock must be held.
+        """
+        totals = self._totals.get(name)
+        if totals is None:
+            self._totals[name] = [1, duration]
+        else:
+            totals[0] += 1
+            totals[1] += duration
+
+    def append(self, event: dict):
+        """
+        Adds an event to the trace, unless the maximum has been reached. The
+        lock must be held.
+        """
+        if len(self._events) < self.MAX_EVENTS:
+            self._events.append(event)
+        else:
+            self.dropped += 1
+
+    def summary(self) -> str:
+        """
+        Returns a summary of the total time spent in each span, longest first
+        """
+        with self._lock:
+            totals = sorted(self._totals.items(), key=lambda item: item[1][1], reverse=True)
+        return '\n'.join('{}: {:.3f} s in {} spans ({:.3f} ms mean)'.format(name, total, count,
+                                                                            1000 * total / count)
+                         for name, (count, total) in totals)
+
+    def finish(self) -> Tuple[str, Optional[str]]:
+        """
+        Stops profiling and writes the trace file, and the cProfile statistics
+        if enabled.
+
+        Returns the paths of the trace and cProfile files.
+        """
+        profile_path = None
+        if self.profile is not None:
+            self.profile.disable()
+            profile_path = self.base_path + '.prof'
+
+        os.makedirs(self.directory, exist_ok=True)
+        if profile_path:
+            self.profile.dump_stats(profile_path)
+
+        with self._lock:
+            metadata = [{'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid, 'args': {'name': name}}
+                        for tid, name in self._thread_names.items()]
+            metadata.append({'name': 'process_name', 'ph': 'M', 'pid': self.pid,
+                             'args': {'name': 'QGIS Google Maps geocoder: {}'.format(self.name)}})
+            trace = {
+                'traceEvents': metadata + self._events,
+                'displayTimeUnit': 'ms',
+                'otherData': {
+                    'dropped_events': self.dropped,
+                    'totals': {name: {'count': count, 'seconds': total}
+                               for name, (count, total) in self._totals.items()}
+                }
+            }
+
+        trace_path = self.base_path + '.json'
+        with open(trace_path, 'wt', encoding='utf-8') as f:
+            json.dump(trace, f)
+        return trace_path, profile_path
+
+
+class Profiler:
+    """
+    Opt-in profiling of plugin startup, locator searches and batch runs.
+
+    Profiling is enabled from the plugin settings, or by setting the
+    GOOGLE_MAPS_GEOCODER_PROFILE environment variable to "1" (timing spans
+    only) or "cprofile" (timing spans and cProfile statistics). When disabled,
+    no session is created and spans cost a single None check.
+    """
+
+    SETTINGS_ENABLED = '/plugins/google_maps/profiling_enabled'
+    SETTINGS_CPROFILE = '/plugins/google_maps/profiling_cprofile'
+    SETTINGS_PATH = '/plugins/google_maps/profiling_path'
+
+    ENVIRONMENT_VARIABLE = 'GOOGLE_MAPS_GEOCODER_PROFILE'
+    ENVIRONMENT_CPROFILE = 'cprofile'
+
+    @staticmethod
+    def default_path() -> str:
+        """
+        Returns the default folder for trace files
+        """
+        return os.path.join(QgsApplication.qgisSettingsDirPath(), 'google_maps_geocoder', 'profiles')
+
+    @classmethod
+    def path(cls) -> str:
+        """
+        Returns the folder trace files are written to
+        """
+        return QgsSettings().value(cls.SETTINGS_PATH, '', str) or cls.default_path()
+
+    @classmethod
+    def options(cls) -> Tuple[bool, bool]:
+        """
+        Returns whether profiling is enabled, and whether cProfile statistics
+        should be collected
+        """
+        environment = os.environ.get(cls.ENVIRONMENT_VARIABLE, '').strip().lower()
+        if environment and environment not in ('0', 'false'):
+            return True, environment == cls.ENVIRONMENT_CPROFILE
+
+        settings = QgsSettings()
+        if not settings.value(cls.SETTINGS_ENABLED, False, bool):
+            return False, False
+        return True, settings.value(cls.SETTINGS_CPROFILE, False, bool)
+
+    @classmethod
+    def session(cls, name: str) -> Optional[TraceSession]:
+        """
+        Starts a new trace session, or returns None if profiling is disabled
+        """
+        enabled, profile = cls.options()
+        if not enabled:
+            return None
+        return TraceSession(name, cls.path(), profile)
+
+
+def trace_span(session: Optional[TraceSession], name: str, category: str = '', **args):
+    """
+    Returns a context manager timing a span in a session, which does nothing
+    if the session is None
+    """
+    if session is None:
+        return nullcontext()
+    return session.span(name, category, **args)
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    rate_limiter.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import random
+import threading
+import time
+from typing import Optional
+
+from qgis.core import (
+    QgsFeedback,
+    QgsSettings
+)
+
+
+class RateLimiter:
+    """
+    Process-wide token bucket rate limiter for Google Maps API requests.
+
+    All requests made by the plugin draw from a single shared budget. When
+    the API reports that the query limit has been exceeded, the request rate
+    is halved and all requests are paused for the backoff delay, with the
+    rate then recovering gradually as requests succeed.
+
+    Requests are made with a priority class. Interactive requests (such as
+    locator searches) are granted before any waiting batch requests, and
+    batch requests are limited to a share of the rate so that the remainder
+    is always available for interactive use.
+    """
+
+    SETTINGS_MAX_QPS = '/plugins/google_maps/max_requests_per_second'
+    SETTINGS_MAX_RETRIES = '/plugins/google_maps/max_retries'
+    SETTINGS_INTERACTIVE_SHARE = '/plugins/google_maps/interactive_share'
+
+    DEFAULT_MAX_QPS = 50
+    DEFAULT_MAX_RETRIES = 5
+    # share of the request rate reserved for interactive requests
+    DEFAULT_INTERACTIVE_SHARE = 0.2
+    MAX_INTERACTIVE_SHARE = 0.9
+
+    PRIORITY_INTERACTIVE = 0
+    PRIORITY_BATCH = 1
+
+    # backoff delays, in seconds
+    BASE_DELAY = 0.5
+    MAX_DELAY = 30
+
+    # lowest rate the adaptive backoff will throttle to, in requests per second
+    MIN_RATE = 1
+
+    # granularity of interruptible waits, in seconds
+    POLL_INTERVAL = 0.05
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_rate: float = DEFAULT_MAX_QPS, max_retries: int = DEFAULT_MAX_RETRIES,
+                 interactive_share: float = DEFAULT_INTERACTIVE_SHARE):
+        self._lock = threading.Lock()
+        self.max_rate = 0
+        self.rate = 0
+        self.max_retries = max_retries
+        self.interactive_share = 0
+        self._tokens = 0
+        self._batch_tokens = 0
+        self._interactive_waiting = 0
+        self._last_refill = time.monotonic()
+        self._paused_until = 0
+        self.set_max_rate(max_rate)
+        self.set_interactive_share(interactive_share)
+
+    @classmethod
+    def instance(cls) -> 'RateLimiter':
+        """
+        Returns the shared rate limiter instance
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                settings = QgsSettings()
+                cls._instance = RateLimiter(
+                    settings.value(cls.SETTINGS_MAX_QPS, cls.DEFAULT_MAX_QPS, float),
+                    settings.value(cls.SETTINGS_MAX_RETRIES, cls.DEFAULT_MAX_RETRIES, int),
+                    settings.value(cls.SETTINGS_INTERACTIVE_SHARE, cls.DEFAULT_INTERACTIVE_SHARE, float))
+            return cls._instance
+
+    def set_max_rate(self, max_rate: float):
+        """
+        Sets the maximum number of requests per second. A rate of 0
+        disables rate limiting.
+        """
+        with self._lock:
+            self.max_rate = max_rate
+            self.rate = max_rate
+            self._tokens = min(self._tokens, max(max_rate, 1))
+            self._batch_tokens = min(self._batch_tokens, self._tokens)
+
+    def set_interactive_share(self, share: float):
+        """
+        Sets the share of the request rate reserved for interactive requests,
+        which batch requests may not use
+        """
+        with self._lock:
+            self.interactive_share = min(max(share, 0), self.MAX_INTERACTIVE_SHARE)
+
+    def batch_rate(self) -> float:
+        """
+        Returns the current request rate available to batch requests
+        """
+        return self.rate * (1 - self.interactive_share)
+
+    def _refill(self, now: float):
+        """
+        Adds tokens accumulated since the last refill
+        """
+        # allow bursts of up to one second's worth of requests
+        elapsed = now - self._last_refill
+        self._tokens = min(self._tokens + elapsed * self.rate, max(self.rate, 1))
+        batch_rate = self.batch_rate()
+        self._batch_tokens = min(self._batch_tokens + elapsed * batch_rate, max(batch_rate, 1))
+        self._last_refill = now
+
+    def acquire(self, feedback: Optional[QgsFeedback] = None, priority: int = PRIORITY_BATCH) -> bool:
+        """
+        Blocks until a request with the given priority may be made.
+
+        Returns False if the feedback was canceled while waiting.
+        """
+        waiting = False
+        try:
+            while True:
+                wait = self.try_acquire(priority)
+                if not wait:
+                    return True
+
+                if priority == self.PRIORITY_INTERACTIVE and not waiting:
+                    # hold back batch requests until this request has been granted
+                    waiting = True
+                    with self._lock:
+                        self._interactive_waiting += 1
+
+                if not self.sleep(min(wait, self.POLL_INTERVAL), feedback):
+                    return False
+        finally:
+            if waiting:
+                with self._lock:
+                    self._interactive_waiting -= 1
+
+    def try_acquire(self, priority: int = PRIORITY_BATCH) -> float:
+        """
+        Attempts to acquire permission to make a request with the given
+        priority, without blocking.
+
+        Returns 0 if a request may be made, or otherwise the time in seconds
+        until the next attempt may succeed.
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = self._paused_until - now
+            if wait > 0:
+                return wait
+
+            if not self.rate:
+                return 0
+
+            if priority != self.PRIORITY_INTERACTIVE and self._interactive_waiting:
+                return self.POLL_INTERVAL
+
+            self._refill(now)
+            if priority == self.PRIORITY_INTERACTIVE:
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return 0
+                return (1 - self._tokens) / self.rate
+
+            # batch requests draw from both the shared budget and their own
+            # reduced budget, leaving the reserved share for interactive use
+            if self._tokens >= 1 and self._batch_tokens >= 1:
+                self._tokens -= 1
+                self._batch_tokens -= 1
+                return 0
+            return max((1 - self._tokens) / self.rate, (1 - self._batch_tokens) / self.batch_rate())
+
+    def succeeded(self):
+        """
+        Records a successful request, gradually restoring the request
+        rate after throttling
+        """
+        with self._lock:
+            if self.max_rate and self.rate < self.max_rate:
+                self.rate = min(self.rate + self.max_rate * 0.05, self.max_rate)
+
+    def throttled(self, attempt: int) -> float:
+        """
+        Records a throttled request, halving the request rate and pausing all
+        requests for the backoff delay.
+
+        Returns the backoff delay in seconds.
+        """
+        delay = self.backoff_delay(attempt)
+        with self._lock:
+            if self.max_rate:
+                self.rate = max(self.rate / 2, min(self.MIN_RATE, self.max_rate))
+                self._tokens = 0
+                self._batch_tokens = 0
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        return delay
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Returns the exponential backoff delay (with full jitter) before retrying
+        a request for the given attempt number
+        """
+        return random.uniform(0, min(self.MAX_DELAY, self.BASE_DELAY * 2 ** attempt))
+
+    @classmethod
+    def sleep(cls, seconds: float, feedback: Optional[QgsFeedback] = None) -> bool:
+        """
+        Sleeps for the specified duration, waking early if the feedback
+        is canceled.
+
+        Returns False if the feedback was canceled.
+        """
+        deadline = time.monotonic() + seconds
+        while True:
+            if feedback is not None and feedback.isCanceled():
+                return False
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+
+            time.sleep(min(remaining, cls.POLL_INTERVAL))
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    snap_grid.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import math
+from collections import OrderedDict
+from typing import Tuple
+
+
+class SnapGridCache:
+    """
+    In-memory cache of responses keyed by the grid cell containing a point.
+
+    WGS84 points are snapped to a grid of approximately square cells of a
+    fixed size in metres, so that all points falling within the same cell
+    share a single lookup made at the cell centre. Cells are addressed by
+    integer row and column, so finding the cell for a point is a constant
+    time hash lookup regardless of how many points or cells there are.
+
+    Once the cache holds more than the maximum number of cells, the least
+    recently used cells are discarded.
+    """
+
+    METRES_PER_DEGREE = 111320.0
+    DEFAULT_MAX_CELLS = 1000000
+
+    def __init__(self, cell_size: float, max_cells: int = DEFAULT_MAX_CELLS):
+        """
+        :param cell_size: cell size in metres, or 0 to only share lookups between identical points
+        :param max_cells: maximum number of cells to retain, or 0 for no limit
+        """
+        self.cell_size = cell_size
+        self.cell_degrees = cell_size / self.METRES_PER_DEGREE
+        self.max_cells = max_cells
+        self.hits = 0
+        self.misses = 0
+        self._cells = OrderedDict()
+
+    def cell(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        Returns the (row, column) of the cell containing a WGS84 point
+        """
+        if self.cell_size <= 0:
+            return y, x
+
+        row = math.floor(y / self.cell_degrees)
+        return row, math.floor(x / self.column_degrees(row))
+
+    def column_degrees(self, row: int) -> float:
+        """
+        Returns the width in degrees of the cells in a row, which widen
+        towards the poles so that cells remain approximately square
+        """
+        scale = math.cos(math.radians((row + 0.5) * self.cell_degrees))
+        return min(360.0, self.cell_degrees / max(scale, 1e-9))
+
+    def centre(self, cell: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Returns the WGS84 (x, y) coordinates of the centre of a cell, within
+        the valid longitude and latitude range
+        """
+        row, column = cell
+        if self.cell_size <= 0:
+            return column, row
+
+        # cells next to the antimeridian and the poles extend beyond the valid
+        # coordinate range, so their centres are wrapped and clamped into it
+        x = (column + 0.5) * self.column_degrees(row)
+        y = (row + 0.5) * self.cell_degrees
+        return (x + 180.0) % 360.0 - 180.0, min(max(y, -90.0), 90.0)
+
+    def get(self, cell: Tuple[float, float]):
+        """
+        Returns the cached value for a cell, or None if the cell is not cached
+        """
+        value = self._cells.get(cell)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._cells.move_to_end(cell)
+        return value
+
+    def put(self, cell: Tuple[float, float], value):
+        """
+        Caches the value for a cell
+        """
+        self._cells[cell] = value
+        self._cells.move_to_end(cell)
+        if self.max_cells and len(self._cells) > self.max_cells:
+            self._cells.popitem(last=False)
+
+    def discard(self, cell: Tuple[float, float], value):
+        """
+        Removes the cached value for a cell, if the cell still holds that value
+        """
+        if self._cells.get(cell) is value:
+            del self._cells[cell]
+
+    def __len__(self):
+        return len(self._cells)
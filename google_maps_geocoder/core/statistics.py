@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    statistics.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import json
+import threading
+import time
+
+from qgis.PyQt.QtCore import QCoreApplication
+
+
+class GeocodeStatistics:
+    """
+    Thread-safe counters for geocoding requests.
+
+    Tracks the number of network requests, a histogram of request latency,
+    a breakdown of response statuses, cache hits and misses and offline
+    gazetteer matches.
+    """
+
+    # upper bounds of latency histogram buckets, in milliseconds
+    LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float('inf'))
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = 0
+        self.requests = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.gazetteer_hits = 0
+        self.gazetteer_misses = 0
+        self.statuses = {}
+        self.latency_counts = []
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.reset()
+
+    @classmethod
+    def instance(cls) -> 'GeocodeStatistics':
+        """
+        Returns the shared statistics, covering all requests made in
+        this session
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = GeocodeStatistics()
+            return cls._instance
+
+    @staticmethod
+    def tr(message):
+        """
+        Translates a string
+        """
+        return QCoreApplication.translate('GoogleMapsGeocoder', message)
+
+    def reset(self):
+        """
+        Resets all counters
+        """
+        with self._lock:
+            self.started = time.time()
+            self.requests = 0
+            self.cache_hits = 0
+            self.cache_misses = 0
+            self.gazetteer_hits = 0
+            self.gazetteer_misses = 0
+            self.statuses = {}
+            self.latency_counts = [0] * len(self.LATENCY_BUCKETS_MS)
+            self.total_latency = 0.0
+            self.max_latency = 0.0
+
+    def record_request(self, latency: float, status: str):
+        """
+        Records a completed network request, with its latency in seconds
+        """
+        latency_ms = latency * 1000
+        with self._lock:
+            self.requests += 1
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            self.total_latency += latency_ms
+            self.max_latency = max(self.max_latency, latency_ms)
+            for index, bound in enumerate(self.LATENCY_BUCKETS_MS):
+                if latency_ms <= bound:
+                    self.latency_counts[index] += 1
+                    break
+
+    def record_cache_lookup(self, hit: bool):
+        """
+        Records a cache lookup
+        """
+        with self._lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+    def record_gazetteer_lookup(self, hit: bool):
+        """
+        Records an offline gazetteer lookup
+        """
+        with self._lock:
+            if hit:
+                self.gazetteer_hits += 1
+            else:
+                self.gazetteer_misses += 1
+
+    def merge(self, data: dict):
+        """
+        Adds the counts from statistics exported by another process (see as_dict)
+        """
+        with self._lock:
+            self.requests += data['requests']
+            for status, count in data['statuses'].items():
+                self.statuses[status] = self.statuses.get(status, 0) + count
+            self.cache_hits += data['cache']['hits']
+            self.cache_misses += data['cache']['misses']
+            self.gazetteer_hits += data.get('gazetteer', {}).get('hits', 0)
+            self.gazetteer_misses += data.get('gazetteer', {}).get('misses', 0)
+            self.total_latency += data['latency_ms']['mean'] * data['requests']
+            self.max_latency = max(self.max_latency, data['latency_ms']['max'])
+            for index, bucket in enumerate(data['latency_ms']['histogram']):
+                self.latency_counts[index] += bucket['count']
+
+    def latency_percentile(self, percent: float) -> float:
+        """
+        Returns an estimate of a request latency percentile, in milliseconds,
+        as the upper bound of the histogram bucket containing it
+        """
+        with self._lock:
+            if not self.requests:
+                return 0
+
+            rank = percent / 100 * self.requests
+            cumulative = 0
+            for bound, count in zip(self.LATENCY_BUCKETS_MS, self.latency_counts):
+                cumulative += count
+                if cumulative >= rank:
+                    return min(bound, self.max_latency)
+            return self.max_latency
+
+    def cache_hit_rate(self) -> float:
+        """
+        Returns the fraction of cache lookups which were hits
+        """
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0
+
+    def as_dict(self) -> dict:
+        """
+        Returns the statistics as a JSON serializable dictionary
+        """
+        percentiles = {'p50': self.latency_percentile(50),
+                       'p95': self.latency_percentile(95),
+                       'p99': self.latency_percentile(99)}
+        with self._lock:
+            return {
+                'started': self.started,
+                'duration_seconds': time.time() - self.started,
+                'requests': self.requests,
+                'statuses': dict(self.statuses),
+                'cache': {'hits': self.cache_hits,
+                          'misses': self.cache_misses,
+                          'hit_rate': self.cache_hit_rate()},
+                'gazetteer': {'hits': self.gazetteer_hits,
+                              'misses': self.gazetteer_misses},
+                'latency_ms': dict(percentiles,
+                                   mean=self.total_latency / self.requests if self.requests else 0,
+                                   max=self.max_latency,
+                                   histogram=[{'le': bound if bound != float('inf') else None, 'count': count}
+                                              for bound, count in zip(self.LATENCY_BUCKETS_MS,
+                                                                      self.latency_counts)])
+            }
+
+    def export(self, path: str):
+        """
+        Exports the statistics to a JSON file
+        """
+        with open(path, 'wt', encoding='utf-8') as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+    def summary(self) -> str:
+        """
+        Returns a human readable summary of the statistics
+        """
+        stats = self.as_dict()
+        lines = [
+            self.tr('Requests sent: {}').format(stats['requests']),
+            self.tr('Latency: p50 {:.0f} ms, p95 {:.0f} ms, p99 {:.0f} ms, max {:.0f} ms').format(
+                stats['latency_ms']['p50'], stats['latency_ms']['p95'],
+                stats['latency_ms']['p99'], stats['latency_ms']['max']),
+            self.tr('Cache: {} hits, {} misses ({:.1%} hit rate)').format(
+                stats['cache']['hits'], stats['cache']['misses'], stats['cache']['hit_rate'])
+        ]
+        if stats['gazetteer']['hits'] or stats['gazetteer']['misses']:
+            lines.append(self.tr('Gazetteer: {} matched, {} not matched').format(
+                stats['gazetteer']['hits'], stats['gazetteer']['misses']))
+        if stats['statuses']:
+            lines.append(self.tr('Responses: {}').format(
+                ', '.join('{} {}'.format(status, count) for status, count in sorted(stats['statuses'].items()))))
+        return '\n'.join(lines)
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    locator_filter.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from qgis.core import (
+    QgsCoordinateReferenceSystem,
+    QgsCoordinateTransform,
+    QgsCsException,
+    QgsGeometry,
+    QgsLocatorFilter,
+    QgsLocatorResult,
+    QgsProject,
+    QgsRectangle,
+    QgsSettings
+)
+
+from google_maps_geocoder.core.cache import GeocodeCache
+from google_maps_geocoder.core.geocoder import (
+    GeocodeResponse,
+    GoogleMapsGeocoder
+)
+from google_maps_geocoder.core.history import SearchHistory
+from google_maps_geocoder.core.profiler import (
+    Profiler,
+    trace_span
+)
+from google_maps_geocoder.core.rate_limiter import RateLimiter
+from google_maps_geocoder.gui.gui_utils import GuiUtils
+
+
+class GoogleMapsLocatorFilter(QgsLocatorFilter):
+    """
+    Locator filter for Google Maps address searches.
+
+    The filter is only used with its prefix, so that ordinary locator
+    searches don't consume Google Maps quota. Searches are debounced through
+    the locator's fetch delay, so that no request is made until typing has
+    paused, and queries shorter than the minimum length are ignored. The
+    locator cancels the previous search whenever the query changes, which
+    aborts both pending debounces and in-flight network requests.
+
+    The geocoder is retrieved from a factory callable on first search, so
+    that it need not be constructed until the locator is actually used.
+
+    Optionally, searches are biased towards the visible map extent. The
+    extent is snapped to a coarse tile, and recent responses are kept in
+    memory keyed by the query and tile, so that repeating a search after
+    panning a short distance is answered without a network request.
+
+    Results selected by the user are recorded in the search history, and
+    matching history entries are shown from the first keystroke, before the
+    minimum length is reached and without any network request. Remote
+    results which duplicate a history entry are skipped when they arrive.
+    """
+
+    SETTINGS_DEBOUNCE_MS = '/plugins/google_maps/locator_debounce_ms'
+    SETTINGS_MIN_LENGTH = '/plugins/google_maps/locator_min_length'
+    SETTINGS_EXTENT_BIAS = '/plugins/google_maps/locator_extent_bias'
+
+    DEFAULT_DEBOUNCE_MS = 300
+    DEFAULT_MIN_LENGTH = 3
+    DEFAULT_EXTENT_BIAS = False
+
+    # number of recent responses kept in memory, shared between filter clones
+    RECENT_RESPONSES = 256
+
+    _recent_responses = OrderedDict()
+    _recent_lock = threading.Lock()
+
+    def __init__(self, geocoder_factory, canvas):
+        super().__init__()
+        self.geocoder_factory = geocoder_factory
+        self.canvas = canvas
+
+        settings = QgsSettings()
+        self.debounce_ms = settings.value(self.SETTINGS_DEBOUNCE_MS, self.DEFAULT_DEBOUNCE_MS, int)
+        self.min_length = settings.value(self.SETTINGS_MIN_LENGTH, self.DEFAULT_MIN_LENGTH, int)
+        self.extent_bias = settings.value(self.SETTINGS_EXTENT_BIAS, self.DEFAULT_EXTENT_BIAS, bool)
+
+        self.setUseWithoutPrefix(False)
+        try:
+            self.setFetchResultsDelay(self.debounce_ms)
+            self.native_debounce = True
+        except AttributeError:
+            # QGIS < 3.18, the delay is applied in fetchResults instead
+            self.native_debounce = False
+
+    def clone(self):  # pylint: disable=missing-function-docstring
+        return GoogleMapsLocatorFilter(self.geocoder_factory, self.canvas)
+
+    def name(self):  # pylint: disable=missing-function-docstring
+        return 'Google'
+
+    def displayName(self):  # pylint: disable=missing-function-docstring
+        return 'Google'
+
+    def prefix(self):  # pylint: disable=missing-function-docstring
+        return 'addr'
+
+    def fetchResults(self, string, context, feedback):  # pylint: disable=missing-function-docstring
+        trace = Profiler.session('locator')
+        try:
+            with trace_span(trace, 'fetchResults', 'locator', query=string):
+                self.fetch(string.strip(), context, feedback, trace)
+        finally:
+            if trace is not None:
+                trace.finish()
+
+    def fetch(self, string: str, context, feedback, trace):
+        """
+        Searches for a query, emitting the history and Google Maps results
+        """
+        # previously selected results are local, so show them regardless of the query length
+        with trace_span(trace, 'history', 'locator'):
+            shown = self.fetch_history_results(string) if string else set()
+        if len(string) < self.min_length:
+            return
+
+        if not self.native_debounce:
+            # wait for typing to pause -- if the query changes in the meantime
+            # this search is canceled before any request is made
+            with trace_span(trace, 'debounce', 'locator'):
+                if not RateLimiter.sleep(self.debounce_ms / 1000, feedback):
+                    return
+
+        geocoder = self.geocoder_factory()
+        bounds = self.extent_bounds(context) if self.extent_bias else QgsRectangle()
+        key = GeocodeCache.key(string, geocoder.region, GoogleMapsGeocoder.bounds_key(bounds))
+        response = self.recent_response(key)
+        if response is None:
+            with trace_span(trace, 'geocode', 'locator'):
+                response = geocoder.geocode(string, bounds, feedback)
+            if response.is_valid():
+                self.store_recent_response(key, response)
+
+        with trace_span(trace, 'convert results', 'locator'):
+            results = geocoder.to_results(response)
+        for result in results:
+            if feedback.isCanceled():
+                return
+
+            if not result.isValid() or GeocodeCache.normalize_address(result.identifier()) in shown:
+                continue
+
+            viewport = result.viewport()
+            user_data = {
+                'geometry': result.geometry().asWkt(),
+                'crs': result.crs().authid(),
+                'viewport': None if viewport.isNull() else [viewport.xMinimum(), viewport.yMinimum(),
+                                                            viewport.xMaximum(), viewport.yMaximum()]
+            }
+
+            self.emit_result(result.identifier(), result.description(), result.group(), user_data)
+
+    def fetch_history_results(self, string: str) -> set:
+        """
+        Emits the search history entries matching a query, returning the
+        normalized display strings of the emitted results
+        """
+        history = SearchHistory.instance()
+        if history is None:
+            return set()
+
+        shown = set()
+        for entry in history.search(string):
+            self.emit_result(entry.display, entry.description, entry.group, entry.user_data)
+            shown.add(GeocodeCache.normalize_address(entry.display))
+        return shown
+
+    def emit_result(self, display: str, description: str, group: str, user_data: dict):
+        """
+        Emits a locator result
+        """
+        locator_result = QgsLocatorResult(self, display)
+        self.set_user_data(locator_result, user_data)
+        locator_result.description = description
+        locator_result.group = group
+        locator_result.icon = GuiUtils.get_icon('icon.svg')
+        self.resultFetched.emit(locator_result)
+
+    def triggerResult(self, result):  # pylint: disable=missing-function-docstring
+        user_data = self.user_data(result)
+        geometry = QgsGeometry.fromWkt(user_data['geometry'])
+        transform = QgsCoordinateTransform(QgsCoordinateReferenceSystem(user_data['crs']),
+                                           self.canvas.mapSettings().destinationCrs(),
+                                           QgsProject.instance())
+        try:
+            geometry.transform(transform)
+            if user_data['viewport']:
+                rect = transform.transformBoundingBox(QgsRectangle(*user_data['viewport']))
+            else:
+                rect = geometry.boundingBox()
+            self.canvas.zoomToFeatureExtent(rect)
+        except QgsCsException:
+            return
+
+        self.canvas.flashGeometries([geometry])
+
+        history = SearchHistory.instance()
+        if history is not None:
+            history.record(result.displayString, result.description, result.group, user_data)
+
+    @staticmethod
+    def extent_bounds(context) -> QgsRectangle:
+        """
+        Returns the tiled WGS84 bounds bias for the locator context's map extent
+        """
+        if context.targetExtent.isEmpty():
+            return QgsRectangle()
+
+        transform = QgsCoordinateTransform(context.targetExtentCrs,
+                                           QgsCoordinateReferenceSystem('EPSG:4326'),
+                                           context.transformContext)
+        try:
+            extent = transform.transformBoundingBox(context.targetExtent)
+        except QgsCsException:
+            return QgsRectangle()
+
+        return GoogleMapsGeocoder.tile_bounds(extent)
+
+    @classmethod
+    def recent_response(cls, key: str) -> Optional[GeocodeResponse]:
+        """
+        Returns a recent response for a cache key, or None if there is none
+        """
+        with cls._recent_lock:
+            response = cls._recent_responses.get(key)
+            if response is not None:
+                cls._recent_responses.move_to_end(key)
+            return response
+
+    @classmethod
+    def store_recent_response(cls, key: str, response: GeocodeResponse):
+        """
+        Stores a recent response for a cache key
+        """
+        with cls._recent_lock:
+            cls._recent_responses[key] = response
+            cls._recent_responses.move_to_end(key)
+            if len(cls._recent_responses) > cls.RECENT_RESPONSES:
+                cls._recent_responses.popitem(last=False)
+
+    @classmethod
+    def clear_recent_responses(cls):
+        """
+        Discards all recent responses
+        """
+        with cls._recent_lock:
+            cls._recent_responses.clear()
+
+    @staticmethod
+    def set_user_data(result: QgsLocatorResult, user_data: dict):
+        """
+        Sets the user data for a locator result
+        """
+        try:
+            result.setUserData(user_data)
+        except AttributeError:
+            # QGIS < 3.34
+            result.userData = user_data
+
+    @staticmethod
+    def user_data(result: QgsLocatorResult) -> dict:
+        """
+        Returns the user data for a locator result
+        """
+        if callable(result.userData):
+            return result.userData()
+        return result.userData
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    options_page.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+from qgis.PyQt import uic
+from qgis.PyQt.QtCore import QTimer
+from qgis.PyQt.QtWidgets import QFileDialog
+
+from qgis.core import QgsSettings
+from qgis.gui import QgsOptionsPageWidget
+
+from google_maps_geocoder.core.cache import GeocodeCache
+from google_maps_geocoder.core.gazetteer import Gazetteer
+from google_maps_geocoder.core.history import SearchHistory
+from google_maps_geocoder.core.profiler import Profiler
+from google_maps_geocoder.core.rate_limiter import RateLimiter
+from google_maps_geocoder.core.statistics import GeocodeStatistics
+from google_maps_geocoder.gui.locator_filter import GoogleMapsLocatorFilter
+from google_maps_geocoder.gui_utils import GuiUtils
+
+
+class GoogleMapsOptionsPage(QgsOptionsPageWidget):
+    """
+    Google Maps options widget
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # the UI is only compiled when the options dialog is first opened
+        uic.loadUi(GuiUtils.get_ui_path('settings.ui'), self)
+        self.setObjectName('GoogleMapsOptions')
+
+        self.plugin = None
+
+        self.clear_cache_button.clicked.connect(self.clear_cache)
+        self.clear_history_button.clicked.connect(self.clear_history)
+        self.history_check.toggled.connect(self.history_size_spin.setEnabled)
+        self.gazetteer_browse_button.clicked.connect(self.browse_gazetteer)
+        self.reset_statistics_button.clicked.connect(self.reset_statistics)
+        self.export_statistics_button.clicked.connect(self.export_statistics)
+
+        # the statistics are only refreshed while the page is visible
+        self.statistics_timer = QTimer(self)
+        self.statistics_timer.setInterval(1000)
+        self.statistics_timer.timeout.connect(self.update_statistics)
+
+    def showEvent(self, event):  # pylint: disable=missing-function-docstring
+        super().showEvent(event)
+        self.update_statistics()
+        self.statistics_timer.start()
+
+    def hideEvent(self, event):  # pylint: disable=missing-function-docstring
+        self.statistics_timer.stop()
+        super().hideEvent(event)
+
+    def set_plugin(self, plugin):
+        self.plugin = plugin
+        self.api_key_line_edit.setText(plugin.api_key)
+
+        self.region_combo.addItem('', '')
+        for code, name in plugin.region_codes.items():
+            self.region_combo.addItem(name, code)
+
+        self.region_combo.setCurrentIndex(self.region_combo.findData(plugin.region))
+
+        settings = QgsSettings()
+        self.debounce_spin.setValue(settings.value(GoogleMapsLocatorFilter.SETTINGS_DEBOUNCE_MS,
+                                                   GoogleMapsLocatorFilter.DEFAULT_DEBOUNCE_MS, int))
+        self.min_length_spin.setValue(settings.value(GoogleMapsLocatorFilter.SETTINGS_MIN_LENGTH,
+                                                     GoogleMapsLocatorFilter.DEFAULT_MIN_LENGTH, int))
+        self.extent_bias_check.setChecked(settings.value(GoogleMapsLocatorFilter.SETTINGS_EXTENT_BIAS,
+                                                         GoogleMapsLocatorFilter.DEFAULT_EXTENT_BIAS, bool))
+        self.history_check.setChecked(settings.value(SearchHistory.SETTINGS_ENABLED, True, bool))
+        self.history_size_spin.setValue(
+            settings.value(SearchHistory.SETTINGS_MAX_ENTRIES, SearchHistory.DEFAULT_MAX_ENTRIES, int))
+        self.history_size_spin.setEnabled(self.history_check.isChecked())
+
+        limiter = RateLimiter.instance()
+        self.max_qps_spin.setValue(limiter.max_rate)
+        self.max_retries_spin.setValue(limiter.max_retries)
+        self.interactive_share_spin.setValue(round(limiter.interactive_share * 100))
+
+        self.cache_group_box.setChecked(settings.value(GeocodeCache.SETTINGS_ENABLED, True, bool))
+        self.cache_ttl_spin.setValue(
+            settings.value(GeocodeCache.SETTINGS_TTL_DAYS, GeocodeCache.DEFAULT_TTL_DAYS, int))
+        self.cache_size_spin.setValue(
+            settings.value(GeocodeCache.SETTINGS_MAX_ENTRIES, GeocodeCache.DEFAULT_MAX_ENTRIES, int))
+        self.update_cache_count()
+
+        self.gazetteer_path_edit.setText(settings.value(Gazetteer.SETTINGS_PATH, '', str))
+        self.gazetteer_confidence_spin.setValue(
+            settings.value(Gazetteer.SETTINGS_MIN_CONFIDENCE, Gazetteer.DEFAULT_MIN_CONFIDENCE, float))
+        self.update_gazetteer_count()
+
+        self.profiling_group_box.setChecked(settings.value(Profiler.SETTINGS_ENABLED, False, bool))
+        self.cprofile_check.setChecked(settings.value(Profiler.SETTINGS_CPROFILE, False, bool))
+        self.profiling_path_label.setText(self.tr('Trace files are written to {}').format(Profiler.path()))
+
+    def update_cache_count(self):
+        """
+        Updates the label showing the number of cached results
+        """
+        cache = GeocodeCache.instance()
+        count = cache.entry_count() if cache is not None else 0
+        self.cache_count_label.setText(self.tr('{} cached results').format(count))
+
+    def clear_cache(self):
+        """
+        Removes all stored results from the cache
+        """
+        cache = GeocodeCache.instance()
+        if cache is not None:
+            cache.clear()
+        GoogleMapsLocatorFilter.clear_recent_responses()
+        self.update_cache_count()
+
+    def clear_history(self):
+        """
+        Removes all previously selected results from the search history
+        """
+        history = SearchHistory.instance()
+        if history is not None:
+            history.clear()
+
+    def update_gazetteer_count(self):
+        """
+        Updates the label showing the number of addresses in the gazetteer
+        """
+        gazetteer = Gazetteer.instance()
+        if gazetteer is None:
+            self.gazetteer_count_label.setText(self.tr('Build a gazetteer with the "Build offline gazetteer" '
+                                                       'Processing algorithm'))
+        else:
+            self.gazetteer_count_label.setText(self.tr('{} addresses').format(gazetteer.entry_count()))
+
+    def browse_gazetteer(self):
+        """
+        Selects an existing gazetteer database
+        """
+        path, _ = QFileDialog.getOpenFileName(self, self.tr('Select Gazetteer'), self.gazetteer_path_edit.text(),
+                                              self.tr('SQLite files (*.sqlite)'))
+        if path:
+            self.gazetteer_path_edit.setText(path)
+
+    def update_statistics(self):
+        """
+        Updates the request statistics panel
+        """
+        self.statistics_text.setPlainText(GeocodeStatistics.instance().summary())
+
+    def reset_statistics(self):
+        """
+        Resets the request statistics
+        """
+        GeocodeStatistics.instance().reset()
+        self.update_statistics()
+
+    def export_statistics(self):
+        """
+        Exports the request statistics to a JSON file
+        """
+        path, _ = QFileDialog.getSaveFileName(self, self.tr('Export Statistics'), '',
+                                              self.tr('JSON files (*.json)'))
+        if path:
+            GeocodeStatistics.instance().export(path)
+
+    def apply(self):
+        """
+        Applies the new settings
+        """
+        self.plugin.set_api_key(self.api_key_line_edit.text())
+        self.plugin.set_region(self.region_combo.currentData())
+        self.plugin.set_locator_settings(self.debounce_spin.value(),
+                                         self.min_length_spin.value(),
+                                         self.extent_bias_check.isChecked())
+        self.plugin.set_history_settings(self.history_check.isChecked(),
+                                         self.history_size_spin.value())
+        self.plugin.set_request_limits(self.max_qps_spin.value(),
+                                       self.max_retries_spin.value(),
+                                       self.interactive_share_spin.value() / 100)
+        self.plugin.set_cache_settings(self.cache_group_box.isChecked(),
+                                       self.cache_ttl_spin.value(),
+                                       self.cache_size_spin.value())
+        self.plugin.set_gazetteer_settings(self.gazetteer_path_edit.text(),
+                                           self.gazetteer_confidence_spin.value())
+        self.plugin.set_profiling_settings(self.profiling_group_box.isChecked(),
+                                           self.cprofile_check.isChecked())
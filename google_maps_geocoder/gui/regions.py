@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    regions.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+from qgis.PyQt.QtCore import QT_TRANSLATE_NOOP
+
+# Region codes supported by the Google Maps API, with their untranslated names.
+# Names are only translated when the region list is first shown.
+REGION_CODES = {
+    "ac": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Ascension Island"),
+    "ad": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Andorra"),
+    "ae": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "United Arab Emirates"),
+    "af": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Afghanistan"),
+    "ag": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Antigua and Barbuda"),
+    "ai": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Anguilla"),
+    "al": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Albania"),
+    "am": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Armenia"),
+    "an": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Netherlands Antilles"),
+    "ao": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Angola"),
+    "aq": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Antarctica"),
+    "ar": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Argentina"),
+    "as": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "American Samoa"),
+    "at": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Austria"),
+    "au": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Australia"),
+    "aw": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Aruba"),
+    "ax": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Aland Islands"),
+    "az": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Azerbaijan"),
+    "ba": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Bosnia and Herzegovina"),
+    "bb": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Barbados"),
+    "bd": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Bangladesh"),
+    "be": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Belgium"),
+    "bf": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Burkina Faso"),
+    "bg": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Bulgaria"),
+    "bh": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Bahrain"),
+    "bi": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Burundi"),
+    "bj": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Benin"),
+    "bm": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Bermuda"),
+    "bn": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Brunei Darussalam"),
+    "bo": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Bolivia"),
+    "br": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Brazil"),
+    "bs": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Bahamas"),
+    "bt": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Bhutan"),
+    "bv": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Bouvet Island"),
+    "bw": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Botswana"),
+    "by": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Belarus"),
+    "bz": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Belize"),
+    "ca": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Canada"),
+    "cc": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Cocos (Keeling) Islands"),
+    "cd": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Congo, The Democratic Republic of the"),
+    "cf": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Central African Republic"),
+    "cg": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Congo, Republic of"),
+    "ch": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Switzerland"),
+    "ci": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Cote d'Ivoire"),
+    "ck": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Cook Islands"),
+    "cl": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Chile"),
+    "cm": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Cameroon"),
+    "cn": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "China"),
+    "co": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Colombia"),
+    "cr": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Costa Rica"),
+    "cu": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Cuba"),
+    "cv": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Cape Verde"),
+    "cx": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Christmas Island"),
+    "cy": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Cyprus"),
+    "cz": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Czech Republic"),
+    "de": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Germany"),
+    "dj": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Djibouti"),
+    "dk": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Denmark"),
+    "dm": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Dominica"),
+    "do": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Dominican Republic"),
+    "dz": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Algeria"),
+    "ec": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Ecuador"),
+    "ee": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Estonia"),
+    "eg": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Egypt"),
+    "eh": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Western Sahara"),
+    "er": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Eritrea"),
+    "es": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Spain"),
+    "et": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Ethiopia"),
+    "eu": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "European Union"),
+    "fi": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Finland"),
+    "fj": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Fiji"),
+    "fk": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Falkland Islands (Malvinas)"),
+    "fm": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Micronesia, Federated States of"),
+    "fo": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Faroe Islands"),
+    "fr": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "France"),
+    "ga": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Gabon"),
+    "gb": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "United Kingdom"),
+    "gd": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Grenada"),
+    "ge": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Georgia"),
+    "gf": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "French Guiana"),
+    "gg": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Guernsey"),
+    "gh": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Ghana"),
+    "gi": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Gibraltar"),
+    "gl": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Greenland"),
+    "gm": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Gambia"),
+    "gn": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Guinea"),
+    "gp": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Guadeloupe"),
+    "gq": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Equatorial Guinea"),
+    "gr": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Greece"),
+    "gs": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "South Georgia and the South Sandwich Islands"),
+    "gt": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Guatemala"),
+    "gu": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Guam"),
+    "gw": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Guinea-Bissau"),
+    "gy": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Guyana"),
+    "hk": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Hong Kong"),
+    "hm": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Heard and McDonald Islands"),
+    "hn": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Honduras"),
+    "hr": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Croatia/Hrvatska"),
+    "ht": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Haiti"),
+    "hu": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Hungary"),
+    "id": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Indonesia"),
+    "ie": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Ireland"),
+    "il": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Israel"),
+    "im": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Isle of Man"),
+    "in": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "India"),
+    "io": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "British Indian Ocean Territory"),
+    "iq": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Iraq"),
+    "ir": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Iran, Islamic Republic of"),
+    "is": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Iceland"),
+    "it": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Italy"),
+    "je": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Jersey"),
+    "jm": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Jamaica"),
+    "jo": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Jordan"),
+    "jp": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Japan"),
+    "ke": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Kenya"),
+    "kg": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Kyrgyzstan"),
+    "kh": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Cambodia"),
+    "ki": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Kiribati"),
+    "km": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Comoros"),
+    "kn": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Saint Kitts and Nevis"),
+    "kp": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Korea, Democratic People's Republic"),
+    "kr": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Korea, Republic of"),
+    "kw": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Kuwait"),
+    "ky": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Cayman Islands"),
+    "kz": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Kazakhstan"),
+    "la": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Lao People's Democratic Republic"),
+    "lb": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Lebanon"),
+    "lc": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Saint Lucia"),
+    "li": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Liechtenstein"),
+    "lk": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Sri Lanka"),
+    "lr": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Liberia"),
+    "ls": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Lesotho"),
+    "lt": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Lithuania"),
+    "lu": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Luxembourg"),
+    "lv": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Latvia"),
+    "ly": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Libyan Arab Jamahiriya"),
+    "ma": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Morocco"),
+    "mc": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Monaco"),
+    "md": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Moldova, Republic of"),
+    "me": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Montenegro"),
+    "mg": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Madagascar"),
+    "mh": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Marshall Islands"),
+    "mk": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Macedonia, The Former Yugoslav Republic of"),
+    "ml": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Mali"),
+    "mm": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Myanmar"),
+    "mn": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Mongolia"),
+    "mo": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Macao"),
+    "mp": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Northern Mariana Islands"),
+    "mq": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Martinique"),
+    "mr": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Mauritania"),
+    "ms": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Montserrat"),
+    "mt": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Malta"),
+    "mu": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Mauritius"),
+    "mv": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Maldives"),
+    "mw": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Malawi"),
+    "mx": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Mexico"),
+    "my": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Malaysia"),
+    "mz": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Mozambique"),
+    "na": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Namibia"),
+    "nc": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "New Caledonia"),
+    "ne": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Niger"),
+    "nf": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Norfolk Island"),
+    "ng": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Nigeria"),
+    "ni": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Nicaragua"),
+    "nl": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Netherlands"),
+    "no": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Norway"),
+    "np": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Nepal"),
+    "nr": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Nauru"),
+    "nu": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Niue"),
+    "nz": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "New Zealand"),
+    "om": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Oman"),
+    "pa": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Panama"),
+    "pe": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Peru"),
+    "pf": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "French Polynesia"),
+    "pg": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Papua New Guinea"),
+    "ph": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Philippines"),
+    "pk": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Pakistan"),
+    "pl": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Poland"),
+    "pm": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Saint Pierre and Miquelon"),
+    "pn": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Pitcairn Island"),
+    "pr": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Puerto Rico"),
+    "ps": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Palestinian Territory, Occupied"),
+    "pt": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Portugal"),
+    "pw": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Palau"),
+    "py": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Paraguay"),
+    "qa": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Qatar"),
+    "re": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Reunion Island"),
+    "ro": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Romania"),
+    "rs": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Serbia"),
+    "ru": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Russian Federation"),
+    "rw": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Rwanda"),
+    "sa": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Saudi Arabia"),
+    "sb": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Solomon Islands"),
+    "sc": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Seychelles"),
+    "sd": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Sudan"),
+    "se": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Sweden"),
+    "sg": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Singapore"),
+    "sh": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Saint Helena"),
+    "si": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Slovenia"),
+    "sj": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Svalbard and Jan Mayen Islands"),
+    "sk": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Slovak Republic"),
+    "sl": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Sierra Leone"),
+    "sm": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "San Marino"),
+    "sn": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Senegal"),
+    "so": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Somalia"),
+    "sr": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Suriname"),
+    "st": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Sao Tome and Principe"),
+    "su": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Soviet Union (being phased out)"),
+    "sv": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "El Salvador"),
+    "sy": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Syrian Arab Republic"),
+    "sz": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Swaziland"),
+    "tc": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Turks and Caicos Islands"),
+    "td": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Chad"),
+    "tf": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "French Southern Territories"),
+    "tg": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Togo"),
+    "th": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Thailand"),
+    "tj": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Tajikistan"),
+    "tk": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Tokelau"),
+    "tl": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Timor-Leste"),
+    "tm": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Turkmenistan"),
+    "tn": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Tunisia"),
+    "to": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Tonga"),
+    "tp": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "East Timor"),
+    "tr": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Turkey"),
+    "tt": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Trinidad and Tobago"),
+    "tv": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Tuvalu"),
+    "tw": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Taiwan"),
+    "tz": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Tanzania"),
+    "ua": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Ukraine"),
+    "ug": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Uganda"),
+    "uk": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "United Kingdom"),
+    "um": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "United States Minor Outlying Islands"),
+    "us": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "United States"),
+    "uy": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Uruguay"),
+    "uz": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Uzbekistan"),
+    "va": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Holy See (Vatican City State)"),
+    "vc": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Saint Vincent and the Grenadines"),
+    "ve": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Venezuela"),
+    "vg": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Virgin Islands, British"),
+    "vi": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Virgin Islands, U.S."),
+    "vn": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Vietnam"),
+    "vu": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Vanuatu"),
+    "wf": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Wallis and Futuna Islands"),
+    "ws": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Samoa"),
+    "ye": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Yemen"),
+    "yt": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Mayotte"),
+    "yu": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Yugoslavia"),
+    "za": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "South Africa"),
+    "zm": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Zambia"),
+    "zw": QT_TRANSLATE_NOOP('GoogleMapsGeocoder', "Zimbabwe"),
+}
@@ -11,17 +11,172 @@
 ***************************************************************************
 """
 
+import hashlib
+import json
+import os
+from collections import (
+    Counter,
+    deque
+)
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor
+)
+from itertools import islice
+from typing import Optional
+
+from qgis.PyQt.QtCore import (
+    QCoreApplication,
+    QVariant
+)
 from qgis.analysis import QgsBatchGeocodeAlgorithm
-from qgis.core import QgsGoogleMapsGeocoder
+from qgis.core import (
+    NULL,
+    QgsCoordinateReferenceSystem,
+    QgsCoordinateTransform,
+    QgsCsException,
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsField,
+    QgsFields,
+    QgsFeatureSink,
+    QgsProcessing,
+    QgsProcessingException,
+    QgsProcessingFeatureSource,
+    QgsProcessingParameterBoolean,
+    QgsProcessingParameterDefinition,
+    QgsProcessingParameterEnum,
+    QgsProcessingParameterFeatureSink,
+    QgsProcessingParameterFeatureSource,
+    QgsProcessingParameterFileDestination,
+    QgsProcessingParameterNumber,
+    QgsProcessingParameterString,
+    QgsProcessingUtils,
+    QgsRectangle,
+    QgsVectorLayer,
+    QgsWkbTypes
+)
+
+from google_maps_geocoder.core.address import canonical_address
+from google_maps_geocoder.core.async_transport import AsyncGeocodeTransport
+from google_maps_geocoder.core.config import GoogleMapsConfig
+from google_maps_geocoder.core.geocoder import (
+    GeocodeResponse,
+    GoogleMapsGeocoder,
+    ResultRecord
+)
+from google_maps_geocoder.core.journal import GeocodeJournal
+from google_maps_geocoder.core.profiler import (
+    Profiler,
+    trace_span
+)
+from google_maps_geocoder.core.rate_limiter import RateLimiter
+from google_maps_geocoder.processing.progress import BatchProgress
+from google_maps_geocoder.processing.sharding import (
+    ShardWorkers,
+    parse_range,
+    read_feature_ids,
+    shard_request,
+    split_feature_ids,
+    write_feature_ids
+)
+
+
+class PreviousResult(ResultRecord):
+    """
+    A geocoded result copied forward from a previous output layer
+    """
+
+    __slots__ = ()
 
 
 class GoogleMapsBatchGeocode(QgsBatchGeocodeAlgorithm):
+    CONCURRENT_REQUESTS = 'CONCURRENT_REQUESTS'
+    DEDUPLICATE = 'DEDUPLICATE'
+    RESUME = 'RESUME'
+    CHUNK_SIZE = 'CHUNK_SIZE'
+    STATISTICS = 'STATISTICS'
+    INCREMENTAL = 'INCREMENTAL'
+    PREVIOUS_OUTPUT = 'PREVIOUS_OUTPUT'
+    WORKERS = 'WORKERS'
+    TRANSPORT = 'TRANSPORT'
+    MAX_IN_FLIGHT = 'MAX_IN_FLIGHT'
+    SHARD_RANGE = 'SHARD_RANGE'
+    SHARD_FIDS = 'SHARD_FIDS'
+    SHARD_MAX_QPS = 'SHARD_MAX_QPS'
+    RESULT_FIELDS = 'RESULT_FIELDS'
+    DROP_RAW_RESPONSES = 'DROP_RAW_RESPONSES'
+    FAILURES = 'FAILURES'
+
+    # output field storing the hash of the geocoded address, for incremental runs
+    HASH_FIELD = 'geocode_hash'
+
+    # fields identifying the input feature and the failure, for the failures
+    # output. When failures are captured the source feature ID is also added
+    # to the main output, so that retried results can be patched back into it.
+    SOURCE_FID_FIELD = 'source_fid'
+    FAILURE_REASON_FIELD = 'failure_reason'
+    FAILURE_STATUS_FIELD = 'failure_status'
+    ATTEMPTS_FIELD = 'attempts'
 
-    def __init__(self, api_key, region):
-        self.api_key = api_key
-        self.region = region
-        self.coder = QgsGoogleMapsGeocoder(api_key, self.region)
-        QgsBatchGeocodeAlgorithm.__init__(self, self.coder)
+    # number of pending requests to queue per concurrent request
+    QUEUE_FACTOR = 4
+
+    TRANSPORT_THREADS = 0
+    TRANSPORT_ASYNC = 1
+
+    # geocoder given to the base class, which is only used for the output
+    # fields and geometry type, and so is shared by every instance
+    _base_geocoder = None
+
+    def __init__(self):
+        # each run uses the configuration current when its instance is created,
+        # but its geocoder is only created once it is needed
+        self.config_values = GoogleMapsConfig.instance().values()
+        self.region = self.config_values[1]
+        self._coder = None
+        if GoogleMapsBatchGeocode._base_geocoder is None:
+            GoogleMapsBatchGeocode._base_geocoder = GoogleMapsGeocoder()
+        QgsBatchGeocodeAlgorithm.__init__(self, GoogleMapsBatchGeocode._base_geocoder)
+
+        self.address_index = -1
+        self.concurrent_requests = 1
+        self.max_in_flight = 1
+        self.transport_type = self.TRANSPORT_ASYNC
+        self.window_size = self.QUEUE_FACTOR
+        self.dedupe = False
+        self.resume = False
+        self.incremental = False
+        self.previous_results = {}
+        self.copied_count = 0
+        self.shard_range = None
+        self.shard_fids = None
+        self.result_fields = None
+        self.result_field_names = []
+        self.drop_raw_responses = True
+        self.sink = None
+        self.failures_sink = None
+        self.failure_fields = None
+        self.journal = None
+        self.executor = None
+        self.transport = None
+        self.responses = {}
+        # features with an address queued while deduplicating, and the number
+        # of those which did not share an earlier feature's response
+        self.deduplicated_features = 0
+        self.unique_addresses = 0
+        self.pending = deque()
+        self.progress = None
+        self.trace = None
+
+    @property
+    def coder(self) -> GoogleMapsGeocoder:
+        """
+        Returns the geocoder used for this run, creating it on first use
+        """
+        if self._coder is None:
+            self._coder = GoogleMapsGeocoder(*self.config_values)
+        return self._coder
 
     def groupId(self):
         return None
@@ -36,4 +191,689 @@ class GoogleMapsBatchGeocode(QgsBatchGeocodeAlgorithm):
         return 'Google Maps batch geocoder'
 
     def createInstance(self):
-        return GoogleMapsBatchGeocode(self.api_key, self.region)
+        return GoogleMapsBatchGeocode()
+
+    @staticmethod
+    def tr(string):
+        """
+        Translates a string
+        """
+        return QCoreApplication.translate('GoogleMaps', string)
+
+    def initParameters(self, configuration=None):  # pylint: disable=missing-function-docstring
+        super().initParameters(configuration or {})
+
+        self.addParameter(QgsProcessingParameterBoolean(self.RESUME,
+                                                        self.tr('Resume previously interrupted run'),
+                                                        defaultValue=False))
+
+        self.addParameter(QgsProcessingParameterBoolean(self.INCREMENTAL,
+                                                        self.tr('Store address hashes for incremental updates'),
+                                                        defaultValue=False))
+        self.addParameter(QgsProcessingParameterFeatureSource(self.PREVIOUS_OUTPUT,
+                                                              self.tr('Previous output, to copy unchanged '
+                                                                      'results from (incremental updates only)'),
+                                                              optional=True))
+
+        field_names = [field.name() for field in GoogleMapsGeocoder.result_fields()]
+        result_fields_param = QgsProcessingParameterEnum(self.RESULT_FIELDS,
+                                                         self.tr('Result fields to include'),
+                                                         field_names,
+                                                         allowMultiple=True,
+                                                         defaultValue=list(range(len(field_names))),
+                                                         optional=True)
+        result_fields_param.setFlags(result_fields_param.flags() | QgsProcessingParameterDefinition.FlagAdvanced)
+        self.addParameter(result_fields_param)
+
+        drop_raw_param = QgsProcessingParameterBoolean(self.DROP_RAW_RESPONSES,
+                                                       self.tr('Discard raw API responses once results are extracted'),
+                                                       defaultValue=True)
+        drop_raw_param.setFlags(drop_raw_param.flags() | QgsProcessingParameterDefinition.FlagAdvanced)
+        self.addParameter(drop_raw_param)
+
+        transport_param = QgsProcessingParameterEnum(self.TRANSPORT,
+                                                     self.tr('Request transport'),
+                                                     [self.tr('Thread pool'),
+                                                      self.tr('Asynchronous (single thread)')],
+                                                     defaultValue=self.TRANSPORT_ASYNC)
+        transport_param.setFlags(transport_param.flags() | QgsProcessingParameterDefinition.FlagAdvanced)
+        self.addParameter(transport_param)
+
+        in_flight_param = QgsProcessingParameterNumber(self.MAX_IN_FLIGHT,
+                                                       self.tr('Maximum requests in flight (asynchronous transport)'),
+                                                       QgsProcessingParameterNumber.Integer,
+                                                       defaultValue=16, minValue=1, maxValue=256)
+        in_flight_param.setFlags(in_flight_param.flags() | QgsProcessingParameterDefinition.FlagAdvanced)
+        self.addParameter(in_flight_param)
+
+        concurrent_param = QgsProcessingParameterNumber(self.CONCURRENT_REQUESTS,
+                                                        self.tr('Concurrent requests (thread pool transport)'),
+                                                        QgsProcessingParameterNumber.Integer,
+                                                        defaultValue=1, minValue=1, maxValue=64)
+        concurrent_param.setFlags(concurrent_param.flags() | QgsProcessingParameterDefinition.FlagAdvanced)
+        self.addParameter(concurrent_param)
+
+        dedupe_param = QgsProcessingParameterBoolean(self.DEDUPLICATE,
+                                                     self.tr('Geocode each unique address only once'),
+                                                     defaultValue=True)
+        dedupe_param.setHelp(self.tr('Features with the same address share a single request. When processing in '
+                                     'chunks, addresses are only shared between features in the same chunk.'))
+        dedupe_param.setFlags(dedupe_param.flags() | QgsProcessingParameterDefinition.FlagAdvanced)
+        self.addParameter(dedupe_param)
+
+        chunk_param = QgsProcessingParameterNumber(self.CHUNK_SIZE,
+                                                   self.tr('Process features in chunks of (0 to disable)'),
+                                                   QgsProcessingParameterNumber.Integer,
+                                                   defaultValue=0, minValue=0)
+        chunk_param.setHelp(self.tr('Limits memory use by writing and releasing each chunk of results before the '
+                                    'next is read. Deduplication only applies within each chunk.'))
+        chunk_param.setFlags(chunk_param.flags() | QgsProcessingParameterDefinition.FlagAdvanced)
+        self.addParameter(chunk_param)
+
+        self.addParameter(QgsProcessingParameterFeatureSink(self.FAILURES,
+                                                            self.tr('Failed features'),
+                                                            QgsProcessing.TypeVector,
+                                                            optional=True,
+                                                            createByDefault=False))
+
+        statistics_param = QgsProcessingParameterFileDestination(self.STATISTICS,
+                                                                 self.tr('Request statistics'),
+                                                                 self.tr('JSON files (*.json)'),
+                                                                 optional=True,
+                                                                 createByDefault=False)
+        statistics_param.setFlags(statistics_param.flags() | QgsProcessingParameterDefinition.FlagAdvanced)
+        self.addParameter(statistics_param)
+
+        workers_param = QgsProcessingParameterNumber(self.WORKERS,
+                                                     self.tr('Worker processes (requires qgis_process)'),
+                                                     QgsProcessingParameterNumber.Integer,
+                                                     defaultValue=1, minValue=1, maxValue=64)
+        workers_param.setFlags(workers_param.flags() | QgsProcessingParameterDefinition.FlagAdvanced)
+        self.addParameter(workers_param)
+
+        # set by sharded runs for each of their worker processes
+        shard_range_param = QgsProcessingParameterString(self.SHARD_RANGE, self.tr('Shard feature ID range'),
+                                                         optional=True)
+        shard_range_param.setFlags(shard_range_param.flags() | QgsProcessingParameterDefinition.FlagHidden)
+        self.addParameter(shard_range_param)
+
+        shard_fids_param = QgsProcessingParameterString(self.SHARD_FIDS, self.tr('Shard feature IDs file'),
+                                                        optional=True)
+        shard_fids_param.setFlags(shard_fids_param.flags() | QgsProcessingParameterDefinition.FlagHidden)
+        self.addParameter(shard_fids_param)
+
+        shard_qps_param = QgsProcessingParameterNumber(self.SHARD_MAX_QPS, self.tr('Shard request rate'),
+                                                       QgsProcessingParameterNumber.Double,
+                                                       optional=True, minValue=0)
+        shard_qps_param.setFlags(shard_qps_param.flags() | QgsProcessingParameterDefinition.FlagHidden)
+        self.addParameter(shard_qps_param)
+
+    def processAlgorithm(self, parameters, context, feedback):  # pylint: disable=missing-function-docstring
+        self.trace = Profiler.session('batch')
+        self.coder.trace = self.trace
+        try:
+            with trace_span(self.trace, 'processAlgorithm', 'batch'):
+                return self.geocode_source(parameters, context, feedback)
+        finally:
+            if self.trace is not None:
+                self.finish_trace(feedback)
+
+    def finish_trace(self, feedback):
+        """
+        Writes the trace for the run, and reports the time spent in each span
+        """
+        trace_path, profile_path = self.trace.finish()
+        feedback.pushInfo(self.tr('Timing spans:\n{}').format(self.trace.summary()))
+        feedback.pushInfo(self.tr('Trace written to {}').format(trace_path))
+        if profile_path:
+            feedback.pushInfo(self.tr('cProfile statistics written to {}').format(profile_path))
+        if self.trace.dropped:
+            feedback.pushInfo(self.tr('{} trace events were dropped after the first {}').format(
+                self.trace.dropped, self.trace.MAX_EVENTS))
+
+    def geocode_source(self, parameters, context, feedback) -> dict:
+        """
+        Geocodes the input source, returning the algorithm results
+        """
+        source = self.parameterAsSource(parameters, 'INPUT', context)
+        if source is None:
+            raise QgsProcessingException(self.invalidSourceError(parameters, 'INPUT'))
+
+        address_field = self.parameterAsString(parameters, 'FIELD', context)
+        self.address_index = source.fields().lookupField(address_field)
+        self.concurrent_requests = self.parameterAsInt(parameters, self.CONCURRENT_REQUESTS, context)
+        self.max_in_flight = self.parameterAsInt(parameters, self.MAX_IN_FLIGHT, context)
+        self.transport_type = self.parameterAsEnum(parameters, self.TRANSPORT, context)
+        self.dedupe = self.parameterAsBoolean(parameters, self.DEDUPLICATE, context)
+        self.resume = self.parameterAsBoolean(parameters, self.RESUME, context)
+        self.incremental = self.parameterAsBoolean(parameters, self.INCREMENTAL, context)
+        self.drop_raw_responses = self.parameterAsBoolean(parameters, self.DROP_RAW_RESPONSES, context)
+        chunk_size = self.parameterAsInt(parameters, self.CHUNK_SIZE, context)
+        statistics_path = self.parameterAsFileOutput(parameters, self.STATISTICS, context)
+        workers = self.parameterAsInt(parameters, self.WORKERS, context)
+        self.shard_range = parse_range(self.parameterAsString(parameters, self.SHARD_RANGE, context))
+        self.shard_fids = read_feature_ids(self.parameterAsString(parameters, self.SHARD_FIDS, context))
+        if self.shard_range is not None:
+            # this is a worker process for a sharded run, limited to its share of the request budget
+            RateLimiter.instance().set_max_rate(self.parameterAsDouble(parameters, self.SHARD_MAX_QPS, context))
+            workers = 1
+
+        appended_fields = self.coder.appendedFields()
+        self.result_fields = QgsFields()
+        for index in self.parameterAsEnums(parameters, self.RESULT_FIELDS, context):
+            self.result_fields.append(appended_fields.at(index))
+        self.result_field_names = [field.name() for field in self.result_fields]
+        output_fields = QgsProcessingUtils.combineFields(source.fields(), self.result_fields)
+        if self.incremental:
+            output_fields.append(QgsField(self.HASH_FIELD, QVariant.String))
+            previous = self.parameterAsSource(parameters, self.PREVIOUS_OUTPUT, context) if workers == 1 else None
+            if previous is not None:
+                with trace_span(self.trace, 'load previous results', 'batch'):
+                    self.previous_results = self.load_previous_results(previous, context, feedback)
+
+        self.failure_fields = self.failures_output_fields(source.fields())
+        (self.failures_sink, failures_dest_id) = self.parameterAsSink(parameters, self.FAILURES, context,
+                                                                      self.failure_fields, QgsWkbTypes.NoGeometry)
+        if self.failures_sink is not None:
+            output_fields.append(QgsField(self.SOURCE_FID_FIELD, QVariant.LongLong))
+
+        (self.sink, dest_id) = self.parameterAsSink(parameters, 'OUTPUT', context,
+                                                    output_fields,
+                                                    self.coder.wkbType(),
+                                                    QgsCoordinateReferenceSystem('EPSG:4326'))
+        if self.sink is None:
+            raise QgsProcessingException(self.invalidSinkError(parameters, 'OUTPUT'))
+
+        if workers > 1:
+            with trace_span(self.trace, 'sharded run', 'batch', workers=workers):
+                self.process_sharded(parameters, context, source, output_fields, workers, chunk_size, feedback)
+            return self.finish(dest_id, failures_dest_id, statistics_path, feedback)
+
+        # completed results are journaled as they are written, so that an
+        # interrupted run can later be resumed
+        run_identifiers = [self.source_identifier(parameters, context), address_field, self.region or '',
+                           ','.join(self.result_field_names)]
+        if self.shard_range is not None:
+            run_identifiers.append('{}:{}'.format(*self.shard_range))
+        self.journal = GeocodeJournal(GeocodeJournal.path_for_run(*run_identifiers))
+        if self.resume:
+            feedback.pushInfo(self.tr('Resuming with {} previously geocoded features').format(self.journal.count()))
+        else:
+            self.journal.clear()
+
+        total_rows = len(self.shard_fids) if self.shard_fids is not None else source.featureCount()
+        self.progress = BatchProgress(feedback, total_rows, self.coder.statistics)
+        features = source.getFeatures(shard_request(self.shard_fids),
+                                      QgsProcessingFeatureSource.FlagSkipGeometryValidityChecks)
+
+        self.pending = deque()
+        if self.transport_type == self.TRANSPORT_ASYNC:
+            self.transport = AsyncGeocodeTransport(self.coder, self.max_in_flight, feedback)
+            self.window_size = self.max_in_flight * self.QUEUE_FACTOR
+        else:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.concurrent_requests) if self.concurrent_requests > 1 else None
+            self.window_size = self.concurrent_requests * self.QUEUE_FACTOR
+        completed = False
+        try:
+            if chunk_size:
+                self.process_chunked(features, chunk_size, feedback)
+            else:
+                self.process_streaming(source, features, feedback)
+
+            completed = not feedback.isCanceled()
+        finally:
+            if self.executor is not None:
+                for _, _, _, response, _ in self.pending:
+                    if isinstance(response, Future):
+                        response.cancel()
+                self.executor.shutdown(wait=True)
+            if self.transport is not None:
+                self.transport.shutdown()
+
+            if feedback.isCanceled():
+                with trace_span(self.trace, 'flush completed', 'batch'):
+                    self.flush_completed(feedback)
+
+            if completed:
+                self.journal.remove()
+            else:
+                self.journal.close()
+
+        feedback.pushInfo(self.progress.summary())
+        if self.dedupe:
+            self.report_deduplication(feedback)
+        if self.previous_results:
+            feedback.pushInfo(self.tr('{} unchanged features copied from the previous output').format(
+                self.copied_count))
+        return self.finish(dest_id, failures_dest_id, statistics_path, feedback)
+
+    def finish(self, dest_id, failures_dest_id, statistics_path, feedback) -> dict:
+        """
+        Reports the request statistics, and returns the algorithm results
+        """
+        feedback.pushInfo(self.tr('Request statistics:\n{}').format(self.coder.statistics.summary()))
+        results = {'OUTPUT': dest_id}
+        if self.failures_sink is not None:
+            results[self.FAILURES] = failures_dest_id
+        if statistics_path:
+            self.coder.statistics.export(statistics_path)
+            results[self.STATISTICS] = statistics_path
+        return results
+
+    def process_sharded(self, parameters, context, source, output_fields, workers, chunk_size, feedback):
+        """
+        Splits the source into shards of feature IDs which are geocoded by
+        separate qgis_process workers, then merges the worker outputs into the
+        sink in their original order. The request rate budget is divided evenly
+        between the workers.
+
+        The feature IDs are taken from the source, so that a selection or
+        feature filter on the input is passed through to the workers.
+        """
+        layer = self.parameterAsVectorLayer(parameters, 'INPUT', context)
+        if layer is None or layer.providerType() == 'memory':
+            raise QgsProcessingException(self.tr('Sharded geocoding requires an input layer stored in a file '
+                                                 'or database'))
+
+        request = QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry).setNoAttributes()
+        shards = split_feature_ids(sorted(feature.id() for feature in source.getFeatures(request)), workers)
+        if not shards:
+            return
+
+        worker_parameters = {
+            'INPUT': self.layer_uri(layer),
+            'FIELD': self.parameterAsString(parameters, 'FIELD', context),
+            self.CONCURRENT_REQUESTS: self.concurrent_requests,
+            self.TRANSPORT: self.transport_type,
+            self.MAX_IN_FLIGHT: self.max_in_flight,
+            self.DEDUPLICATE: self.dedupe,
+            self.RESULT_FIELDS: ','.join(str(i) for i in self.parameterAsEnums(parameters, self.RESULT_FIELDS,
+                                                                                context)),
+            self.DROP_RAW_RESPONSES: self.drop_raw_responses,
+            self.RESUME: self.resume,
+            self.CHUNK_SIZE: chunk_size,
+            self.INCREMENTAL: self.incremental,
+            self.SHARD_MAX_QPS: RateLimiter.instance().max_rate / len(shards)
+        }
+        previous = self.parameterAsVectorLayer(parameters, self.PREVIOUS_OUTPUT, context)
+        if self.incremental and previous is not None:
+            worker_parameters[self.PREVIOUS_OUTPUT] = self.layer_uri(previous)
+
+        folder = QgsProcessingUtils.generateTempFilename('google_maps_shards')
+        os.makedirs(folder, exist_ok=True)
+        runner = ShardWorkers(self.id(), folder)
+        outputs = []
+        for shard, feature_ids in enumerate(shards):
+            output = os.path.join(folder, 'shard_{}.gpkg'.format(shard))
+            failures = os.path.join(folder, 'shard_{}_failures.gpkg'.format(shard))
+            statistics = os.path.join(folder, 'shard_{}.json'.format(shard))
+            fids = os.path.join(folder, 'shard_{}_fids.json'.format(shard))
+            write_feature_ids(fids, feature_ids)
+            shard_parameters = dict(worker_parameters,
+                                    SHARD_RANGE='{}:{}'.format(feature_ids[0], feature_ids[-1]),
+                                    SHARD_FIDS=fids,
+                                    OUTPUT=output,
+                                    STATISTICS=statistics)
+            if self.failures_sink is not None:
+                shard_parameters[self.FAILURES] = failures
+            runner.start(shard, shard_parameters)
+            outputs.append((output, failures, statistics))
+
+        feedback.pushInfo(self.tr('Geocoding in {} worker processes').format(len(shards)))
+        if not runner.wait(feedback):
+            return
+
+        for output, failures, statistics in outputs:
+            if feedback.isCanceled():
+                break
+
+            with open(statistics, 'rt', encoding='utf-8') as f:
+                self.coder.statistics.merge(json.load(f))
+
+            self.merge_layer(output, output_fields, self.sink)
+            if self.failures_sink is not None:
+                self.merge_layer(failures, self.failure_fields, self.failures_sink)
+
+    @staticmethod
+    def merge_layer(path: str, fields, sink):
+        """
+        Copies the features from a worker output into a sink, matching
+        fields by name
+        """
+        shard_layer = QgsVectorLayer(path, 'shard', 'ogr')
+        field_indices = [shard_layer.fields().lookupField(field.name()) for field in fields]
+        for shard_feature in shard_layer.getFeatures():
+            attributes = shard_feature.attributes()
+            feature = QgsFeature(fields)
+            feature.setAttributes([attributes[i] if i >= 0 else None for i in field_indices])
+            feature.setGeometry(shard_feature.geometry())
+            sink.addFeature(feature, QgsFeatureSink.FastInsert)
+
+    @staticmethod
+    def layer_uri(layer) -> str:
+        """
+        Returns a string identifying a layer, for use as a qgis_process parameter value
+        """
+        if layer.providerType() == 'ogr':
+            return layer.source()
+        return '{}://{}'.format(layer.providerType(), layer.source())
+
+    def process_streaming(self, source, features, feedback):
+        """
+        Geocodes features through a sliding window of pending requests,
+        sharing responses across the whole layer when deduplicating
+        """
+        # canonical address -> number of features still to be queued, and
+        # canonical address -> shared response for those features
+        remaining = Counter()
+        if self.dedupe:
+            with trace_span(self.trace, 'count addresses', 'batch'):
+                remaining = self.count_addresses(source, self.address_index, feedback)
+        self.responses = {}
+
+        for feature in features:
+            if feedback.isCanceled():
+                break
+
+            with trace_span(self.trace, 'queue feature', 'batch'):
+                key = self.queue_feature(feature, feedback)
+            if key is not None:
+                # release shared responses once the last matching feature has been queued
+                if remaining[key] > 1:
+                    remaining[key] -= 1
+                else:
+                    self.responses.pop(key, None)
+                    del remaining[key]
+
+            if self.transport is not None:
+                self.transport.process_events()
+
+            # write features in their original order, as soon as the results
+            # for all preceding features are available
+            while self.pending and (len(self.pending) >= self.window_size or
+                                    not isinstance(self.pending[0][3], Future) or self.pending[0][3].done()):
+                self.write_next(feedback)
+
+        while self.pending and not feedback.isCanceled():
+            self.write_next(feedback)
+
+    def process_chunked(self, features, chunk_size, feedback):
+        """
+        Geocodes features in fixed size chunks, flushing each completed chunk
+        to the sink and releasing its results before reading the next, so that
+        memory use is independent of the layer size
+        """
+        while not feedback.isCanceled():
+            chunk = list(islice(features, chunk_size))
+            if not chunk:
+                break
+
+            # responses are only shared between features in the same chunk
+            self.responses = {}
+            with trace_span(self.trace, 'queue chunk', 'batch', features=len(chunk)):
+                for feature in chunk:
+                    self.queue_feature(feature, feedback)
+            del chunk
+            self.responses.clear()
+
+            with trace_span(self.trace, 'write chunk', 'batch'):
+                while self.pending and not feedback.isCanceled():
+                    self.write_next(feedback)
+            with trace_span(self.trace, 'journal flush', 'batch'):
+                self.journal.flush()
+
+    def queue_feature(self, feature, feedback) -> Optional[str]:
+        """
+        Queues a feature for geocoding, reusing a journaled or shared response
+        where possible.
+
+        Returns the canonical address key if responses are being shared.
+        """
+        address = self.address_for_feature(feature, self.address_index)
+        key = canonical_address(address) if self.dedupe and address else None
+        previous = self.previous_results.get(self.address_hash(address)) if self.previous_results and address \
+            else None
+        restored = self.journal.lookup(feature.id()) if self.resume and address and previous is None else None
+        if not address:
+            response = None
+        elif previous is not None:
+            response = previous
+            self.copied_count += 1
+        elif restored is not None:
+            response = restored
+        elif key is not None and key in self.responses:
+            response = self.responses[key]
+        elif self.transport is not None:
+            response = self.transport.geocode(address)
+        elif self.executor is not None:
+            response = self.executor.submit(self.coder.geocode, address, QgsRectangle(), feedback)
+        else:
+            response = self.coder.geocode(address, QgsRectangle(), feedback)
+
+        if key is not None:
+            self.deduplicated_features += 1
+            if key not in self.responses:
+                self.unique_addresses += 1
+            self.responses[key] = response
+
+        self.pending.append((feature, address, key, response, previous is not None or restored is not None))
+        return key
+
+    def write_next(self, feedback):
+        """
+        Writes the next pending feature to the sink, waiting for its result
+        if required
+        """
+        feature, address, key, shared, journaled = self.pending.popleft()
+        if isinstance(shared, Future):
+            with trace_span(self.trace, 'wait for result', 'batch'):
+                response = shared.result()
+        else:
+            response = shared
+        if not journaled and (isinstance(response, ResultRecord) or
+                              (isinstance(response, GeocodeResponse) and response.is_valid())):
+            with trace_span(self.trace, 'journal', 'batch'):
+                self.journal.record(feature.id(), response)
+
+        record = self.write_feature(self.sink, feature, address, response, feedback)
+        if self.drop_raw_responses and record is not None and key is not None and self.responses.get(key) is shared:
+            # later features with the same address share the compact record
+            # rather than holding on to the full response
+            self.responses[key] = record
+        self.progress.row_written()
+
+    def flush_completed(self, feedback):
+        """
+        Writes the pending features whose results were already available when
+        the run was canceled, discarding those whose requests were aborted
+        """
+        def is_complete(response) -> bool:
+            if isinstance(response, Future):
+                if not response.done() or response.cancelled():
+                    return False
+                response = response.result()
+            return not isinstance(response, GeocodeResponse) or response.status != GeocodeResponse.CANCELED
+
+        self.pending = deque(entry for entry in self.pending if is_complete(entry[3]))
+        if self.pending:
+            feedback.pushInfo(self.tr('Writing {} results completed before canceling').format(len(self.pending)))
+        while self.pending:
+            self.write_next(feedback)
+
+    def address_hash(self, address: str) -> str:
+        """
+        Returns the hash identifying the geocoding input for an address
+        """
+        return hashlib.blake2b('{}\x1f{}'.format(address, self.region or '').encode('utf-8'),
+                               digest_size=8).hexdigest()
+
+    def load_previous_results(self, previous, context, feedback) -> dict:
+        """
+        Returns the results from a previous incremental output layer, keyed
+        by address hash. Features with no result are skipped, so that they
+        are geocoded again.
+        """
+        hash_index = previous.fields().lookupField(self.HASH_FIELD)
+        if hash_index < 0:
+            raise QgsProcessingException(self.tr('The previous output has no {} field -- it was not created '
+                                                 'with incremental updates enabled').format(self.HASH_FIELD))
+
+        appended_indices = [previous.fields().lookupField(name) for name in self.result_field_names]
+        missing = [name for name, index in zip(self.result_field_names, appended_indices) if index < 0]
+        if missing:
+            feedback.reportError(self.tr('The previous output has no {} fields, these will be empty for copied '
+                                         'features').format(', '.join(missing)))
+        transform = QgsCoordinateTransform(previous.sourceCrs(), QgsCoordinateReferenceSystem('EPSG:4326'),
+                                           context.transformContext())
+        request = QgsFeatureRequest().setSubsetOfAttributes([hash_index] + [i for i in appended_indices if i >= 0])
+
+        results = {}
+        for feature in previous.getFeatures(request, QgsProcessingFeatureSource.FlagSkipGeometryValidityChecks):
+            if feedback.isCanceled():
+                break
+
+            address_hash = feature.attributes()[hash_index]
+            geometry = feature.geometry()
+            if not address_hash or address_hash == NULL or geometry.isEmpty():
+                continue
+
+            try:
+                geometry.transform(transform)
+            except QgsCsException:
+                continue
+
+            attributes = feature.attributes()
+            results[address_hash] = PreviousResult([attributes[i] if i >= 0 else None for i in appended_indices],
+                                                   geometry)
+
+        feedback.pushInfo(self.tr('{} results available from the previous output').format(len(results)))
+        return results
+
+    def source_identifier(self, parameters, context) -> str:
+        """
+        Returns a string identifying the input layer source
+        """
+        layer = self.parameterAsVectorLayer(parameters, 'INPUT', context)
+        if layer is not None:
+            return '{}:{}'.format(layer.providerType(), layer.source())
+        return str(parameters.get('INPUT'))
+
+    def count_addresses(self, source, address_index: int, feedback) -> Counter:
+        """
+        Counts the features matching each canonical address in the source
+        """
+        counts = Counter()
+        if address_index < 0:
+            return counts
+
+        request = shard_request(self.shard_fids).setFlags(
+            QgsFeatureRequest.NoGeometry).setSubsetOfAttributes([address_index])
+        for feature in source.getFeatures(request, QgsProcessingFeatureSource.FlagSkipGeometryValidityChecks):
+            if feedback.isCanceled():
+                break
+
+            address = self.address_for_feature(feature, address_index)
+            if address:
+                counts[canonical_address(address)] += 1
+
+        return counts
+
+    def report_deduplication(self, feedback):
+        """
+        Reports the number of unique addresses geocoded, and the requests
+        saved by deduplication
+        """
+        if not self.deduplicated_features:
+            return
+
+        feedback.pushInfo(self.tr('{} unique addresses found in {} features ({:.1%}), '
+                                  '{} requests saved by deduplication').format(
+            self.unique_addresses, self.deduplicated_features,
+            self.unique_addresses / self.deduplicated_features,
+            self.deduplicated_features - self.unique_addresses))
+
+    @staticmethod
+    def address_for_feature(feature, address_index: int) -> str:
+        """
+        Returns the address string for a feature
+        """
+        if address_index < 0:
+            return ''
+
+        value = feature.attributes()[address_index]
+        if value is None or value == NULL:
+            return ''
+        return str(value)
+
+    def result_record(self, response: GeocodeResponse) -> ResultRecord:
+        """
+        Extracts the selected result fields and the geometry from the first
+        result of a successful response
+        """
+        result = self.coder.coder.jsonToResult(response.results[0])
+        result_attributes = result.additionalAttributes()
+        return ResultRecord([result_attributes.get(name) for name in self.result_field_names], result.geometry())
+
+    def write_feature(self, sink, feature, address, response, feedback) -> Optional[ResultRecord]:
+        """
+        Adds the geocoded result for a feature to the sink, and to the failures
+        sink if the feature could not be geocoded.
+
+        Returns the result record written for the feature, or None if the
+        feature could not be geocoded.
+        """
+        attributes = feature.attributes()
+        address_hash = [self.address_hash(address) if address else None] if self.incremental else []
+        source_fid = [feature.id()] if self.failures_sink is not None else []
+        record = None
+        reason = None
+        if isinstance(response, ResultRecord):
+            record = response
+        elif response is None:
+            reason = self.tr('Empty address field')
+            feedback.reportError(self.tr('Empty address field for feature {}').format(feature.id()))
+        elif not response.is_valid():
+            reason = response.error
+            feedback.reportError(self.tr('Error geocoding {}: {}').format(address, response.error))
+        elif not response.results:
+            reason = self.tr('No result found')
+            feedback.reportError(self.tr('No result found for {}').format(address))
+        else:
+            with trace_span(self.trace, 'attribute mapping', 'batch'):
+                record = self.result_record(response)
+
+        if record is None and self.failures_sink is not None:
+            with trace_span(self.trace, 'failure write', 'batch'):
+                self.write_failure(feature.id(), attributes, reason, response)
+
+        if record is not None:
+            feature.setAttributes(attributes + record.attributes + address_hash + source_fid)
+            feature.setGeometry(record.geometry)
+        else:
+            feature.setAttributes(attributes + [None] * len(self.result_field_names) + address_hash + source_fid)
+        with trace_span(self.trace, 'sink write', 'batch'):
+            sink.addFeature(feature, QgsFeatureSink.FastInsert)
+        return record
+
+    @classmethod
+    def failures_output_fields(cls, source_fields) -> QgsFields:
+        """
+        Returns the fields for the failures output
+        """
+        fields = QgsFields(source_fields)
+        fields.append(QgsField(cls.SOURCE_FID_FIELD, QVariant.LongLong))
+        fields.append(QgsField(cls.FAILURE_REASON_FIELD, QVariant.String))
+        fields.append(QgsField(cls.FAILURE_STATUS_FIELD, QVariant.String))
+        fields.append(QgsField(cls.ATTEMPTS_FIELD, QVariant.Int))
+        return fields
+
+    def write_failure(self, fid: int, attributes: list, reason: str, response):
+        """
+        Adds a feature which could not be geocoded to the failures sink
+        """
+        failure = QgsFeature(self.failure_fields)
+        failure.setAttributes(attributes + [fid, reason,
+                                            response.status if response is not None else None,
+                                            response.attempts if response is not None else 0])
+        self.failures_sink.addFeature(failure, QgsFeatureSink.FastInsert)
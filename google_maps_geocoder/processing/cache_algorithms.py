@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    cache_algorithms.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+from qgis.PyQt.QtCore import QCoreApplication
+from qgis.core import (
+    NULL,
+    QgsCoordinateReferenceSystem,
+    QgsCoordinateTransform,
+    QgsCsException,
+    QgsFeatureRequest,
+    QgsProcessing,
+    QgsProcessingAlgorithm,
+    QgsProcessingException,
+    QgsProcessingFeatureSource,
+    QgsProcessingOutputNumber,
+    QgsProcessingParameterFeatureSource,
+    QgsProcessingParameterField,
+    QgsProcessingParameterFile,
+    QgsProcessingParameterFileDestination
+)
+
+from google_maps_geocoder.core.cache import GeocodeCache
+from google_maps_geocoder.core.config import GoogleMapsConfig
+from google_maps_geocoder.core.geocoder import GoogleMapsGeocoder
+
+
+class GoogleMapsCacheAlgorithm(QgsProcessingAlgorithm):
+    """
+    Base class for algorithms which manage the geocoding result cache
+    """
+
+    ENTRIES = 'ENTRIES'
+
+    def groupId(self):  # pylint: disable=missing-function-docstring
+        return None
+
+    def group(self):  # pylint: disable=missing-function-docstring
+        return None
+
+    @staticmethod
+    def tr(string):
+        """
+        Translates a string
+        """
+        return QCoreApplication.translate('GoogleMaps', string)
+
+    def cache(self) -> GeocodeCache:
+        """
+        Returns the shared result cache, raising an exception if caching
+        has been disabled
+        """
+        cache = GeocodeCache.instance()
+        if cache is None:
+            raise QgsProcessingException(self.tr('Geocoding result caching is disabled in the plugin settings'))
+        return cache
+
+
+class GoogleMapsWarmCache(GoogleMapsCacheAlgorithm):
+    """
+    Loads results from a previously geocoded layer into the result cache
+    """
+
+    INPUT = 'INPUT'
+    FIELD = 'FIELD'
+
+    def __init__(self):
+        super().__init__()
+        self.region = GoogleMapsConfig.instance().region
+
+    def name(self):  # pylint: disable=missing-function-docstring
+        return 'google_maps_warm_cache'
+
+    def displayName(self):  # pylint: disable=missing-function-docstring
+        return self.tr('Load geocoded layer into result cache')
+
+    def shortHelpString(self):  # pylint: disable=missing-function-docstring
+        return self.tr('Loads address results from a layer previously created by the Google Maps batch '
+                       'geocoder into the result cache, so that these addresses can be geocoded again '
+                       'without any requests to Google Maps.')
+
+    def createInstance(self):  # pylint: disable=missing-function-docstring
+        return GoogleMapsWarmCache()
+
+    def initAlgorithm(self, configuration=None):  # pylint: disable=missing-function-docstring
+        self.addParameter(QgsProcessingParameterFeatureSource(self.INPUT,
+                                                              self.tr('Geocoded layer'),
+                                                              [QgsProcessing.TypeVectorPoint]))
+        self.addParameter(QgsProcessingParameterField(self.FIELD,
+                                                      self.tr('Address field'),
+                                                      parentLayerParameterName=self.INPUT,
+                                                      type=QgsProcessingParameterField.String))
+        self.addOutput(QgsProcessingOutputNumber(self.ENTRIES, self.tr('Cached results')))
+
+    def processAlgorithm(self, parameters, context, feedback):  # pylint: disable=missing-function-docstring
+        source = self.parameterAsSource(parameters, self.INPUT, context)
+        if source is None:
+            raise QgsProcessingException(self.invalidSourceError(parameters, self.INPUT))
+
+        cache = self.cache()
+        fields = source.fields()
+        address_index = fields.lookupField(self.parameterAsString(parameters, self.FIELD, context))
+        result_indices = {field.name(): fields.lookupField(field.name())
+                          for field in GoogleMapsGeocoder.result_fields()}
+        result_indices = {name: index for name, index in result_indices.items() if index >= 0}
+        if 'formatted_address' not in result_indices:
+            raise QgsProcessingException(self.tr('The layer has no formatted_address field -- it was not '
+                                                 'created by the Google Maps batch geocoder'))
+
+        transform = QgsCoordinateTransform(source.sourceCrs(), QgsCoordinateReferenceSystem('EPSG:4326'),
+                                           context.transformContext())
+        request = QgsFeatureRequest().setSubsetOfAttributes([address_index] + list(result_indices.values()))
+        total = 100.0 / source.featureCount() if source.featureCount() else 0
+
+        def entries():
+            for current, feature in enumerate(source.getFeatures(
+                    request, QgsProcessingFeatureSource.FlagSkipGeometryValidityChecks)):
+                if feedback.isCanceled():
+                    break
+                feedback.setProgress(int(current * total))
+
+                attributes = feature.attributes()
+                address = attributes[address_index]
+                geometry = feature.geometry()
+                if address is None or address == NULL or geometry.isEmpty():
+                    continue
+
+                try:
+                    geometry.transform(transform)
+                except QgsCsException:
+                    continue
+
+                values = {name: attributes[index] for name, index in result_indices.items()
+                          if attributes[index] is not None and attributes[index] != NULL}
+                result = GoogleMapsGeocoder.json_from_attributes(values, geometry.asPoint())
+                yield GeocodeCache.key(str(address), self.region), [result]
+
+        count = cache.store_many(entries())
+        feedback.pushInfo(self.tr('{} results loaded into the cache').format(count))
+        return {self.ENTRIES: count}
+
+
+class GoogleMapsExportCache(GoogleMapsCacheAlgorithm):
+    """
+    Exports the result cache to a portable file
+    """
+
+    OUTPUT = 'OUTPUT'
+
+    def name(self):  # pylint: disable=missing-function-docstring
+        return 'google_maps_export_cache'
+
+    def displayName(self):  # pylint: disable=missing-function-docstring
+        return self.tr('Export result cache')
+
+    def shortHelpString(self):  # pylint: disable=missing-function-docstring
+        return self.tr('Exports all unexpired geocoding results from the cache to a single file, '
+                       'which can be imported on another machine with "Import result cache".')
+
+    def createInstance(self):  # pylint: disable=missing-function-docstring
+        return GoogleMapsExportCache()
+
+    def initAlgorithm(self, configuration=None):  # pylint: disable=missing-function-docstring
+        self.addParameter(QgsProcessingParameterFileDestination(self.OUTPUT,
+                                                                self.tr('Exported cache'),
+                                                                self.tr('SQLite files (*.sqlite)')))
+        self.addOutput(QgsProcessingOutputNumber(self.ENTRIES, self.tr('Exported results')))
+
+    def processAlgorithm(self, parameters, context, feedback):  # pylint: disable=missing-function-docstring
+        path = self.parameterAsFileOutput(parameters, self.OUTPUT, context)
+        count = self.cache().export(path)
+        feedback.pushInfo(self.tr('{} results exported').format(count))
+        return {self.OUTPUT: path, self.ENTRIES: count}
+
+
+class GoogleMapsImportCache(GoogleMapsCacheAlgorithm):
+    """
+    Imports results from an exported cache file
+    """
+
+    INPUT = 'INPUT'
+
+    def name(self):  # pylint: disable=missing-function-docstring
+        return 'google_maps_import_cache'
+
+    def displayName(self):  # pylint: disable=missing-function-docstring
+        return self.tr('Import result cache')
+
+    def shortHelpString(self):  # pylint: disable=missing-function-docstring
+        return self.tr('Imports geocoding results from a file created with "Export result cache". '
+                       'Existing results are kept where they are newer than the imported result.')
+
+    def createInstance(self):  # pylint: disable=missing-function-docstring
+        return GoogleMapsImportCache()
+
+    def initAlgorithm(self, configuration=None):  # pylint: disable=missing-function-docstring
+        self.addParameter(QgsProcessingParameterFile(self.INPUT,
+                                                     self.tr('Exported cache'),
+                                                     extension='sqlite'))
+        self.addOutput(QgsProcessingOutputNumber(self.ENTRIES, self.tr('Imported results')))
+
+    def processAlgorithm(self, parameters, context, feedback):  # pylint: disable=missing-function-docstring
+        path = self.parameterAsFile(parameters, self.INPUT, context)
+        count = self.cache().import_file(path)
+        feedback.pushInfo(self.tr('{} results imported').format(count))
+        return {self.ENTRIES: count}
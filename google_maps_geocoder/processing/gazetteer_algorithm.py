@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    gazetteer_algorithm.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+from qgis.PyQt.QtCore import QCoreApplication
+from qgis.core import (
+    NULL,
+    QgsCoordinateReferenceSystem,
+    QgsCoordinateTransform,
+    QgsCsException,
+    QgsFeatureRequest,
+    QgsProcessing,
+    QgsProcessingAlgorithm,
+    QgsProcessingException,
+    QgsProcessingFeatureSource,
+    QgsProcessingParameterBoolean,
+    QgsProcessingParameterFeatureSource,
+    QgsProcessingParameterField,
+    QgsProcessingParameterFileDestination,
+    QgsSettings,
+    QgsWkbTypes
+)
+
+from google_maps_geocoder.core.gazetteer import Gazetteer
+
+
+class GoogleMapsBuildGazetteer(QgsProcessingAlgorithm):
+    """
+    Builds an offline gazetteer from a layer of known addresses
+    """
+
+    INPUT = 'INPUT'
+    FIELD = 'FIELD'
+    ACTIVATE = 'ACTIVATE'
+    OUTPUT = 'OUTPUT'
+
+    def groupId(self):  # pylint: disable=missing-function-docstring
+        return None
+
+    def group(self):  # pylint: disable=missing-function-docstring
+        return None
+
+    def name(self):  # pylint: disable=missing-function-docstring
+        return 'google_maps_build_gazetteer'
+
+    def displayName(self):  # pylint: disable=missing-function-docstring
+        return self.tr('Build offline gazetteer')
+
+    def shortHelpString(self):  # pylint: disable=missing-function-docstring
+        return self.tr('Builds an offline gazetteer from a layer of known addresses, such as an '
+                       'authoritative address list.\n\n'
+                       'When a gazetteer is active, addresses are looked up in it before any request '
+                       'is made to Google Maps, and confident matches are used in place of a request. '
+                       'For non-point features the centroid is used as the address location.')
+
+    def createInstance(self):  # pylint: disable=missing-function-docstring
+        return GoogleMapsBuildGazetteer()
+
+    @staticmethod
+    def tr(string):
+        """
+        Translates a string
+        """
+        return QCoreApplication.translate('GoogleMaps', string)
+
+    def initAlgorithm(self, configuration=None):  # pylint: disable=missing-function-docstring
+        self.addParameter(QgsProcessingParameterFeatureSource(self.INPUT,
+                                                              self.tr('Address layer'),
+                                                              [QgsProcessing.TypeVectorAnyGeometry]))
+        self.addParameter(QgsProcessingParameterField(self.FIELD,
+                                                      self.tr('Address field'),
+                                                      parentLayerParameterName=self.INPUT,
+                                                      type=QgsProcessingParameterField.String))
+        self.addParameter(QgsProcessingParameterBoolean(self.ACTIVATE,
+                                                        self.tr('Use as the active gazetteer'),
+                                                        defaultValue=True))
+        self.addParameter(QgsProcessingParameterFileDestination(self.OUTPUT,
+                                                                self.tr('Gazetteer'),
+                                                                self.tr('SQLite files (*.sqlite)')))
+
+    def processAlgorithm(self, parameters, context, feedback):  # pylint: disable=missing-function-docstring
+        source = self.parameterAsSource(parameters, self.INPUT, context)
+        if source is None:
+            raise QgsProcessingException(self.invalidSourceError(parameters, self.INPUT))
+
+        address_index = source.fields().lookupField(self.parameterAsString(parameters, self.FIELD, context))
+        activate = self.parameterAsBoolean(parameters, self.ACTIVATE, context)
+        path = self.parameterAsFileOutput(parameters, self.OUTPUT, context)
+
+        transform = QgsCoordinateTransform(source.sourceCrs(), QgsCoordinateReferenceSystem('EPSG:4326'),
+                                           context.transformContext())
+        total = 100.0 / source.featureCount() if source.featureCount() else 0
+        request = QgsFeatureRequest().setSubsetOfAttributes([address_index])
+
+        def addresses():
+            for current, feature in enumerate(source.getFeatures(
+                    request, QgsProcessingFeatureSource.FlagSkipGeometryValidityChecks)):
+                feedback.setProgress(int(current * total))
+
+                address = feature.attributes()[address_index]
+                geometry = feature.geometry()
+                if address is None or address == NULL or geometry.isEmpty():
+                    continue
+
+                try:
+                    geometry.transform(transform)
+                except QgsCsException:
+                    feedback.reportError(self.tr('Could not transform feature {}').format(feature.id()))
+                    continue
+
+                if geometry.type() != QgsWkbTypes.PointGeometry or geometry.isMultipart():
+                    geometry = geometry.centroid()
+                point = geometry.asPoint()
+                yield str(address), point.x(), point.y()
+
+        # an active gazetteer is rebuilt through a separate connection, and searches
+        # using the shared instance continue to read the previous contents until
+        # the import is committed
+        active = path == QgsSettings().value(Gazetteer.SETTINGS_PATH, '', str)
+        gazetteer = Gazetteer(path)
+        try:
+            count = gazetteer.import_addresses(addresses(), feedback)
+        finally:
+            gazetteer.close()
+
+        if count is None:
+            # the import was rolled back, so the existing gazetteer is unchanged and stays in use
+            feedback.pushInfo(self.tr('Import canceled, the gazetteer was not changed'))
+            return {self.OUTPUT: path}
+
+        feedback.pushInfo(self.tr('{} addresses imported').format(count))
+        if not gazetteer.full_text:
+            feedback.reportError(self.tr('SQLite full-text search is not available, only exact '
+                                         'address matches will be found'))
+
+        if activate:
+            QgsSettings().setValue(Gazetteer.SETTINGS_PATH, path)
+        if activate or active:
+            # swap in the new gazetteer on next use, leaving the previous
+            # instance open for any lookups still in progress
+            Gazetteer.reset_instance()
+
+        return {self.OUTPUT: path}
@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    multi_layer_algorithm.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import os
+import re
+from collections import deque
+
+from qgis.PyQt.QtCore import QCoreApplication
+from qgis.core import (
+    NULL,
+    QgsCoordinateReferenceSystem,
+    QgsFeatureRequest,
+    QgsFeatureSink,
+    QgsProcessing,
+    QgsProcessingAlgorithm,
+    QgsProcessingContext,
+    QgsProcessingException,
+    QgsProcessingFeatureSource,
+    QgsProcessingMultiStepFeedback,
+    QgsProcessingOutputMultipleLayers,
+    QgsProcessingParameterBoolean,
+    QgsProcessingParameterDefinition,
+    QgsProcessingParameterFolderDestination,
+    QgsProcessingParameterMultipleLayers,
+    QgsProcessingParameterNumber,
+    QgsProcessingParameterString,
+    QgsProcessingUtils,
+    QgsVectorFileWriter
+)
+
+from google_maps_geocoder.core.address import canonical_address
+from google_maps_geocoder.core.async_transport import AsyncGeocodeTransport
+from google_maps_geocoder.core.config import GoogleMapsConfig
+from google_maps_geocoder.core.geocoder import (
+    GoogleMapsGeocoder,
+    ResultRecord
+)
+
+
+class GoogleMapsMultiLayerGeocode(QgsProcessingAlgorithm):
+    """
+    Geocodes several layers together, sharing one pool of unique addresses.
+
+    The addresses from every input layer are first combined into a single
+    set of unique canonical addresses, each of which is geocoded only once.
+    A geocoded copy of each input layer is then written to the output
+    folder using the shared results.
+    """
+
+    LAYERS = 'LAYERS'
+    FIELDS = 'FIELDS'
+    SELECTED_ONLY = 'SELECTED_ONLY'
+    MAX_IN_FLIGHT = 'MAX_IN_FLIGHT'
+    OUTPUT = 'OUTPUT'
+    OUTPUT_LAYERS = 'OUTPUT_LAYERS'
+
+    # number of pending requests to queue per request in flight
+    QUEUE_FACTOR = 4
+
+    def __init__(self):
+        super().__init__()
+        # each run uses the configuration current when its instance is created,
+        # but its geocoder is only created once it is needed
+        self.config_values = GoogleMapsConfig.instance().values()
+        self._coder = None
+
+    @property
+    def coder(self) -> GoogleMapsGeocoder:
+        """
+        Returns the geocoder used for this run, creating it on first use
+        """
+        if self._coder is None:
+            self._coder = GoogleMapsGeocoder(*self.config_values)
+        return self._coder
+
+    def groupId(self):  # pylint: disable=missing-function-docstring
+        return None
+
+    def group(self):  # pylint: disable=missing-function-docstring
+        return None
+
+    def name(self):  # pylint: disable=missing-function-docstring
+        return 'google_maps_geocode_multiple'
+
+    def displayName(self):  # pylint: disable=missing-function-docstring
+        return self.tr('Google Maps batch geocoder (multiple layers)')
+
+    def shortHelpString(self):  # pylint: disable=missing-function-docstring
+        return self.tr('Geocodes several layers which share addresses in a single run.\n\n'
+                       'The addresses from all input layers are combined, and each unique address is '
+                       'geocoded only once. A geocoded GeoPackage is written to the output folder for '
+                       'each input layer.\n\n'
+                       'Enter the address field for each input layer as a comma separated list, in the '
+                       'same order as the layers, or a single field name if all layers use the same '
+                       'address field.\n\n'
+                       'If "Selected features only" is checked, only the selected features of each layer '
+                       'are geocoded and written.')
+
+    def createInstance(self):  # pylint: disable=missing-function-docstring
+        return GoogleMapsMultiLayerGeocode()
+
+    @staticmethod
+    def tr(string):
+        """
+        Translates a string
+        """
+        return QCoreApplication.translate('GoogleMaps', string)
+
+    def initAlgorithm(self, configuration=None):  # pylint: disable=missing-function-docstring
+        self.addParameter(QgsProcessingParameterMultipleLayers(self.LAYERS,
+                                                               self.tr('Input layers'),
+                                                               QgsProcessing.TypeVector))
+        self.addParameter(QgsProcessingParameterString(self.FIELDS,
+                                                       self.tr('Address fields (comma separated, in layer order)')))
+        self.addParameter(QgsProcessingParameterBoolean(self.SELECTED_ONLY,
+                                                        self.tr('Selected features only'),
+                                                        defaultValue=False))
+
+        in_flight_param = QgsProcessingParameterNumber(self.MAX_IN_FLIGHT,
+                                                       self.tr('Maximum requests in flight'),
+                                                       QgsProcessingParameterNumber.Integer,
+                                                       defaultValue=16, minValue=1, maxValue=256)
+        in_flight_param.setFlags(in_flight_param.flags() | QgsProcessingParameterDefinition.FlagAdvanced)
+        self.addParameter(in_flight_param)
+
+        self.addParameter(QgsProcessingParameterFolderDestination(self.OUTPUT, self.tr('Output folder')))
+        self.addOutput(QgsProcessingOutputMultipleLayers(self.OUTPUT_LAYERS, self.tr('Geocoded layers')))
+
+    def processAlgorithm(self, parameters, context, feedback):  # pylint: disable=missing-function-docstring
+        layers = self.parameterAsLayerList(parameters, self.LAYERS, context)
+        if not layers:
+            raise QgsProcessingException(self.tr('No input layers were specified'))
+
+        field_names = [name.strip() for name in self.parameterAsString(parameters, self.FIELDS, context).split(',')]
+        if len(field_names) == 1:
+            field_names *= len(layers)
+        if len(field_names) != len(layers):
+            raise QgsProcessingException(self.tr('{} address fields were specified for {} input layers').format(
+                len(field_names), len(layers)))
+
+        address_indices = []
+        for layer, field_name in zip(layers, field_names):
+            index = layer.fields().lookupField(field_name)
+            if index < 0:
+                raise QgsProcessingException(self.tr('Layer {} has no field named {}').format(layer.name(),
+                                                                                             field_name))
+            address_indices.append(index)
+
+        # the addresses are collected from, and the outputs written from, the same
+        # processing sources and requests, so the address pool matches the written features
+        selected_only = self.parameterAsBoolean(parameters, self.SELECTED_ONLY, context)
+        sources = [QgsProcessingFeatureSource(layer, context) for layer in layers]
+        requests = [self.layer_request(layer, selected_only) for layer in layers]
+
+        max_in_flight = self.parameterAsInt(parameters, self.MAX_IN_FLIGHT, context)
+        folder = self.parameterAsString(parameters, self.OUTPUT, context)
+        os.makedirs(folder, exist_ok=True)
+
+        multi_feedback = QgsProcessingMultiStepFeedback(3, feedback)
+
+        addresses = self.collect_addresses(sources, requests, address_indices, multi_feedback)
+        if feedback.isCanceled():
+            return {}
+
+        multi_feedback.setCurrentStep(1)
+        records = self.geocode_addresses(addresses, max_in_flight, multi_feedback)
+        if feedback.isCanceled():
+            return {}
+
+        multi_feedback.setCurrentStep(2)
+        outputs = []
+        used_names = set()
+        for current, (layer, source, request, address_index) in enumerate(zip(layers, sources, requests,
+                                                                               address_indices)):
+            if feedback.isCanceled():
+                break
+            multi_feedback.setProgress(100 * current / len(layers))
+
+            name = self.output_name(layer.name(), used_names)
+            path = os.path.join(folder, '{}.gpkg'.format(name))
+            self.write_layer(source, request, address_index, records, path, context, feedback)
+            outputs.append(path)
+            context.addLayerToLoadOnCompletion(path, QgsProcessingContext.LayerDetails(name, context.project(),
+                                                                                       self.OUTPUT_LAYERS))
+
+        feedback.pushInfo(self.tr('Request statistics:\n{}').format(self.coder.statistics.summary()))
+        return {self.OUTPUT: folder, self.OUTPUT_LAYERS: outputs}
+
+    @staticmethod
+    def layer_request(layer, selected_only: bool) -> QgsFeatureRequest:
+        """
+        Returns the request for the features of an input layer to geocode
+        """
+        request = QgsFeatureRequest()
+        if selected_only:
+            request.setFilterFids(layer.selectedFeatureIds())
+        return request
+
+    @staticmethod
+    def request_count(source, request: QgsFeatureRequest) -> int:
+        """
+        Returns the number of features a request will return from a source
+        """
+        if request.filterType() == QgsFeatureRequest.FilterFids:
+            return len(request.filterFids())
+        return source.featureCount()
+
+    def collect_addresses(self, sources, requests, address_indices, feedback) -> dict:
+        """
+        Returns the unique addresses from all sources, as a dictionary of
+        canonical address to the first matching address string
+        """
+        addresses = {}
+        feature_count = 0
+        total_features = sum(self.request_count(source, request) for source, request in zip(sources, requests))
+        total = 100.0 / total_features if total_features else 0
+        for source, request, address_index in zip(sources, requests, address_indices):
+            request = QgsFeatureRequest(request).setFlags(QgsFeatureRequest.NoGeometry).setSubsetOfAttributes(
+                [address_index])
+            for feature in source.getFeatures(request):
+                if feedback.isCanceled():
+                    return addresses
+
+                feature_count += 1
+                address = self.address_for_feature(feature, address_index)
+                if address:
+                    addresses.setdefault(canonical_address(address), address)
+                feedback.setProgress(int(feature_count * total))
+
+        if feature_count:
+            feedback.pushInfo(self.tr('{} unique addresses found in {} features from {} layers').format(
+                len(addresses), feature_count, len(sources)))
+        return addresses
+
+    def geocode_addresses(self, addresses: dict, max_in_flight: int, feedback) -> dict:
+        """
+        Geocodes each unique address once, returning a dictionary of canonical
+        address to result record. Addresses which could not be geocoded are
+        omitted.
+        """
+        records = {}
+        field_names = [field.name() for field in self.coder.appendedFields()]
+        transport = AsyncGeocodeTransport(self.coder, max_in_flight, feedback)
+        window_size = max_in_flight * self.QUEUE_FACTOR
+
+        def complete(key, request):
+            response = request.result()
+            address = addresses[key]
+            if not response.is_valid():
+                feedback.reportError(self.tr('Error geocoding {}: {}').format(address, response.error))
+            elif not response.results:
+                feedback.reportError(self.tr('No result found for {}').format(address))
+            else:
+                result = self.coder.coder.jsonToResult(response.results[0])
+                result_attributes = result.additionalAttributes()
+                records[key] = ResultRecord([result_attributes.get(name) for name in field_names],
+                                            result.geometry())
+
+        total = 100.0 / len(addresses) if addresses else 0
+        pending = deque()
+        try:
+            for current, (key, address) in enumerate(addresses.items()):
+                if feedback.isCanceled():
+                    break
+
+                pending.append((key, transport.geocode(address)))
+                transport.process_events()
+                while pending and (len(pending) >= window_size or pending[0][1].done()):
+                    complete(*pending.popleft())
+
+                feedback.setProgress(int(current * total))
+
+            while pending and not feedback.isCanceled():
+                complete(*pending.popleft())
+        finally:
+            transport.shutdown()
+
+        return records
+
+    @staticmethod
+    def output_name(layer_name: str, used_names: set) -> str:
+        """
+        Returns a unique file name for the output of a layer
+        """
+        base = re.sub(r'[^\w\-]+', '_', layer_name).strip('_') or 'layer'
+        name = base
+        suffix = 1
+        while name.lower() in used_names:
+            suffix += 1
+            name = '{}_{}'.format(base, suffix)
+        used_names.add(name.lower())
+        return name
+
+    @staticmethod
+    def address_for_feature(feature, address_index: int) -> str:
+        """
+        Returns the address string for a feature
+        """
+        value = feature.attributes()[address_index]
+        if value is None or value == NULL:
+            return ''
+        return str(value)
+
+    def write_layer(self, source, request: QgsFeatureRequest, address_index: int, records: dict, path: str,
+                    context, feedback):
+        """
+        Writes a geocoded copy of the requested features of a source to a
+        GeoPackage, using the shared results
+        """
+        appended_fields = self.coder.appendedFields()
+        fields = QgsProcessingUtils.combineFields(source.fields(), appended_fields)
+
+        options = QgsVectorFileWriter.SaveVectorOptions()
+        options.driverName = 'GPKG'
+        options.layerName = os.path.splitext(os.path.basename(path))[0]
+        writer = QgsVectorFileWriter.create(path, fields, self.coder.wkbType(),
+                                            QgsCoordinateReferenceSystem('EPSG:4326'),
+                                            context.transformContext(), options)
+        if writer.hasError() != QgsVectorFileWriter.NoError:
+            raise QgsProcessingException(self.tr('Could not create {}: {}').format(path, writer.errorMessage()))
+
+        try:
+            for feature in source.getFeatures(request):
+                if feedback.isCanceled():
+                    break
+
+                address = self.address_for_feature(feature, address_index)
+                record = records.get(canonical_address(address)) if address else None
+                attributes = feature.attributes()
+                if record is not None:
+                    feature.setAttributes(attributes + record.attributes)
+                    feature.setGeometry(record.geometry)
+                else:
+                    feature.setAttributes(attributes + [None] * appended_fields.count())
+                    feature.clearGeometry()
+                writer.addFeature(feature, QgsFeatureSink.FastInsert)
+        finally:
+            del writer
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    progress.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import time
+from typing import Optional
+
+from qgis.PyQt.QtCore import QCoreApplication
+from qgis.core import QgsProcessingFeedback
+
+from google_maps_geocoder.core.statistics import GeocodeStatistics
+
+
+class BatchProgress:
+    """
+    Reports the progress of a batch geocoding run.
+
+    Progress is based on the number of rows written to the output, rather
+    than the number queued, and the progress text shows the current row
+    and request throughput, the share of cache hits and the estimated time
+    remaining.
+    """
+
+    # minimum interval between progress text updates, in seconds
+    UPDATE_INTERVAL = 1.0
+
+    def __init__(self, feedback: QgsProcessingFeedback, total_rows: int, statistics: GeocodeStatistics):
+        self.feedback = feedback
+        self.total_rows = total_rows
+        self.statistics = statistics
+        self.rows = 0
+        self.start = time.monotonic()
+        self._last_update = self.start
+
+    @staticmethod
+    def tr(string):
+        """
+        Translates a string
+        """
+        return QCoreApplication.translate('GoogleMaps', string)
+
+    def row_written(self):
+        """
+        Records a row written to the output, updating the reported progress
+        """
+        self.rows += 1
+        if self.total_rows:
+            self.feedback.setProgress(100 * self.rows / self.total_rows)
+
+        now = time.monotonic()
+        if now - self._last_update >= self.UPDATE_INTERVAL:
+            self._last_update = now
+            self.feedback.setProgressText(self.text(now))
+
+    @staticmethod
+    def format_duration(seconds: float) -> str:
+        """
+        Formats a duration as hours, minutes and seconds
+        """
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        return '{}:{:02d}:{:02d}'.format(hours, minutes, seconds)
+
+    def eta(self, now: float) -> Optional[float]:
+        """
+        Returns the estimated time remaining in seconds, or None if unknown
+        """
+        elapsed = now - self.start
+        if not self.rows or not self.total_rows or not elapsed:
+            return None
+        return max(self.total_rows - self.rows, 0) * elapsed / self.rows
+
+    def text(self, now: Optional[float] = None) -> str:
+        """
+        Returns the progress text
+        """
+        now = now if now is not None else time.monotonic()
+        elapsed = max(now - self.start, 1e-6)
+        lookups = self.statistics.cache_hits + self.statistics.cache_misses
+        eta = self.eta(now)
+        return self.tr('{} of {} rows — {:.1f} rows/s, {:.1f} requests/s, {:.0%} cache hits, '
+                       'remaining {}').format(self.rows, self.total_rows,
+                                              self.rows / elapsed,
+                                              self.statistics.requests / elapsed,
+                                              self.statistics.cache_hits / lookups if lookups else 0,
+                                              self.format_duration(eta) if eta is not None else '—')
+
+    def summary(self) -> str:
+        """
+        Returns a summary of the completed run
+        """
+        elapsed = time.monotonic() - self.start
+        return self.tr('{} rows written in {} ({:.1f} rows/s)').format(
+            self.rows, self.format_duration(elapsed), self.rows / elapsed if elapsed else 0)
@@ -23,6 +23,23 @@ from qgis.core import QgsProcessingProvider
 from google_maps_geocoder.processing.algorithm import (
     GoogleMapsBatchGeocode
 )
+from google_maps_geocoder.processing.cache_algorithms import (
+    GoogleMapsExportCache,
+    GoogleMapsImportCache,
+    GoogleMapsWarmCache
+)
+from google_maps_geocoder.processing.gazetteer_algorithm import (
+    GoogleMapsBuildGazetteer
+)
+from google_maps_geocoder.processing.multi_layer_algorithm import (
+    GoogleMapsMultiLayerGeocode
+)
+from google_maps_geocoder.processing.retry_algorithm import (
+    GoogleMapsRetryFailures
+)
+from google_maps_geocoder.processing.reverse_algorithm import (
+    GoogleMapsReverseGeocode
+)
 from google_maps_geocoder.gui.gui_utils import GuiUtils
 
 
@@ -34,8 +51,6 @@ class GoogleMapsProvider(QgsProcessingProvider):
     def __init__(self):
         super().__init__()
         self.algs = []
-        self.region = None
-        self.api_key = None
 
     def icon(self):
         """
@@ -67,19 +82,21 @@ class GoogleMapsProvider(QgsProcessingProvider):
         """
         return 'googlemaps'
 
-    def set_config(self, api_key, region):
-        """
-        Sets the api key
-        """
-        self.api_key = api_key
-        self.region = region
-        self.refreshAlgorithms()
-
     def loadAlgorithms(self):
         """
-        Called when provider must populate its available algorithms
-        """
-        self.addAlgorithm(GoogleMapsBatchGeocode(self.api_key, self.region))
+        Called when provider must populate its available algorithms.
+
+        This happens while QGIS starts, so the algorithms only read the
+        configuration when created -- their geocoders are created when they run.
+        """
+        self.addAlgorithm(GoogleMapsBatchGeocode())
+        self.addAlgorithm(GoogleMapsMultiLayerGeocode())
+        self.addAlgorithm(GoogleMapsRetryFailures())
+        self.addAlgorithm(GoogleMapsReverseGeocode())
+        self.addAlgorithm(GoogleMapsBuildGazetteer())
+        self.addAlgorithm(GoogleMapsWarmCache())
+        self.addAlgorithm(GoogleMapsExportCache())
+        self.addAlgorithm(GoogleMapsImportCache())
 
     def tr(self, string, context=''):
         """
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    retry_algorithm.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+from collections import deque
+
+from qgis.PyQt.QtCore import QCoreApplication
+from qgis.core import (
+    NULL,
+    QgsCoordinateReferenceSystem,
+    QgsCoordinateTransform,
+    QgsCsException,
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsFeatureSink,
+    QgsProcessing,
+    QgsProcessingAlgorithm,
+    QgsProcessingException,
+    QgsProcessingOutputNumber,
+    QgsProcessingOutputVectorLayer,
+    QgsProcessingParameterDefinition,
+    QgsProcessingParameterFeatureSink,
+    QgsProcessingParameterFeatureSource,
+    QgsProcessingParameterField,
+    QgsProcessingParameterNumber,
+    QgsProcessingParameterVectorLayer,
+    QgsVectorDataProvider,
+    QgsWkbTypes
+)
+
+from google_maps_geocoder.core.address import canonical_address
+from google_maps_geocoder.core.async_transport import AsyncGeocodeTransport
+from google_maps_geocoder.core.config import GoogleMapsConfig
+from google_maps_geocoder.core.geocoder import GoogleMapsGeocoder
+from google_maps_geocoder.processing.algorithm import GoogleMapsBatchGeocode
+
+
+class GoogleMapsRetryFailures(QgsProcessingAlgorithm):
+    """
+    Retries the failed features captured by a batch geocoding run, and
+    patches successful results back into the geocoded layer from that run
+    """
+
+    FAILURES = 'FAILURES'
+    FIELD = 'FIELD'
+    TARGET = 'TARGET'
+    MAX_IN_FLIGHT = 'MAX_IN_FLIGHT'
+    REMAINING = 'REMAINING'
+    PATCHED = 'PATCHED'
+
+    # number of pending requests to queue per request in flight
+    QUEUE_FACTOR = 4
+    # number of features changed per data provider call
+    PATCH_BATCH_SIZE = 1000
+
+    def __init__(self):
+        super().__init__()
+        # each run uses the configuration current when its instance is created,
+        # but its geocoder is only created once it is needed
+        self.config_values = GoogleMapsConfig.instance().values()
+        self._coder = None
+
+    @property
+    def coder(self) -> GoogleMapsGeocoder:
+        """
+        Returns the geocoder used for this run, creating it on first use
+        """
+        if self._coder is None:
+            self._coder = GoogleMapsGeocoder(*self.config_values)
+        return self._coder
+
+    def groupId(self):  # pylint: disable=missing-function-docstring
+        return None
+
+    def group(self):  # pylint: disable=missing-function-docstring
+        return None
+
+    def name(self):  # pylint: disable=missing-function-docstring
+        return 'google_maps_retry_failures'
+
+    def displayName(self):  # pylint: disable=missing-function-docstring
+        return self.tr('Retry failed geocoding')
+
+    def shortHelpString(self):  # pylint: disable=missing-function-docstring
+        return self.tr('Geocodes the failed features captured by a previous run of the Google Maps batch '
+                       'geocoder, and updates the matching features of the geocoded layer from that run with '
+                       'any successful results.\n\n'
+                       'The geocoded layer must have been created with the failed features output enabled, so '
+                       'that it contains a source_fid field. Features which still fail are written to the '
+                       'remaining failures output, which can be retried again later. If the '
+                       'algorithm is canceled, the features not yet retried are also written to this output.\n\n'
+                       'The geocoded layer is updated in place, and must not be in edit mode.')
+
+    def createInstance(self):  # pylint: disable=missing-function-docstring
+        return GoogleMapsRetryFailures()
+
+    def flags(self):  # pylint: disable=missing-function-docstring
+        # the geocoded layer is changed in place, so must not be modified from a background thread
+        return super().flags() | QgsProcessingAlgorithm.FlagNoThreading
+
+    @staticmethod
+    def tr(string):
+        """
+        Translates a string
+        """
+        return QCoreApplication.translate('GoogleMaps', string)
+
+    def initAlgorithm(self, configuration=None):  # pylint: disable=missing-function-docstring
+        self.addParameter(QgsProcessingParameterFeatureSource(self.FAILURES,
+                                                              self.tr('Failed features'),
+                                                              [QgsProcessing.TypeVector]))
+        self.addParameter(QgsProcessingParameterField(self.FIELD,
+                                                      self.tr('Address field'),
+                                                      parentLayerParameterName=self.FAILURES,
+                                                      type=QgsProcessingParameterField.String))
+        self.addParameter(QgsProcessingParameterVectorLayer(self.TARGET,
+                                                            self.tr('Geocoded layer to update'),
+                                                            [QgsProcessing.TypeVectorPoint]))
+
+        in_flight_param = QgsProcessingParameterNumber(self.MAX_IN_FLIGHT,
+                                                       self.tr('Maximum requests in flight'),
+                                                       QgsProcessingParameterNumber.Integer,
+                                                       defaultValue=16, minValue=1, maxValue=256)
+        in_flight_param.setFlags(in_flight_param.flags() | QgsProcessingParameterDefinition.FlagAdvanced)
+        self.addParameter(in_flight_param)
+
+        self.addParameter(QgsProcessingParameterFeatureSink(self.REMAINING,
+                                                            self.tr('Remaining failures'),
+                                                            QgsProcessing.TypeVector,
+                                                            optional=True))
+        self.addOutput(QgsProcessingOutputVectorLayer(self.TARGET, self.tr('Updated layer')))
+        self.addOutput(QgsProcessingOutputNumber(self.PATCHED, self.tr('Updated features')))
+
+    def processAlgorithm(self, parameters, context, feedback):  # pylint: disable=missing-function-docstring
+        source = self.parameterAsSource(parameters, self.FAILURES, context)
+        if source is None:
+            raise QgsProcessingException(self.invalidSourceError(parameters, self.FAILURES))
+
+        fields = source.fields()
+        address_index = fields.lookupField(self.parameterAsString(parameters, self.FIELD, context))
+        source_fid_index = fields.lookupField(GoogleMapsBatchGeocode.SOURCE_FID_FIELD)
+        attempts_index = fields.lookupField(GoogleMapsBatchGeocode.ATTEMPTS_FIELD)
+        reason_index = fields.lookupField(GoogleMapsBatchGeocode.FAILURE_REASON_FIELD)
+        status_index = fields.lookupField(GoogleMapsBatchGeocode.FAILURE_STATUS_FIELD)
+        if min(source_fid_index, attempts_index, reason_index, status_index) < 0:
+            raise QgsProcessingException(self.tr('The failed features layer was not created by the Google Maps '
+                                                 'batch geocoder'))
+
+        target = self.parameterAsVectorLayer(parameters, self.TARGET, context)
+        if target is None:
+            raise QgsProcessingException(self.invalidSourceError(parameters, self.TARGET))
+        target_fid_index = target.fields().lookupField(GoogleMapsBatchGeocode.SOURCE_FID_FIELD)
+        if target_fid_index < 0:
+            raise QgsProcessingException(self.tr('The geocoded layer has no {} field -- it was not created with '
+                                                 'the failed features output enabled').format(
+                GoogleMapsBatchGeocode.SOURCE_FID_FIELD))
+
+        if target.isEditable():
+            raise QgsProcessingException(self.tr('The geocoded layer is being edited -- save or discard the '
+                                                 'edits before retrying'))
+
+        provider = target.dataProvider()
+        required = QgsVectorDataProvider.ChangeAttributeValues | QgsVectorDataProvider.ChangeGeometries
+        if provider.capabilities() & required != required:
+            raise QgsProcessingException(self.tr('The geocoded layer cannot be updated'))
+
+        (remaining_sink, remaining_dest_id) = self.parameterAsSink(parameters, self.REMAINING, context,
+                                                                   fields, QgsWkbTypes.NoGeometry)
+
+        # source feature ID -> feature ID in the geocoded layer
+        failures = list(source.getFeatures())
+        wanted = {failure.attributes()[source_fid_index] for failure in failures}
+        target_fids = {}
+        request = QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry).setSubsetOfAttributes(
+            [target_fid_index])
+        for feature in target.getFeatures(request):
+            source_fid = feature.attributes()[target_fid_index]
+            if source_fid in wanted:
+                target_fids[source_fid] = feature.id()
+
+        result_indices = [(name, target.fields().lookupField(name))
+                          for name in (field.name() for field in self.coder.appendedFields())]
+        result_indices = [(name, index) for name, index in result_indices if index >= 0]
+        transform = QgsCoordinateTransform(QgsCoordinateReferenceSystem('EPSG:4326'), target.crs(),
+                                           context.transformContext())
+
+        attribute_changes = {}
+        geometry_changes = {}
+        patched = 0
+        remaining = 0
+
+        def write_remaining(failure, reason, status, attempts):
+            nonlocal remaining
+            remaining += 1
+            if remaining_sink is None:
+                return
+            attributes = failure.attributes()
+            attributes[reason_index] = reason
+            attributes[status_index] = status
+            attributes[attempts_index] = attempts
+            feature = QgsFeature(fields)
+            feature.setAttributes(attributes)
+            remaining_sink.addFeature(feature, QgsFeatureSink.FastInsert)
+
+        def flush():
+            if attribute_changes:
+                provider.changeAttributeValues(attribute_changes)
+                attribute_changes.clear()
+            if geometry_changes:
+                provider.changeGeometryValues(geometry_changes)
+                geometry_changes.clear()
+
+        def complete(failure, request):
+            nonlocal patched
+            response = request.result()
+            attributes = failure.attributes()
+            address = attributes[address_index]
+            previous_attempts = attributes[attempts_index]
+            attempts = (previous_attempts if previous_attempts not in (None, NULL) else 0) + response.attempts
+            target_fid = target_fids.get(attributes[source_fid_index])
+
+            if not response.is_valid():
+                feedback.reportError(self.tr('Error geocoding {}: {}').format(address, response.error))
+                write_remaining(failure, response.error, response.status, attempts)
+                return
+            if not response.results:
+                feedback.reportError(self.tr('No result found for {}').format(address))
+                write_remaining(failure, self.tr('No result found'), response.status, attempts)
+                return
+            if target_fid is None:
+                feedback.reportError(self.tr('No feature with {} {} found in the geocoded layer').format(
+                    GoogleMapsBatchGeocode.SOURCE_FID_FIELD, attributes[source_fid_index]))
+                write_remaining(failure, self.tr('Feature not found in the geocoded layer'), response.status,
+                                attempts)
+                return
+
+            result = self.coder.coder.jsonToResult(response.results[0])
+            geometry = result.geometry()
+            try:
+                geometry.transform(transform)
+            except QgsCsException:
+                write_remaining(failure, self.tr('Could not transform result'), response.status, attempts)
+                return
+
+            result_attributes = result.additionalAttributes()
+            attribute_changes[target_fid] = {index: result_attributes.get(name) for name, index in result_indices}
+            geometry_changes[target_fid] = geometry
+            patched += 1
+            if len(attribute_changes) >= self.PATCH_BATCH_SIZE:
+                flush()
+
+        transport = AsyncGeocodeTransport(self.coder, self.parameterAsInt(parameters, self.MAX_IN_FLIGHT, context),
+                                          feedback)
+        window_size = transport.max_in_flight * self.QUEUE_FACTOR
+        # canonical address -> pending request, so repeated addresses are only retried once
+        requests = {}
+        pending = deque()
+        total = 100.0 / len(failures) if failures else 0
+        # number of failures taken from the failed features layer
+        queued = 0
+        try:
+            for current, failure in enumerate(failures):
+                if feedback.isCanceled():
+                    break
+                queued = current + 1
+
+                address = failure.attributes()[address_index]
+                if address is None or address == NULL or not str(address):
+                    write_remaining(failure, self.tr('Empty address field'), None,
+                                    failure.attributes()[attempts_index])
+                    continue
+
+                key = canonical_address(str(address))
+                if key not in requests:
+                    requests[key] = transport.geocode(str(address))
+                pending.append((failure, requests[key]))
+
+                transport.process_events()
+                while pending and (len(pending) >= window_size or pending[0][1].done()):
+                    complete(*pending.popleft())
+
+                feedback.setProgress(int(current * total))
+
+            while pending and not feedback.isCanceled():
+                complete(*pending.popleft())
+        finally:
+            transport.shutdown()
+            flush()
+            if patched:
+                target.reload()
+                target.triggerRepaint()
+
+        if feedback.isCanceled():
+            # failures which were not retried are kept unchanged, so that they can be retried later
+            not_retried = [failure for failure, _ in pending] + failures[queued:]
+            for failure in not_retried:
+                attributes = failure.attributes()
+                write_remaining(failure, attributes[reason_index], attributes[status_index],
+                                attributes[attempts_index])
+            feedback.pushInfo(self.tr('Canceled, {} failures were not retried').format(len(not_retried)))
+
+        feedback.pushInfo(self.tr('{} features updated, {} still failed').format(patched, remaining))
+        feedback.pushInfo(self.tr('Request statistics:\n{}').format(self.coder.statistics.summary()))
+
+        results = {self.TARGET: target.id(), self.PATCHED: patched}
+        if remaining_sink is not None:
+            results[self.REMAINING] = remaining_dest_id
+        return results
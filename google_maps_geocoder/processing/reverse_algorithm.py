@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    reverse_algorithm.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor
+)
+
+from qgis.PyQt.QtCore import QCoreApplication
+from qgis.core import (
+    QgsCoordinateReferenceSystem,
+    QgsCoordinateTransform,
+    QgsCsException,
+    QgsFeatureRequest,
+    QgsFeatureSink,
+    QgsPointXY,
+    QgsProcessing,
+    QgsProcessingAlgorithm,
+    QgsProcessingException,
+    QgsProcessingFeatureSource,
+    QgsProcessingParameterDefinition,
+    QgsProcessingParameterFeatureSink,
+    QgsProcessingParameterFeatureSource,
+    QgsProcessingParameterNumber,
+    QgsProcessingUtils
+)
+
+from google_maps_geocoder.core.config import GoogleMapsConfig
+from google_maps_geocoder.core.geocoder import GoogleMapsGeocoder
+from google_maps_geocoder.core.snap_grid import SnapGridCache
+
+
+class GoogleMapsReverseGeocode(QgsProcessingAlgorithm):
+    """
+    Reverse geocodes point features to addresses.
+
+    Points are snapped to a grid, and all points falling in the same grid
+    cell share a single lookup made at the cell centre.
+    """
+
+    INPUT = 'INPUT'
+    CELL_SIZE = 'CELL_SIZE'
+    CONCURRENT_REQUESTS = 'CONCURRENT_REQUESTS'
+    OUTPUT = 'OUTPUT'
+
+    DEFAULT_CELL_SIZE = 25
+
+    # number of pending requests to queue per concurrent request
+    QUEUE_FACTOR = 4
+
+    def __init__(self):
+        super().__init__()
+        # each run uses the configuration current when its instance is created,
+        # but its geocoder is only created once it is needed
+        self.config_values = GoogleMapsConfig.instance().values()
+        self._coder = None
+
+    @property
+    def coder(self) -> GoogleMapsGeocoder:
+        """
+        Returns the geocoder used for this run, creating it on first use
+        """
+        if self._coder is None:
+            self._coder = GoogleMapsGeocoder(*self.config_values)
+        return self._coder
+
+    def groupId(self):  # pylint: disable=missing-function-docstring
+        return None
+
+    def group(self):  # pylint: disable=missing-function-docstring
+        return None
+
+    def name(self):  # pylint: disable=missing-function-docstring
+        return 'google_maps_reverse_geocode'
+
+    def displayName(self):  # pylint: disable=missing-function-docstring
+        return self.tr('Google Maps batch reverse geocoder')
+
+    def shortHelpString(self):  # pylint: disable=missing-function-docstring
+        return self.tr('Reverse geocodes point features to addresses using the Google Maps API.\n\n'
+                       'Points falling within the same grid cell reuse a single lookup, made at the '
+                       'centre of the cell. Set the cell size to 0 to only reuse lookups for '
+                       'identical points.')
+
+    def createInstance(self):  # pylint: disable=missing-function-docstring
+        return GoogleMapsReverseGeocode()
+
+    @staticmethod
+    def tr(string):
+        """
+        Translates a string
+        """
+        return QCoreApplication.translate('GoogleMaps', string)
+
+    def initAlgorithm(self, configuration=None):  # pylint: disable=missing-function-docstring
+        self.addParameter(QgsProcessingParameterFeatureSource(self.INPUT,
+                                                              self.tr('Input layer'),
+                                                              [QgsProcessing.TypeVectorPoint]))
+
+        self.addParameter(QgsProcessingParameterNumber(self.CELL_SIZE,
+                                                       self.tr('Snapping cell size (meters)'),
+                                                       QgsProcessingParameterNumber.Double,
+                                                       defaultValue=self.DEFAULT_CELL_SIZE, minValue=0))
+
+        concurrent_param = QgsProcessingParameterNumber(self.CONCURRENT_REQUESTS,
+                                                        self.tr('Concurrent requests'),
+                                                        QgsProcessingParameterNumber.Integer,
+                                                        defaultValue=1, minValue=1, maxValue=64)
+        concurrent_param.setFlags(concurrent_param.flags() | QgsProcessingParameterDefinition.FlagAdvanced)
+        self.addParameter(concurrent_param)
+
+        self.addParameter(QgsProcessingParameterFeatureSink(self.OUTPUT,
+                                                            self.tr('Reverse geocoded'),
+                                                            QgsProcessing.TypeVectorPoint))
+
+    def processAlgorithm(self, parameters, context, feedback):  # pylint: disable=missing-function-docstring
+        source = self.parameterAsSource(parameters, self.INPUT, context)
+        if source is None:
+            raise QgsProcessingException(self.invalidSourceError(parameters, self.INPUT))
+
+        cell_size = self.parameterAsDouble(parameters, self.CELL_SIZE, context)
+        concurrent_requests = self.parameterAsInt(parameters, self.CONCURRENT_REQUESTS, context)
+
+        appended_fields = self.coder.appendedFields()
+        (sink, dest_id) = self.parameterAsSink(parameters, self.OUTPUT, context,
+                                               QgsProcessingUtils.combineFields(source.fields(), appended_fields),
+                                               source.wkbType(), source.sourceCrs())
+        if sink is None:
+            raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
+
+        transform = QgsCoordinateTransform(source.sourceCrs(), QgsCoordinateReferenceSystem('EPSG:4326'),
+                                           context.transformContext())
+        grid = SnapGridCache(cell_size)
+
+        total = 100.0 / source.featureCount() if source.featureCount() else 0
+        features = source.getFeatures(QgsFeatureRequest(), QgsProcessingFeatureSource.FlagSkipGeometryValidityChecks)
+
+        # (feature, cell, response or future) tuples, written in their original order
+        pending = deque()
+
+        def write_next():
+            feature, cell, response = pending.popleft()
+            if isinstance(response, Future):
+                future = response
+                response = future.result()
+                if not response.is_valid():
+                    # don't reuse a failed lookup for later points in the cell
+                    grid.discard(cell, future)
+            self.write_feature(sink, feature, response, appended_fields, feedback)
+
+        executor = ThreadPoolExecutor(max_workers=concurrent_requests) if concurrent_requests > 1 else None
+        try:
+            for current, feature in enumerate(features):
+                if feedback.isCanceled():
+                    break
+
+                cell = self.cell_for_feature(feature, transform, grid, feedback)
+                response = grid.get(cell) if cell is not None else None
+                if response is not None and not self.reusable(response):
+                    grid.discard(cell, response)
+                    response = None
+                if cell is not None and response is None:
+                    point = QgsPointXY(*grid.centre(cell))
+                    if executor is not None:
+                        # in-flight lookups are shared, and evicted once complete if they failed
+                        response = executor.submit(self.coder.reverse_geocode, point, feedback)
+                        grid.put(cell, response)
+                    else:
+                        response = self.coder.reverse_geocode(point, feedback)
+                        if response.is_valid():
+                            grid.put(cell, response)
+
+                pending.append((feature, cell, response))
+                while pending and (len(pending) >= concurrent_requests * self.QUEUE_FACTOR or
+                                   not isinstance(pending[0][2], Future) or pending[0][2].done()):
+                    write_next()
+
+                feedback.setProgress(int(current * total))
+
+            while pending and not feedback.isCanceled():
+                write_next()
+        finally:
+            if executor is not None:
+                for _, _, response in pending:
+                    if isinstance(response, Future):
+                        response.cancel()
+                executor.shutdown(wait=True)
+
+        feedback.pushInfo(self.tr('{} grid cells looked up, {} features reused a previous lookup').format(
+            grid.misses, grid.hits))
+        feedback.pushInfo(self.tr('Request statistics:\n{}').format(self.coder.statistics.summary()))
+        return {self.OUTPUT: dest_id}
+
+    def cell_for_feature(self, feature, transform, grid: SnapGridCache, feedback):
+        """
+        Returns the snapping grid cell containing a feature's point, or None
+        if the feature has no valid point
+        """
+        geometry = feature.geometry()
+        if geometry.isEmpty():
+            feedback.reportError(self.tr('No geometry for feature {}').format(feature.id()))
+            return None
+
+        # for multipoint features only the first point is used
+        point = geometry.vertexAt(0)
+        try:
+            point = transform.transform(QgsPointXY(point.x(), point.y()))
+        except QgsCsException:
+            feedback.reportError(self.tr('Could not transform point for feature {}').format(feature.id()))
+            return None
+
+        return grid.cell(point.x(), point.y())
+
+    @staticmethod
+    def reusable(response) -> bool:
+        """
+        Returns False if a cached response, or a completed future, failed and
+        so should not be shared with further points
+        """
+        if isinstance(response, Future):
+            if not response.done():
+                return True
+            if response.cancelled() or response.exception() is not None:
+                return False
+            response = response.result()
+        return response.is_valid()
+
+    def write_feature(self, sink, feature, response, appended_fields, feedback):
+        """
+        Adds the reverse geocoded result for a feature to the sink
+        """
+        attributes = feature.attributes()
+        if response is not None and not response.is_valid():
+            feedback.reportError(self.tr('Error reverse geocoding feature {}: {}').format(feature.id(),
+                                                                                         response.error))
+        elif response is not None and not response.results:
+            feedback.reportError(self.tr('No result found for feature {}').format(feature.id()))
+        elif response is not None:
+            result = self.coder.coder.jsonToResult(response.results[0])
+            result_attributes = result.additionalAttributes()
+            attributes.extend(result_attributes.get(field.name()) for field in appended_fields)
+            feature.setAttributes(attributes)
+            sink.addFeature(feature, QgsFeatureSink.FastInsert)
+            return
+
+        attributes.extend([None] * appended_fields.count())
+        feature.setAttributes(attributes)
+        sink.addFeature(feature, QgsFeatureSink.FastInsert)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    sharding.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from typing import (
+    List,
+    Optional,
+    Tuple
+)
+
+from qgis.PyQt.QtCore import QCoreApplication
+from qgis.core import (
+    QgsApplication,
+    QgsFeatureRequest,
+    QgsProcessingException,
+    QgsProcessingFeedback
+)
+
+
+def tr(string):
+    """
+    Translates a string
+    """
+    return QCoreApplication.translate('GoogleMaps', string)
+
+
+def split_feature_ids(feature_ids: List[int], shard_count: int) -> List[List[int]]:
+    """
+    Splits a sorted list of feature IDs into at most shard_count contiguous
+    shards, each holding a similar number of features
+    """
+    shard_count = max(1, min(shard_count, len(feature_ids)))
+    shards = []
+    for shard in range(shard_count):
+        start = shard * len(feature_ids) // shard_count
+        end = (shard + 1) * len(feature_ids) // shard_count
+        if end > start:
+            shards.append(feature_ids[start:end])
+    return shards
+
+
+def write_feature_ids(path: str, feature_ids: List[int]):
+    """
+    Writes the feature IDs of a shard to a file, for its worker process
+    """
+    with open(path, 'wt', encoding='utf-8') as f:
+        json.dump(feature_ids, f)
+
+
+def read_feature_ids(path: str) -> Optional[List[int]]:
+    """
+    Reads the feature IDs of a shard, or returns None if no file is given
+    """
+    if not path:
+        return None
+    with open(path, 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def shard_request(feature_ids: Optional[List[int]]) -> QgsFeatureRequest:
+    """
+    Returns a feature request restricted to the feature IDs of a shard.
+
+    Filtering by feature ID lets the provider fetch just the shard's features,
+    rather than every worker scanning the whole layer.
+    """
+    request = QgsFeatureRequest()
+    if feature_ids is not None:
+        request.setFilterFids(feature_ids)
+    return request
+
+
+def parse_range(value: str) -> Optional[Tuple[int, int]]:
+    """
+    Parses a 'first:last' feature ID range
+    """
+    if not value:
+        return None
+    first, last = value.split(':')
+    return int(first), int(last)
+
+
+def qgis_process_path() -> str:
+    """
+    Returns the path to the qgis_process executable
+    """
+    candidates = ['qgis_process', 'qgis_process.exe', 'qgis_process-qgis.bat', 'qgis_process-qgis-ltr.bat']
+    for directory in (QgsApplication.applicationDirPath(), os.path.dirname(sys.executable)):
+        for candidate in candidates:
+            path = os.path.join(directory, candidate)
+            if os.path.isfile(path):
+                return path
+
+    for candidate in candidates:
+        path = shutil.which(candidate)
+        if path:
+            return path
+
+    raise QgsProcessingException(tr('Could not find the qgis_process executable, which is required '
+                                    'for sharded geocoding'))
+
+
+class ShardWorkers:
+    """
+    Runs shards of a batch geocoding job in separate qgis_process workers
+    """
+
+    # interval between checks for completed workers and cancelation, in seconds
+    POLL_INTERVAL = 0.2
+
+    def __init__(self, algorithm_id: str, work_folder: str):
+        self.algorithm_id = algorithm_id
+        self.work_folder = work_folder
+        self.executable = qgis_process_path()
+        self.processes = []
+        self.logs = []
+
+    def start(self, shard: int, parameters: dict):
+        """
+        Starts a worker for a shard, with the given algorithm parameters
+        """
+        arguments = [self.executable, 'run', self.algorithm_id, '--']
+        arguments.extend('{}={}'.format(name, value) for name, value in parameters.items())
+
+        log_path = os.path.join(self.work_folder, 'shard_{}.log'.format(shard))
+        with open(log_path, 'wb') as log:
+            self.processes.append(subprocess.Popen(arguments, stdout=log, stderr=subprocess.STDOUT,
+                                                   stdin=subprocess.DEVNULL))
+        self.logs.append(log_path)
+
+    def wait(self, feedback: QgsProcessingFeedback) -> bool:
+        """
+        Waits for all workers to complete, reporting progress as workers
+        finish. Workers are terminated if the feedback is canceled.
+
+        Returns False if canceled.
+        """
+        while True:
+            finished = sum(1 for process in self.processes if process.poll() is not None)
+            feedback.setProgress(int(100 * finished / len(self.processes)))
+            if finished == len(self.processes):
+                break
+
+            if feedback.isCanceled():
+                for process in self.processes:
+                    if process.poll() is None:
+                        process.terminate()
+                for process in self.processes:
+                    process.wait()
+                return False
+
+            time.sleep(self.POLL_INTERVAL)
+
+        for shard, process in enumerate(self.processes):
+            if process.returncode != 0:
+                with open(self.logs[shard], 'rt', encoding='utf-8', errors='replace') as log:
+                    output = log.read()[-2000:]
+                raise QgsProcessingException(tr('Geocoding worker {} failed:\n{}').format(shard + 1, output))
+
+        return True
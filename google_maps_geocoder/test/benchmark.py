@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    benchmark.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+
+Throughput and latency benchmarks for the batch geocode algorithm and the
+locator filter, run against the local mock geocoding server.
+
+For each dataset size the benchmark reports rows/sec, p50/p95/p99 request
+latency and peak memory use. Each dataset, and the locator benchmark, is run
+in a separate process so that peak memory figures are independent:
+
+    python -m google_maps_geocoder.test.benchmark --features 1000 100000 1000000
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from qgis.core import (
+    QgsApplication,
+    QgsFeature,
+    QgsFeedback,
+    QgsLocatorContext,
+    QgsProcessingContext,
+    QgsProcessingFeedback,
+    QgsSettings,
+    QgsVectorLayer
+)
+
+from google_maps_geocoder.core.cache import GeocodeCache
+from google_maps_geocoder.core.config import GoogleMapsConfig
+from google_maps_geocoder.core.geocoder import GoogleMapsGeocoder
+from google_maps_geocoder.core.rate_limiter import RateLimiter
+from google_maps_geocoder.gui.locator_filter import GoogleMapsLocatorFilter
+from google_maps_geocoder.processing.provider import GoogleMapsProvider
+from google_maps_geocoder.test.mock_geocoding_server import MockGeocodingServer
+
+DEFAULT_SIZES = [1000, 100000, 1000000]
+
+
+def percentile(values, percent: float) -> float:
+    """
+    Returns the nearest-rank percentile of a list of values
+    """
+    if not values:
+        return 0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(percent / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class RequestTimer:
+    """
+    Records the latency of every network request made by the geocoder
+    """
+
+    def __init__(self):
+        self.latencies = []
+        self._lock = threading.Lock()
+        self._original_record_request = GoogleMapsGeocoder.record_request
+
+    def __enter__(self):
+        original_record_request = self._original_record_request
+
+        def record_request(geocoder, latency, status):
+            with self._lock:
+                self.latencies.append(latency)
+            original_record_request(geocoder, latency, status)
+
+        GoogleMapsGeocoder.record_request = record_request
+        return self
+
+    def __exit__(self, *args):
+        GoogleMapsGeocoder.record_request = self._original_record_request
+
+    def summary(self) -> dict:
+        """
+        Returns the latency percentiles, in milliseconds
+        """
+        return {'requests': len(self.latencies),
+                'p50_ms': percentile(self.latencies, 50) * 1000,
+                'p95_ms': percentile(self.latencies, 95) * 1000,
+                'p99_ms': percentile(self.latencies, 99) * 1000}
+
+
+def peak_memory_mb() -> float:
+    """
+    Returns the peak resident memory of the current process, in MB
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS, and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def create_input_layer(feature_count: int, unique_addresses: int) -> QgsVectorLayer:
+    """
+    Creates a memory layer with a synthetic address field
+    """
+    layer = QgsVectorLayer('None?field=id:integer&field=address:string(100)', 'addresses', 'memory')
+    features = []
+    for i in range(feature_count):
+        feature = QgsFeature(layer.fields())
+        address_id = i % unique_addresses
+        feature.setAttributes([i, '{} Benchmark Street, Suburb {}'.format(address_id, address_id % 97)])
+        features.append(feature)
+        if len(features) >= 10000:
+            layer.dataProvider().addFeatures(features)
+            features = []
+    layer.dataProvider().addFeatures(features)
+    return layer
+
+
+def benchmark_batch(feature_count: int, args, output_dir: str) -> dict:
+    """
+    Benchmarks the batch geocode algorithm
+    """
+    layer = create_input_layer(feature_count, max(1, int(feature_count * args.unique_ratio)))
+    alg = QgsApplication.processingRegistry().createAlgorithmById('googlemaps:google_maps_geocode')
+    parameters = {
+        'INPUT': layer,
+        'FIELD': 'address',
+        'CONCURRENT_REQUESTS': args.concurrency,
+        'TRANSPORT': 0 if args.transport == 'threads' else 1,
+        'MAX_IN_FLIGHT': args.in_flight,
+        'DEDUPLICATE': args.unique_ratio < 1,
+        'CHUNK_SIZE': args.chunk_size,
+        'OUTPUT': os.path.join(output_dir, 'batch_{}.gpkg'.format(feature_count))
+    }
+
+    context = QgsProcessingContext()
+    feedback = QgsProcessingFeedback()
+    with RequestTimer() as timer:
+        start = time.perf_counter()
+        _, ok = alg.run(parameters, context, feedback)
+        elapsed = time.perf_counter() - start
+
+    result = {'benchmark': 'batch', 'features': feature_count, 'ok': ok,
+              'seconds': elapsed, 'rows_per_sec': feature_count / elapsed if elapsed else 0}
+    result.update(timer.summary())
+    return result
+
+
+def benchmark_locator(query_count: int) -> dict:
+    """
+    Benchmarks the locator filter
+    """
+    QgsSettings().setValue(GoogleMapsLocatorFilter.SETTINGS_DEBOUNCE_MS, 0)
+    geocoder = GoogleMapsGeocoder('benchmark', '')
+    locator_filter = GoogleMapsLocatorFilter(lambda: geocoder, None)
+    results = []
+    locator_filter.resultFetched.connect(results.append)
+
+    context = QgsLocatorContext()
+    query_latencies = []
+    with RequestTimer() as timer:
+        start = time.perf_counter()
+        for i in range(query_count):
+            query_start = time.perf_counter()
+            locator_filter.fetchResults('{} Locator Street'.format(i), context, QgsFeedback())
+            query_latencies.append(time.perf_counter() - query_start)
+        elapsed = time.perf_counter() - start
+
+    result = {'benchmark': 'locator', 'queries': query_count, 'results': len(results),
+              'seconds': elapsed, 'queries_per_sec': query_count / elapsed if elapsed else 0,
+              'query_p50_ms': percentile(query_latencies, 50) * 1000,
+              'query_p95_ms': percentile(query_latencies, 95) * 1000,
+              'query_p99_ms': percentile(query_latencies, 99) * 1000}
+    result.update(timer.summary())
+    return result
+
+
+def run_single(args) -> dict:
+    """
+    Runs a single benchmark in this process
+    """
+    profile_dir = tempfile.mkdtemp(prefix='google_maps_benchmark_')
+    app = QgsApplication([], False, profile_dir)
+    app.initQgis()
+
+    # isolate the benchmark from the user's cache and request limits
+    settings = QgsSettings()
+    settings.setValue(GeocodeCache.SETTINGS_ENABLED, args.cache)
+    settings.setValue(GeocodeCache.SETTINGS_PATH, os.path.join(profile_dir, 'cache.sqlite'))
+    settings.setValue(RateLimiter.SETTINGS_MAX_QPS, args.max_qps)
+
+    server = MockGeocodingServer(latency=args.latency, latency_jitter=args.latency_jitter,
+                                 error_rate=args.error_rate, over_query_limit_rate=args.over_query_limit_rate,
+                                 seed=0)
+    os.environ[GoogleMapsGeocoder.ENDPOINT_ENVIRONMENT_VARIABLE] = server.start()
+
+    GoogleMapsConfig.instance().update('benchmark', '')
+    provider = GoogleMapsProvider()
+    QgsApplication.processingRegistry().addProvider(provider)
+
+    if args.benchmark == 'locator':
+        result = benchmark_locator(args.locator_queries)
+    else:
+        result = benchmark_batch(args.features[0], args, profile_dir)
+
+    server.stop()
+    # the peak is only meaningful because this process runs no other benchmark
+    result['peak_memory_mb'] = peak_memory_mb()
+
+    QgsApplication.processingRegistry().removeProvider(provider)
+    app.exitQgis()
+    return result
+
+
+def run_child(benchmark_args: list) -> dict:
+    """
+    Runs a single benchmark in a fresh process, with the command line options
+    of this process and the given benchmark arguments
+    """
+    child_args = [arg for arg in sys.argv[1:] if arg != '--json']
+    # remove the list of sizes, the child is given a single size or none
+    index = child_args.index('--features') if '--features' in child_args else None
+    if index is not None:
+        end = index + 1
+        while end < len(child_args) and not child_args[end].startswith('--'):
+            end += 1
+        del child_args[index:end]
+    command = [sys.executable, '-m', 'google_maps_geocoder.test.benchmark'] + benchmark_args + child_args
+    output = subprocess.run(command, check=True, stdout=subprocess.PIPE).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def print_results(results: list):
+    """
+    Prints a summary table of benchmark results
+    """
+    print('{:<10}{:>10}{:>12}{:>12}{:>10}{:>10}{:>10}{:>12}'.format(
+        'benchmark', 'size', 'seconds', 'rate/sec', 'p50 ms', 'p95 ms', 'p99 ms', 'peak MB'))
+    for result in results:
+        print('{:<10}{:>10}{:>12.2f}{:>12.1f}{:>10.1f}{:>10.1f}{:>10.1f}{:>12.1f}'.format(
+            result['benchmark'],
+            result.get('features', result.get('queries')),
+            result['seconds'],
+            result.get('rows_per_sec', result.get('queries_per_sec')),
+            result['p50_ms'], result['p95_ms'], result['p99_ms'],
+            result['peak_memory_mb']))
+
+
+def main():
+    """
+    Runs the benchmarks from the command line
+    """
+    parser = argparse.ArgumentParser(description='Google Maps geocoder benchmarks')
+    parser.add_argument('--features', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='dataset sizes to benchmark')
+    parser.add_argument('--unique-ratio', type=float, default=1.0,
+                        help='fraction of unique addresses in each dataset')
+    parser.add_argument('--transport', choices=['threads', 'async'], default='async',
+                        help='request transport for batch runs')
+    parser.add_argument('--concurrency', type=int, default=8, help='concurrent requests for threaded batch runs')
+    parser.add_argument('--in-flight', type=int, default=16, help='requests in flight for async batch runs')
+    parser.add_argument('--chunk-size', type=int, default=0, help='chunk size for streaming batch runs')
+    parser.add_argument('--locator-queries', type=int, default=200, help='locator searches to benchmark')
+    parser.add_argument('--cache', action='store_true', help='enable the result cache')
+    parser.add_argument('--max-qps', type=float, default=0, help='client request rate limit')
+    parser.add_argument('--latency', type=float, default=0.02, help='mock server latency, in seconds')
+    parser.add_argument('--latency-jitter', type=float, default=0.01,
+                        help='mock server latency jitter, in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='mock server UNKNOWN_ERROR rate')
+    parser.add_argument('--over-query-limit-rate', type=float, default=0.0,
+                        help='mock server OVER_QUERY_LIMIT rate')
+    parser.add_argument('--json', action='store_true', help='output raw results as JSON')
+    parser.add_argument('--benchmark', choices=['batch', 'locator'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.benchmark:
+        print(json.dumps(run_single(args)))
+        return
+
+    results = [run_child(['--benchmark', 'batch', '--features', str(feature_count)])
+               for feature_count in args.features]
+    if args.locator_queries:
+        results.append(run_child(['--benchmark', 'locator']))
+
+    if args.json:
+        print(json.dumps(results))
+    else:
+        print_results(results)
+
+
+if __name__ == '__main__':
+    main()
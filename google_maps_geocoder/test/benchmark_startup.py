@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    benchmark_startup.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+
+Startup time benchmark for the plugin.
+
+Measures the time taken to import the plugin package, construct the plugin
+through classFactory and run initGui, as QGIS does when loading plugins at
+startup. Each run happens in a fresh process so that module import costs
+are included, and the median of several runs is reported:
+
+    python -m google_maps_geocoder.test.benchmark_startup --runs 10
+
+To compare against another checkout of the plugin (e.g. a previous release),
+pass the directory containing its google_maps_geocoder package:
+
+    python -m google_maps_geocoder.test.benchmark_startup --plugin-path ../old-checkout
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+STAGES = ('import', 'class_factory', 'init_gui')
+
+
+def measure_startup() -> dict:
+    """
+    Measures plugin startup stages in this process, in milliseconds
+    """
+    # pylint: disable=import-outside-toplevel
+    from qgis.core import QgsSettings
+    from qgis.testing import start_app
+    from qgis.testing.mocked import get_iface
+
+    start_app()
+    # an API key is required for the locator filter to be registered
+    QgsSettings().setValue('/plugins/google_maps/api_key', 'benchmark')
+    iface = get_iface()
+
+    timings = {}
+    start = time.perf_counter()
+    import google_maps_geocoder
+    timings['import'] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    plugin = google_maps_geocoder.classFactory(iface)
+    timings['class_factory'] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    plugin.initGui()
+    timings['init_gui'] = (time.perf_counter() - start) * 1000
+
+    timings['total'] = sum(timings[stage] for stage in STAGES)
+    plugin.unload()
+    return timings
+
+
+def run_child(plugin_path: str) -> dict:
+    """
+    Measures startup in a fresh process, with an isolated QGIS profile
+    """
+    env = dict(os.environ)
+    env['QT_QPA_PLATFORM'] = 'offscreen'
+    env['QGIS_CUSTOM_CONFIG_PATH'] = tempfile.mkdtemp(prefix='google_maps_startup_')
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [plugin_path, env.get('PYTHONPATH')]))
+    # run the script by path, so that the plugin package is only imported
+    # while being timed
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child'],
+                            check=True, stdout=subprocess.PIPE, env=env).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    """
+    Runs the startup benchmark from the command line
+    """
+    parser = argparse.ArgumentParser(description='Google Maps geocoder startup benchmark')
+    parser.add_argument('--runs', type=int, default=10, help='number of startup runs')
+    parser.add_argument('--plugin-path', default=os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))), help='directory containing the google_maps_geocoder package to benchmark')
+    parser.add_argument('--json', action='store_true', help='output raw results as JSON')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure_startup()))
+        return
+
+    runs = [run_child(os.path.abspath(args.plugin_path)) for _ in range(args.runs)]
+    results = {stage: statistics.median(run[stage] for run in runs) for stage in STAGES + ('total',)}
+    results['runs'] = args.runs
+    results['plugin_path'] = os.path.abspath(args.plugin_path)
+
+    if args.json:
+        print(json.dumps(results))
+    else:
+        print('Median startup time over {} runs ({})'.format(args.runs, results['plugin_path']))
+        for stage in STAGES + ('total',):
+            print('{:<16}{:>10.1f} ms'.format(stage, results[stage]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    mock_geocoding_server.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+
+Local stand-in for the Google Maps Geocoding API.
+
+Responses are generated deterministically from the requested address (or
+coordinates), with configurable latency, error rate and OVER_QUERY_LIMIT
+injection. The server has no QGIS dependencies, and can be run standalone:
+
+    python mock_geocoding_server.py --port 8080 --latency 0.05
+
+after which the plugin can be pointed at it by setting the
+GOOGLE_MAPS_GEOCODER_ENDPOINT environment variable to the printed endpoint.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import deque
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer
+)
+from urllib.parse import (
+    parse_qs,
+    urlparse
+)
+
+
+class MockGeocodingServer:
+    """
+    Local HTTP server mimicking the Google Maps Geocoding API
+    """
+
+    PATH = '/maps/api/geocode/json'
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0, latency_jitter: float = 0.0,
+                 error_rate: float = 0.0, over_query_limit_rate: float = 0.0,
+                 max_qps: float = 0, seed=None):
+        """
+        :param latency: base response latency, in seconds
+        :param latency_jitter: maximum random latency added to the base latency, in seconds
+        :param error_rate: fraction of requests which fail with UNKNOWN_ERROR
+        :param over_query_limit_rate: fraction of requests which fail with OVER_QUERY_LIMIT
+        :param max_qps: if set, requests exceeding this rate fail with OVER_QUERY_LIMIT
+        """
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.over_query_limit_rate = over_query_limit_rate
+        self.max_qps = max_qps
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._recent_requests = deque()
+        self.request_count = 0
+        self.status_counts = {}
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Request handler for the mock server
+            """
+
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):  # pylint: disable=invalid-name,missing-function-docstring
+                status, body = server.handle(self.path)
+                content = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=UTF-8')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def endpoint(self) -> str:
+        """
+        Returns the geocoding endpoint URL for the server
+        """
+        host, port = self._server.server_address[:2]
+        return 'http://{}:{}{}'.format(host, port, self.PATH)
+
+    def start(self) -> str:
+        """
+        Starts serving requests on a background thread, and returns
+        the endpoint URL
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.endpoint
+
+    def serve_forever(self):
+        """
+        Serves requests on the current thread until interrupted
+        """
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        """
+        Stops the server
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def handle(self, path: str):
+        """
+        Handles a request path, returning the HTTP status code and JSON body
+        """
+        url = urlparse(path)
+        if url.path != self.PATH:
+            return 404, {'status': 'INVALID_REQUEST', 'results': [], 'error_message': 'Unknown path'}
+
+        query = parse_qs(url.query)
+        with self._lock:
+            self.request_count += 1
+            now = time.monotonic()
+            throttled = False
+            if self.max_qps:
+                while self._recent_requests and self._recent_requests[0] < now - 1:
+                    self._recent_requests.popleft()
+                throttled = len(self._recent_requests) >= self.max_qps
+                self._recent_requests.append(now)
+
+            roll = self._random.random()
+            delay = self.latency + self._random.random() * self.latency_jitter
+
+        if delay:
+            time.sleep(delay)
+
+        if throttled or roll < self.over_query_limit_rate:
+            body = {'status': 'OVER_QUERY_LIMIT', 'results': [],
+                    'error_message': 'You have exceeded your rate-limit for this API.'}
+        elif roll < self.over_query_limit_rate + self.error_rate:
+            body = {'status': 'UNKNOWN_ERROR', 'results': []}
+        elif 'address' in query:
+            body = self.geocode(query['address'][0])
+        elif 'latlng' in query:
+            body = self.reverse_geocode(query['latlng'][0])
+        else:
+            body = {'status': 'INVALID_REQUEST', 'results': []}
+
+        with self._lock:
+            self.status_counts[body['status']] = self.status_counts.get(body['status'], 0) + 1
+
+        return 200, body
+
+    @staticmethod
+    def geocode(address: str) -> dict:
+        """
+        Returns a deterministic geocoding response for an address
+        """
+        if not address.strip():
+            return {'status': 'ZERO_RESULTS', 'results': []}
+
+        digest = hashlib.sha1(address.strip().lower().encode('utf-8')).digest()
+        lat = int.from_bytes(digest[:4], 'big') / 2 ** 32 * 140 - 60
+        lng = int.from_bytes(digest[4:8], 'big') / 2 ** 32 * 360 - 180
+        return {'status': 'OK',
+                'results': [MockGeocodingServer.result(address.strip().title(), lat, lng, digest.hex())]}
+
+    @staticmethod
+    def reverse_geocode(latlng: str) -> dict:
+        """
+        Returns a deterministic reverse geocoding response for a coordinate
+        """
+        try:
+            lat, lng = (float(v) for v in latlng.split(','))
+        except ValueError:
+            return {'status': 'INVALID_REQUEST', 'results': []}
+
+        digest = hashlib.sha1(latlng.encode('utf-8')).digest()
+        address = '{} Mock Street'.format(int.from_bytes(digest[:2], 'big') % 1000 + 1)
+        return {'status': 'OK', 'results': [MockGeocodingServer.result(address, lat, lng, digest.hex())]}
+
+    @staticmethod
+    def result(address: str, lat: float, lng: float, place_id: str) -> dict:
+        """
+        Returns a single result in the Google Maps API format
+        """
+        return {
+            'address_components': [
+                {'long_name': address, 'short_name': address, 'types': ['route']},
+                {'long_name': 'Mockville', 'short_name': 'Mockville', 'types': ['locality', 'political']},
+                {'long_name': 'Mockland', 'short_name': 'ML', 'types': ['country', 'political']},
+            ],
+            'formatted_address': '{}, Mockville, Mockland'.format(address),
+            'geometry': {
+                'location': {'lat': lat, 'lng': lng},
+                'location_type': 'ROOFTOP',
+                'viewport': {
+                    'northeast': {'lat': lat + 0.001, 'lng': lng + 0.001},
+                    'southwest': {'lat': lat - 0.001, 'lng': lng - 0.001},
+                }
+            },
+            'place_id': place_id,
+            'types': ['street_address'],
+        }
+
+
+def main():
+    """
+    Runs the mock server from the command line
+    """
+    parser = argparse.ArgumentParser(description='Mock Google Maps Geocoding API server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.0, help='base latency, in seconds')
+    parser.add_argument('--latency-jitter', type=float, default=0.0, help='maximum extra random latency, in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of UNKNOWN_ERROR responses')
+    parser.add_argument('--over-query-limit-rate', type=float, default=0.0,
+                        help='fraction of OVER_QUERY_LIMIT responses')
+    parser.add_argument('--max-qps', type=float, default=0, help='throttle requests above this rate')
+    args = parser.parse_args()
+
+    server = MockGeocodingServer(args.host, args.port, args.latency, args.latency_jitter,
+                                 args.error_rate, args.over_query_limit_rate, args.max_qps)
+    print('Serving mock geocoding API at {}'.format(server.endpoint))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    test_address.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import unittest
+
+from google_maps_geocoder.core.address import canonical_address
+
+
+class TestCanonicalAddress(unittest.TestCase):
+    """
+    Tests for canonical address matching
+    """
+
+    def test_case_and_whitespace(self):
+        self.assertEqual(canonical_address('  10  MAIN\tStreet '), '10 main street')
+
+    def test_punctuation(self):
+        self.assertEqual(canonical_address('10 Main Street, Springfield.'), '10 main street springfield')
+        self.assertEqual(canonical_address('Unit 4/10 Main Street'), 'unit 4 10 main street')
+
+    def test_abbreviations(self):
+        self.assertEqual(canonical_address('10 Main St'), canonical_address('10 Main Street'))
+        self.assertEqual(canonical_address('1 N Ocean Blvd'), '1 north ocean boulevard')
+        # abbreviations are only expanded as whole words
+        self.assertEqual(canonical_address('Stanley Rd'), 'stanley road')
+
+    def test_empty(self):
+        self.assertEqual(canonical_address(''), '')
+        self.assertEqual(canonical_address(' ,. '), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
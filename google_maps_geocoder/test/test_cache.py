@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    test_cache.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from google_maps_geocoder.core.cache import GeocodeCache
+
+DAY = 86400
+
+
+class TestGeocodeCache(unittest.TestCase):
+    """
+    Tests for the persistent result cache
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.now = 1000000.0
+        patcher = mock.patch('time.time', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_cache(self, name: str = 'cache.sqlite', ttl_days: float = 30, max_entries: int = 100) -> GeocodeCache:
+        """
+        Creates a cache in the temporary directory
+        """
+        cache = GeocodeCache(os.path.join(self.directory.name, name), ttl_days, max_entries)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_key(self):
+        self.assertEqual(GeocodeCache.key(' 10  Main Street ', 'AU'), GeocodeCache.key('10 main street', 'au'))
+        self.assertNotEqual(GeocodeCache.key('10 Main Street', 'au'), GeocodeCache.key('10 Main Street', 'nz'))
+        self.assertNotEqual(GeocodeCache.key('10 Main Street', ''), GeocodeCache.key('10 Main Street', '', '1,2,3,4'))
+
+    def test_store_lookup(self):
+        cache = self.create_cache()
+        self.assertIsNone(cache.lookup('a'))
+        cache.store('a', [{'formatted_address': 'A'}])
+        self.assertEqual(cache.lookup('a'), [{'formatted_address': 'A'}])
+        cache.store('a', [])
+        self.assertEqual(cache.lookup('a'), [])
+        self.assertEqual(cache.entry_count(), 1)
+
+        cache.clear()
+        self.assertEqual(cache.entry_count(), 0)
+        self.assertIsNone(cache.lookup('a'))
+
+    def test_persistence(self):
+        cache = self.create_cache()
+        cache.store('a', ['A'])
+        cache.close()
+        self.assertEqual(self.create_cache().lookup('a'), ['A'])
+
+    def test_ttl(self):
+        cache = self.create_cache(ttl_days=2)
+        cache.store('a', ['A'])
+        self.now += DAY
+        cache.store('b', ['B'])
+
+        self.now += 1.5 * DAY
+        self.assertIsNone(cache.lookup('a'))
+        self.assertEqual(cache.lookup('b'), ['B'])
+
+        self.now += DAY
+        cache.prune()
+        self.assertEqual(cache.entry_count(), 0)
+
+    def test_no_ttl(self):
+        cache = self.create_cache(ttl_days=0)
+        cache.store('a', ['A'])
+        self.now += 1000 * DAY
+        cache.prune()
+        self.assertEqual(cache.lookup('a'), ['A'])
+
+    def test_lru_eviction(self):
+        cache = self.create_cache(max_entries=2)
+        cache.store('a', ['A'])
+        self.now += 1
+        cache.store('b', ['B'])
+        self.now += 1
+        # accessing a makes b the least recently used entry
+        self.assertEqual(cache.lookup('a'), ['A'])
+        self.now += 1
+        cache.store('c', ['C'])
+        cache.prune()
+
+        self.assertEqual(cache.entry_count(), 2)
+        self.assertIsNone(cache.lookup('b'))
+        self.assertEqual(cache.lookup('a'), ['A'])
+        self.assertEqual(cache.lookup('c'), ['C'])
+
+    def test_store_many(self):
+        cache = self.create_cache(max_entries=3)
+        self.assertEqual(cache.store_many(('{}'.format(i), [i]) for i in range(5)), 5)
+        # bulk loads are pruned to the maximum size
+        self.assertEqual(cache.entry_count(), 3)
+
+    def test_set_limits(self):
+        cache = self.create_cache(max_entries=10)
+        cache.store_many(('{}'.format(i), [i]) for i in range(5))
+        cache.set_limits(30, 2)
+        self.assertEqual(cache.entry_count(), 2)
+        self.now += 2 * DAY
+        cache.set_limits(1, 2)
+        self.assertEqual(cache.entry_count(), 0)
+
+    def test_export_import(self):
+        cache = self.create_cache(ttl_days=10)
+        cache.store('old', ['old'])
+        self.now += 20 * DAY
+        cache.store('a', ['A'])
+        cache.store('b', ['B'])
+
+        export_path = os.path.join(self.directory.name, 'export.sqlite')
+        # expired entries are not exported
+        self.assertEqual(cache.export(export_path), 2)
+
+        other = self.create_cache('other.sqlite', ttl_days=10)
+        self.now += 1
+        other.store('b', ['newer B'])
+        self.assertEqual(other.import_file(export_path), 1)
+        self.assertEqual(other.lookup('a'), ['A'])
+        # entries newer than the imported entry are kept
+        self.assertEqual(other.lookup('b'), ['newer B'])
+
+        # exporting replaces an existing file
+        self.assertEqual(other.export(export_path), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    test_gazetteer.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from google_maps_geocoder.core.gazetteer import (
+    Gazetteer,
+    GazetteerMatch
+)
+
+ADDRESSES = [
+    ('10 Main Street, Springfield', 151.1, -33.1),
+    ('12 Main Street, Springfield', 151.2, -33.2),
+    ('25 Station Road, Shelbyville', 151.3, -33.3),
+]
+
+
+class TestGazetteer(unittest.TestCase):
+    """
+    Tests for offline gazetteer matching
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, 'gazetteer.sqlite')
+
+    def create_gazetteer(self, min_confidence: float = Gazetteer.DEFAULT_MIN_CONFIDENCE) -> Gazetteer:
+        """
+        Creates a gazetteer containing the test addresses
+        """
+        gazetteer = Gazetteer(self.path, min_confidence)
+        self.addCleanup(gazetteer.close)
+        self.assertEqual(gazetteer.import_addresses(ADDRESSES), len(ADDRESSES))
+        return gazetteer
+
+    def test_exact_match(self):
+        gazetteer = self.create_gazetteer()
+        match = gazetteer.lookup('10 main st springfield')
+        self.assertEqual((match.address, match.x, match.y, match.confidence),
+                         ('10 Main Street, Springfield', 151.1, -33.1, 1.0))
+        self.assertIsNone(gazetteer.lookup('11 Main Street, Springfield'))
+        self.assertIsNone(gazetteer.lookup(''))
+
+    def test_partial_match(self):
+        gazetteer = self.create_gazetteer(min_confidence=0.7)
+        if not gazetteer.full_text:
+            self.skipTest('SQLite was built without FTS5')
+
+        # three of the four address tokens are in the query
+        match = gazetteer.lookup('25 Station Rd')
+        self.assertEqual(match.address, '25 Station Road, Shelbyville')
+        self.assertAlmostEqual(match.confidence, 0.75)
+
+        gazetteer.min_confidence = 0.9
+        self.assertIsNone(gazetteer.lookup('25 Station Rd'))
+        # candidates must contain every token of the query
+        gazetteer.min_confidence = 0.1
+        self.assertIsNone(gazetteer.lookup('25 Station Road Capital City'))
+
+    def test_confidence(self):
+        self.assertEqual(Gazetteer.confidence({'10', 'main', 'street'}, '10 main street'), 1)
+        self.assertAlmostEqual(Gazetteer.confidence({'10', 'main', 'street'}, '12 main street'), 0.5)
+        self.assertEqual(Gazetteer.confidence(set(), ''), 0)
+
+    def test_reimport(self):
+        gazetteer = self.create_gazetteer()
+        # importing replaces the existing addresses
+        self.assertEqual(gazetteer.import_addresses([('1 New Road', 150.0, -34.0), ('', 0, 0)]), 1)
+        self.assertEqual(gazetteer.entry_count(), 1)
+        self.assertIsNone(gazetteer.lookup('10 Main Street, Springfield'))
+        self.assertEqual(gazetteer.lookup('1 new rd').address, '1 New Road')
+
+    def test_canceled_import(self):
+        gazetteer = self.create_gazetteer()
+        feedback = mock.Mock()
+        feedback.isCanceled.return_value = True
+        # a canceled import keeps the previous contents
+        self.assertIsNone(gazetteer.import_addresses([('1 New Road', 150.0, -34.0)], feedback))
+        self.assertEqual(gazetteer.entry_count(), len(ADDRESSES))
+        self.assertEqual(gazetteer.lookup('10 Main Street, Springfield').address, '10 Main Street, Springfield')
+
+    def test_canceled_partial_import(self):
+        gazetteer = self.create_gazetteer(min_confidence=0.7)
+        feedback = mock.Mock()
+        # canceled once the first batch has been inserted
+        feedback.isCanceled.side_effect = [False, True, True, True]
+        with mock.patch.object(Gazetteer, 'IMPORT_BATCH_SIZE', 1):
+            self.assertIsNone(gazetteer.import_addresses([('1 New Road', 150.0, -34.0),
+                                                          ('2 New Road', 150.1, -34.1)], feedback))
+        self.assertEqual(gazetteer.entry_count(), len(ADDRESSES))
+        self.assertIsNone(gazetteer.lookup('1 New Road'))
+        if gazetteer.full_text:
+            self.assertEqual(gazetteer.lookup('25 Station Rd').address, '25 Station Road, Shelbyville')
+
+    def test_rebuild_visible_to_readers(self):
+        reader = self.create_gazetteer()
+        writer = Gazetteer(self.path)
+        writer.import_addresses([('1 New Road', 150.0, -34.0)])
+        writer.close()
+        # an open gazetteer sees a rebuild made through another connection
+        self.assertEqual(reader.lookup('1 New Road').address, '1 New Road')
+
+    def test_match_json(self):
+        result = GazetteerMatch('10 Main Street', 151.1, -33.1, 1.0).to_json()
+        self.assertEqual(result['formatted_address'], '10 Main Street')
+        self.assertEqual(result['geometry']['location'], {'lat': -33.1, 'lng': 151.1})
+        self.assertEqual(result['geometry']['location_type'], GazetteerMatch.LOCATION_TYPE)
+
+
+if __name__ == '__main__':
+    unittest.main()
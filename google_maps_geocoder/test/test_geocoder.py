@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    test_geocoder.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import unittest
+
+from qgis.core import (
+    QgsPointXY,
+    QgsRectangle
+)
+
+from google_maps_geocoder.core.geocoder import (
+    GeocodeResponse,
+    GoogleMapsGeocoder
+)
+
+
+class TestGoogleMapsGeocoder(unittest.TestCase):
+    """
+    Tests for the geocoder's request independent logic
+    """
+
+    def test_tile_bounds(self):
+        bounds = QgsRectangle(151.20, -33.90, 151.23, -33.85)
+        tile = GoogleMapsGeocoder.tile_bounds(bounds)
+        self.assertTrue(tile.contains(bounds))
+        # the tile is the smallest power of two covering the bounds, plus half a tile on each side
+        self.assertAlmostEqual(tile.width(), 2 * 0.0625)
+        self.assertAlmostEqual(tile.height(), 2 * 0.0625)
+
+    def test_tile_bounds_stable(self):
+        bounds = QgsRectangle(151.20, -33.90, 151.23, -33.85)
+        tile = GoogleMapsGeocoder.tile_bounds(bounds)
+        # small movements of the map extent share a tile
+        moved = QgsRectangle(bounds)
+        moved.setXMinimum(bounds.xMinimum() + 0.001)
+        moved.setXMaximum(bounds.xMaximum() + 0.001)
+        self.assertEqual(GoogleMapsGeocoder.tile_bounds(moved), tile)
+        self.assertEqual(GoogleMapsGeocoder.bounds_key(GoogleMapsGeocoder.tile_bounds(moved)),
+                         GoogleMapsGeocoder.bounds_key(tile))
+
+    def test_tile_bounds_contains(self):
+        for bounds in (QgsRectangle(-0.5, 51.2, 0.3, 51.7),
+                       QgsRectangle(-1e-6, -1e-6, 1e-6, 1e-6),
+                       QgsRectangle(-179, -80, 179, 80),
+                       QgsRectangle(10.01, 10.01, 10.99, 10.99)):
+            self.assertTrue(GoogleMapsGeocoder.tile_bounds(bounds).contains(bounds))
+
+    def test_tile_bounds_world(self):
+        tile = GoogleMapsGeocoder.tile_bounds(QgsRectangle(-179, -80, 179, 80))
+        self.assertEqual(tile, QgsRectangle(-180, -90, 180, 90))
+
+    def test_tile_bounds_empty(self):
+        self.assertTrue(GoogleMapsGeocoder.tile_bounds(QgsRectangle()).isEmpty())
+        self.assertEqual(GoogleMapsGeocoder.bounds_key(QgsRectangle()), '')
+
+    def test_latlng(self):
+        self.assertEqual(GoogleMapsGeocoder.latlng(QgsPointXY(151.2093, -33.8688)), '-33.868800,151.209300')
+
+    def test_json_from_attributes(self):
+        result = GoogleMapsGeocoder.json_from_attributes({
+            'location_type': 'ROOFTOP',
+            'formatted_address': '10 Main Street, Springfield',
+            'place_id': 'abc',
+            'locality': 'Springfield',
+            'locality_short': 'Spr',
+            'route': '',
+        }, QgsPointXY(151.2, -33.8))
+        self.assertEqual(result['formatted_address'], '10 Main Street, Springfield')
+        self.assertEqual(result['place_id'], 'abc')
+        self.assertEqual(result['geometry'], {'location': {'lat': -33.8, 'lng': 151.2}, 'location_type': 'ROOFTOP'})
+        self.assertEqual(result['address_components'],
+                         [{'long_name': 'Springfield', 'short_name': 'Spr', 'types': ['locality']}])
+
+    def test_response_status(self):
+        self.assertTrue(GeocodeResponse(GeocodeResponse.OK, [{}]).is_valid())
+        # a request without matches still completed successfully
+        self.assertTrue(GeocodeResponse(GeocodeResponse.ZERO_RESULTS).is_valid())
+        self.assertFalse(GeocodeResponse(GeocodeResponse.OVER_QUERY_LIMIT).is_valid())
+        self.assertTrue(GeocodeResponse(GeocodeResponse.OVER_QUERY_LIMIT).is_transient())
+        self.assertFalse(GeocodeResponse(GeocodeResponse.REQUEST_DENIED).is_transient())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    test_history.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from google_maps_geocoder.core.history import SearchHistory
+
+DAY = 86400
+
+
+class TestSearchHistory(unittest.TestCase):
+    """
+    Tests for the locator search history
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.now = 1000000.0
+        patcher = mock.patch('time.time', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_history(self, max_entries: int = 100) -> SearchHistory:
+        """
+        Creates a history in the temporary directory
+        """
+        history = SearchHistory(os.path.join(self.directory.name, 'history.sqlite'), max_entries)
+        self.addCleanup(history.close)
+        return history
+
+    @staticmethod
+    def record(history: SearchHistory, display: str, times: int = 1):
+        """
+        Records the selection of a result
+        """
+        for _ in range(times):
+            history.record(display, 'description', 'group', {'display': display})
+
+    @staticmethod
+    def displays(history: SearchHistory, query: str):
+        """
+        Returns the display strings of the results matching a query
+        """
+        return [entry.display for entry in history.search(query)]
+
+    def test_prefix_search(self):
+        history = self.create_history()
+        self.record(history, '10 Main Street, Springfield')
+        self.record(history, '25 Station Road, Shelbyville')
+
+        self.assertEqual(self.displays(history, 'main'), ['10 Main Street, Springfield'])
+        self.assertEqual(self.displays(history, 'Spr'), ['10 Main Street, Springfield'])
+        # every word of the query must match the start of a word in the result
+        self.assertEqual(self.displays(history, 'st spr'), ['10 Main Street, Springfield'])
+        self.assertEqual(self.displays(history, 'road spr'), [])
+        self.assertEqual(self.displays(history, 'ain'), [])
+        self.assertEqual(self.displays(history, ''), [])
+
+        entry = history.search('station')[0]
+        self.assertEqual((entry.description, entry.group), ('description', 'group'))
+        self.assertEqual(entry.user_data, {'display': '25 Station Road, Shelbyville'})
+
+    def test_duplicates(self):
+        history = self.create_history()
+        self.record(history, '10 Main Street', 3)
+        self.record(history, '10  MAIN street')
+        self.assertEqual(history.entry_count(), 1)
+        # the most recently selected display string is kept
+        self.assertEqual(self.displays(history, 'main'), ['10  MAIN street'])
+
+    def test_frequency_ranking(self):
+        history = self.create_history()
+        self.record(history, '10 Main Street')
+        self.record(history, '12 Main Street', 3)
+        self.record(history, '14 Main Street', 2)
+        self.assertEqual(self.displays(history, 'main'), ['12 Main Street', '14 Main Street', '10 Main Street'])
+
+    def test_recency_ranking(self):
+        history = self.create_history()
+        self.record(history, '10 Main Street', 2)
+        self.now += 30 * DAY
+        self.record(history, '12 Main Street')
+        # frequently selected results lose their weight over time
+        self.assertEqual(self.displays(history, 'main'), ['12 Main Street', '10 Main Street'])
+
+    def test_limit(self):
+        history = self.create_history()
+        for number in range(SearchHistory.MAX_MATCHES + 5):
+            self.record(history, '{} Main Street'.format(number))
+        self.assertEqual(len(history.search('main')), SearchHistory.MAX_MATCHES)
+        self.assertEqual(len(history.search('main', limit=2)), 2)
+
+    def test_eviction(self):
+        history = self.create_history(max_entries=2)
+        self.record(history, '10 Main Street', 2)
+        self.now += 1
+        self.record(history, '12 Main Street')
+        self.now += 1
+        self.record(history, '14 Main Street', 3)
+
+        # the lowest ranked entry is evicted once the history is full
+        self.assertEqual(history.entry_count(), 2)
+        self.assertEqual(self.displays(history, 'main'), ['14 Main Street', '10 Main Street'])
+        self.assertEqual(self.displays(history, '12'), [])
+
+    def test_clear(self):
+        history = self.create_history()
+        self.record(history, '10 Main Street')
+        history.clear()
+        self.assertEqual(history.entry_count(), 0)
+        self.assertEqual(self.displays(history, 'main'), [])
+
+    def test_without_full_text(self):
+        history = self.create_history()
+        history.full_text = False
+        self.record(history, '10 Main Street, Springfield')
+        self.record(history, '12 Main Street, Springfield', 2)
+        self.record(history, '25 Station Road, Shelbyville')
+        self.assertEqual(self.displays(history, 'main spr'),
+                         ['12 Main Street, Springfield', '10 Main Street, Springfield'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    test_journal.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import os
+import tempfile
+import unittest
+
+from qgis.core import QgsGeometry
+
+from google_maps_geocoder.core.geocoder import (
+    GeocodeResponse,
+    ResultRecord
+)
+from google_maps_geocoder.core.journal import GeocodeJournal
+
+
+class TestGeocodeJournal(unittest.TestCase):
+    """
+    Tests for the batch geocoding checkpoint journal
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, 'journal.sqlite')
+
+    def test_resume(self):
+        journal = GeocodeJournal(self.path)
+        journal.record(1, GeocodeResponse(GeocodeResponse.OK, [{'formatted_address': 'A'}]))
+        journal.record(2, GeocodeResponse(GeocodeResponse.ZERO_RESULTS))
+        journal.close()
+
+        # an interrupted run is resumed from the results recorded by the previous run
+        journal = GeocodeJournal(self.path)
+        self.addCleanup(journal.close)
+        self.assertEqual(journal.count(), 2)
+
+        response = journal.lookup(1)
+        self.assertEqual(response.status, GeocodeResponse.OK)
+        self.assertEqual(response.results, [{'formatted_address': 'A'}])
+        # resumed results don't count as requests made by this run
+        self.assertEqual(response.attempts, 0)
+        self.assertEqual(journal.lookup(2).status, GeocodeResponse.ZERO_RESULTS)
+        self.assertIsNone(journal.lookup(3))
+
+    def test_replace(self):
+        journal = GeocodeJournal(self.path)
+        self.addCleanup(journal.close)
+        journal.record(1, GeocodeResponse(GeocodeResponse.ZERO_RESULTS))
+        journal.record(1, GeocodeResponse(GeocodeResponse.OK, [{'formatted_address': 'A'}]))
+        self.assertEqual(journal.count(), 1)
+        self.assertEqual(journal.lookup(1).status, GeocodeResponse.OK)
+
+    def test_result_record(self):
+        journal = GeocodeJournal(self.path)
+        # values which can't be stored as JSON are restored as null
+        journal.record(1, ResultRecord(['ROOFTOP', 'A', 3, object()], QgsGeometry.fromWkt('Point (151.2 -33.8)')))
+        journal.close()
+
+        journal = GeocodeJournal(self.path)
+        self.addCleanup(journal.close)
+        record = journal.lookup(1)
+        self.assertIsInstance(record, ResultRecord)
+        self.assertEqual(record.attributes, ['ROOFTOP', 'A', 3, None])
+        self.assertTrue(record.geometry.equals(QgsGeometry.fromWkt('Point (151.2 -33.8)')))
+
+    def test_clear(self):
+        journal = GeocodeJournal(self.path)
+        self.addCleanup(journal.close)
+        journal.record(1, GeocodeResponse(GeocodeResponse.ZERO_RESULTS))
+        journal.clear()
+        self.assertEqual(journal.count(), 0)
+
+    def test_remove(self):
+        journal = GeocodeJournal(self.path)
+        journal.record(1, GeocodeResponse(GeocodeResponse.ZERO_RESULTS))
+        journal.flush()
+        journal.remove()
+        self.assertFalse(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(self.path + '-wal'))
+
+    def test_path_for_run(self):
+        path = GeocodeJournal.path_for_run('layer.gpkg', 'address', 'au')
+        self.assertEqual(GeocodeJournal.path_for_run('layer.gpkg', 'address', 'au'), path)
+        self.assertNotEqual(GeocodeJournal.path_for_run('layer.gpkg', 'address', 'nz'), path)
+        self.assertNotEqual(GeocodeJournal.path_for_run('layer.gpkg', 'addr', 'essau'), path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    test_rate_limiter.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import unittest
+from unittest import mock
+
+from google_maps_geocoder.core.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """
+    Monotonic clock which only advances when told to
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds: float):
+        """
+        Advances the clock
+        """
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    """
+    Tests for the shared request rate limiter
+    """
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch('time.monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def grants(self, limiter: RateLimiter, priority: int, attempts: int = 100) -> int:
+        """
+        Returns the number of requests granted immediately, out of a number
+        of attempts
+        """
+        return sum(1 for _ in range(attempts) if limiter.try_acquire(priority) == 0)
+
+    def test_unlimited(self):
+        limiter = RateLimiter(max_rate=0)
+        self.assertEqual(self.grants(limiter, RateLimiter.PRIORITY_BATCH), 100)
+        self.assertEqual(self.grants(limiter, RateLimiter.PRIORITY_INTERACTIVE), 100)
+        self.assertTrue(limiter.acquire())
+
+    def test_rate(self):
+        limiter = RateLimiter(max_rate=10, interactive_share=0)
+        self.clock.advance(5)
+        # bursts are limited to one second's worth of requests
+        self.assertEqual(self.grants(limiter, RateLimiter.PRIORITY_BATCH), 10)
+        self.assertAlmostEqual(limiter.try_acquire(), 0.1)
+
+        self.clock.advance(0.5)
+        self.assertEqual(self.grants(limiter, RateLimiter.PRIORITY_BATCH), 5)
+
+    def test_interactive_share(self):
+        limiter = RateLimiter(max_rate=10, interactive_share=0.2)
+        self.clock.advance(1)
+        # batch requests may not use the share reserved for interactive requests
+        self.assertEqual(self.grants(limiter, RateLimiter.PRIORITY_BATCH), 8)
+        self.assertEqual(self.grants(limiter, RateLimiter.PRIORITY_INTERACTIVE), 2)
+
+        self.clock.advance(1)
+        # interactive requests may use the whole rate
+        self.assertEqual(self.grants(limiter, RateLimiter.PRIORITY_INTERACTIVE), 10)
+        self.assertEqual(self.grants(limiter, RateLimiter.PRIORITY_BATCH), 0)
+
+    def test_interactive_share_limits(self):
+        limiter = RateLimiter(max_rate=10, interactive_share=2)
+        self.assertEqual(limiter.interactive_share, RateLimiter.MAX_INTERACTIVE_SHARE)
+        limiter.set_interactive_share(-1)
+        self.assertEqual(limiter.interactive_share, 0)
+
+    def test_backoff_delay(self):
+        limiter = RateLimiter()
+        with mock.patch('random.uniform', side_effect=lambda low, high: high):
+            self.assertEqual(limiter.backoff_delay(0), RateLimiter.BASE_DELAY)
+            self.assertEqual(limiter.backoff_delay(3), RateLimiter.BASE_DELAY * 8)
+            self.assertEqual(limiter.backoff_delay(20), RateLimiter.MAX_DELAY)
+
+        for attempt in range(10):
+            delay = limiter.backoff_delay(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(RateLimiter.MAX_DELAY, RateLimiter.BASE_DELAY * 2 ** attempt))
+
+    def test_throttled(self):
+        limiter = RateLimiter(max_rate=10, interactive_share=0)
+        with mock.patch('random.uniform', side_effect=lambda low, high: high):
+            delay = limiter.throttled(1)
+        self.assertEqual(delay, 1)
+        self.assertEqual(limiter.rate, 5)
+
+        # all requests are paused for the backoff delay
+        self.assertAlmostEqual(limiter.try_acquire(RateLimiter.PRIORITY_INTERACTIVE), 1)
+        self.clock.advance(0.5)
+        self.assertAlmostEqual(limiter.try_acquire(RateLimiter.PRIORITY_BATCH), 0.5)
+
+        # and then resume at the reduced rate
+        self.clock.advance(1.5)
+        self.assertEqual(self.grants(limiter, RateLimiter.PRIORITY_BATCH), 5)
+
+    def test_throttled_minimum_rate(self):
+        limiter = RateLimiter(max_rate=4)
+        for attempt in range(10):
+            limiter.throttled(attempt)
+        self.assertEqual(limiter.rate, RateLimiter.MIN_RATE)
+
+    def test_recovery(self):
+        limiter = RateLimiter(max_rate=10)
+        limiter.throttled(0)
+        self.assertEqual(limiter.rate, 5)
+        limiter.succeeded()
+        self.assertAlmostEqual(limiter.rate, 5.5)
+        for _ in range(20):
+            limiter.succeeded()
+        self.assertEqual(limiter.rate, 10)
+
+    def test_set_max_rate(self):
+        limiter = RateLimiter(max_rate=10)
+        limiter.throttled(0)
+        limiter.set_max_rate(20)
+        self.assertEqual(limiter.max_rate, 20)
+        self.assertEqual(limiter.rate, 20)
+
+    def test_sleep_canceled(self):
+        feedback = mock.Mock()
+        feedback.isCanceled.return_value = True
+        self.assertFalse(RateLimiter.sleep(10, feedback))
+        self.assertTrue(RateLimiter.sleep(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    test_sharding.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import os
+import tempfile
+import unittest
+
+from google_maps_geocoder.processing.sharding import (
+    parse_range,
+    read_feature_ids,
+    split_feature_ids,
+    write_feature_ids
+)
+
+
+class TestSharding(unittest.TestCase):
+    """
+    Tests for splitting batch geocoding runs between worker processes
+    """
+
+    def test_split_feature_ids(self):
+        shards = split_feature_ids(list(range(10)), 3)
+        self.assertEqual(shards, [[0, 1, 2], [3, 4, 5], [6, 7, 8, 9]])
+
+    def test_split_sparse_feature_ids(self):
+        # shards are balanced by feature count, not by feature ID range
+        feature_ids = [1, 2, 3, 1000, 1001, 5000000]
+        shards = split_feature_ids(feature_ids, 2)
+        self.assertEqual(shards, [[1, 2, 3], [1000, 1001, 5000000]])
+
+    def test_split_covers_all_features(self):
+        feature_ids = list(range(0, 1000, 7))
+        for shard_count in (1, 2, 3, 7, 64):
+            shards = split_feature_ids(feature_ids, shard_count)
+            self.assertEqual(len(shards), shard_count)
+            self.assertEqual([fid for shard in shards for fid in shard], feature_ids)
+            sizes = [len(shard) for shard in shards]
+            self.assertLessEqual(max(sizes) - min(sizes), 1)
+
+    def test_split_more_shards_than_features(self):
+        self.assertEqual(split_feature_ids([5, 6], 4), [[5], [6]])
+        self.assertEqual(split_feature_ids([5, 6], 0), [[5, 6]])
+        self.assertEqual(split_feature_ids([], 4), [])
+
+    def test_feature_id_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'shard_0_fids.json')
+            write_feature_ids(path, [3, 1, 4])
+            self.assertEqual(read_feature_ids(path), [3, 1, 4])
+        self.assertIsNone(read_feature_ids(''))
+
+    def test_parse_range(self):
+        self.assertEqual(parse_range('10:20'), (10, 20))
+        self.assertEqual(parse_range('-5:3'), (-5, 3))
+        self.assertIsNone(parse_range(''))
+        self.assertIsNone(parse_range(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+"""
+***************************************************************************
+    test_snap_grid.py
+    ---------------------
+    Date                 : October 2026
+    Copyright            : (C) 2026 by North Road
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import unittest
+
+from google_maps_geocoder.core.snap_grid import SnapGridCache
+
+
+class TestSnapGridCache(unittest.TestCase):
+    """
+    Tests for the reverse geocoding grid cache
+    """
+
+    def test_cell(self):
+        grid = SnapGridCache(100)
+        cell = grid.cell(151.2093, -33.8688)
+        x, y = grid.centre(cell)
+        # points within the cell share it, points in neighbouring cells don't
+        self.assertEqual(grid.cell(x + 0.0001, y - 0.0001), cell)
+        self.assertNotEqual(grid.cell(x + 0.001, y), cell)
+        self.assertNotEqual(grid.cell(x, y - 0.001), cell)
+
+    def test_centre(self):
+        grid = SnapGridCache(100)
+        for x, y in ((151.2093, -33.8688), (-0.1276, 51.5072), (0, 0), (-179.5, -60)):
+            cell = grid.cell(x, y)
+            centre_x, centre_y = grid.centre(cell)
+            self.assertEqual(grid.cell(centre_x, centre_y), cell)
+            self.assertLess(abs(centre_y - y), grid.cell_degrees)
+
+    def test_centre_range(self):
+        for cell_size in (25, 1000, 50000, 500000):
+            grid = SnapGridCache(cell_size)
+            for x, y in ((179.999, 0), (-179.999, 0), (179.999, 89.999), (-179.999, -89.999), (180, 90),
+                         (-180, -90), (0, 89.9999)):
+                centre_x, centre_y = grid.centre(grid.cell(x, y))
+                self.assertGreaterEqual(centre_x, -180)
+                self.assertLessEqual(centre_x, 180)
+                self.assertGreaterEqual(centre_y, -90)
+                self.assertLessEqual(centre_y, 90)
+
+    def test_square_cells(self):
+        grid = SnapGridCache(1000)
+        # cells widen in degrees towards the poles, to remain approximately square
+        equator = grid.column_degrees(grid.cell(0, 0)[0])
+        north = grid.column_degrees(grid.cell(0, 60)[0])
+        self.assertAlmostEqual(equator, grid.cell_degrees, places=6)
+        self.assertAlmostEqual(north / equator, 2, places=2)
+
+    def test_exact_points(self):
+        grid = SnapGridCache(0)
+        cell = grid.cell(151.2093, -33.8688)
+        self.assertEqual(grid.centre(cell), (151.2093, -33.8688))
+        self.assertNotEqual(grid.cell(151.20931, -33.8688), cell)
+
+    def test_get_put(self):
+        grid = SnapGridCache(100)
+        cell = grid.cell(151.2093, -33.8688)
+        self.assertIsNone(grid.get(cell))
+        grid.put(cell, 'response')
+        self.assertEqual(grid.get(cell), 'response')
+        self.assertEqual((grid.hits, grid.misses), (1, 1))
+        self.assertEqual(len(grid), 1)
+
+    def test_lru_eviction(self):
+        grid = SnapGridCache(100, max_cells=2)
+        grid.put((0, 0), 'a')
+        grid.put((0, 1), 'b')
+        # accessing a makes b the least recently used cell
+        grid.get((0, 0))
+        grid.put((0, 2), 'c')
+        self.assertEqual(len(grid), 2)
+        self.assertIsNone(grid.get((0, 1)))
+        self.assertEqual(grid.get((0, 0)), 'a')
+        self.assertEqual(grid.get((0, 2)), 'c')
+
+    def test_discard(self):
+        grid = SnapGridCache(100)
+        grid.put((0, 0), 'a')
+        # a cell is only discarded if it still holds the value
+        grid.discard((0, 0), 'b')
+        self.assertEqual(grid.get((0, 0)), 'a')
+        grid.discard((0, 0), 'a')
+        self.assertIsNone(grid.get((0, 0)))
+        grid.discard((0, 0), 'a')
+
+
+if __name__ == '__main__':
+    unittest.main()